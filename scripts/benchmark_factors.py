@@ -0,0 +1,164 @@
+"""
+Benchmark factor computations on synthetic CRSP panels.
+
+Each (function, size) case runs in a fresh worker process so that peak RSS is
+measured per case. Results are written to JSON so runs can be compared across
+commits, e.g.::
+
+    python scripts/benchmark_factors.py --sizes 1000x240 5000x600
+    python scripts/benchmark_factors.py --compare artifacts/benchmarks/factors_<sha>.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import resource
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+import numpy as np  # noqa: E402
+import pandas as pd  # noqa: E402
+
+from factors.momentum import calculate_12_1_momentum, calculate_momentum_grid  # noqa: E402
+from factors.panel import ReturnPanel  # noqa: E402
+from factors.parallel import parallel_momentum  # noqa: E402
+from factors.synthetic import synthetic_crsp_panel  # noqa: E402
+
+BENCHMARKS = {
+    "calculate_12_1_momentum": calculate_12_1_momentum,
+    "calculate_momentum_grid": calculate_momentum_grid,
+    "calculate_12_1_momentum[ReturnPanel]": lambda panel: calculate_12_1_momentum(
+        ReturnPanel.from_frame(panel)
+    ),
+    "parallel_momentum": parallel_momentum,
+}
+
+
+def _max_rss_mb(who: int = resource.RUSAGE_SELF) -> float:
+    # ru_maxrss is reported in KiB on Linux and bytes on macOS.
+    scale = 1 if sys.platform == "darwin" else 1024
+    return resource.getrusage(who).ru_maxrss * scale / 2**20
+
+
+def run_case(name: str, n_permnos: int, n_months: int, repeats: int, seed: int) -> dict:
+    """Time one benchmark on one panel size; meant to run in its own process."""
+    panel = synthetic_crsp_panel(n_permnos=n_permnos, n_months=n_months, seed=seed)
+    rss_before = _max_rss_mb()
+
+    timings = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        BENCHMARKS[name](panel)
+        timings.append(time.perf_counter() - started)
+
+    best = min(timings)
+    return {
+        "function": name,
+        "n_permnos": n_permnos,
+        "n_months": n_months,
+        "rows": len(panel),
+        "seconds": best,
+        "seconds_all": timings,
+        "rss_before_mb": rss_before,
+        "peak_rss_mb": _max_rss_mb(),
+        # Largest worker spawned by the function itself (e.g. parallel_momentum's pool).
+        "peak_rss_children_mb": _max_rss_mb(resource.RUSAGE_CHILDREN),
+        "stock_months_per_sec": len(panel) / best if best > 0 else None,
+    }
+
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=PROJECT_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _parse_size(text: str) -> tuple[int, int]:
+    permnos, months = text.lower().split("x")
+    return int(permnos), int(months)
+
+
+def compare(current: dict, baseline: dict, threshold: float) -> list[str]:
+    """Return human-readable lines for cases that slowed down by more than ``threshold``."""
+    previous = {
+        (c["function"], c["n_permnos"], c["n_months"]): c["seconds"] for c in baseline["cases"]
+    }
+    regressions = []
+    for case in current["cases"]:
+        key = (case["function"], case["n_permnos"], case["n_months"])
+        before = previous.get(key)
+        if before and case["seconds"] > before * (1 + threshold):
+            regressions.append(
+                f"{key[0]} {key[1]}x{key[2]}: {before:.3f}s -> {case['seconds']:.3f}s "
+                f"({case['seconds'] / before:.2f}x)"
+            )
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", nargs="+", default=["500x120", "2000x360", "5000x600"])
+    parser.add_argument("--functions", nargs="+", choices=sorted(BENCHMARKS), default=None)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, default=None)
+    parser.add_argument("--compare", type=Path, default=None, help="Baseline JSON to diff against.")
+    parser.add_argument("--threshold", type=float, default=0.10)
+    args = parser.parse_args(argv)
+
+    commit = _git_commit()
+    cases = []
+    for size in args.sizes:
+        n_permnos, n_months = _parse_size(size)
+        for name in args.functions or BENCHMARKS:
+            with ProcessPoolExecutor(max_workers=1) as pool:
+                case = pool.submit(
+                    run_case, name, n_permnos, n_months, args.repeats, args.seed
+                ).result()
+            cases.append(case)
+            print(
+                f"{name:<40} {size:>10} {case['seconds']:8.3f}s "
+                f"{case['stock_months_per_sec']:>14,.0f} rows/s {case['peak_rss_mb']:8.1f} MB"
+            )
+
+    report = {
+        "commit": commit,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "machine": platform.machine(),
+        "cases": cases,
+    }
+    output = args.output or PROJECT_ROOT / "artifacts" / "benchmarks" / f"factors_{commit}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    print(f"Benchmark results written to {output}")
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        regressions = compare(report, baseline, args.threshold)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
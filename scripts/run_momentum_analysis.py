@@ -4,7 +4,8 @@ from datetime import datetime
 
 # Import the logger from the logging module
 from src.assistant.utils.logging import logger, setup_logger
-from src.assistant.fetchers.wrds_crsp import fetch_crsp_monthly_returns
+from src.assistant.fetchers.wrds_crsp import fetch_crsp_data
+from src.factors.cache import FactorCache
 from src.factors.momentum import calculate_12_1_momentum
 
 # Ensure logger is set up
@@ -16,7 +17,9 @@ def run_analysis():
     Run the full momentum factor analysis using WRDS.
 
     This script fetches CRSP monthly returns for a list of PERMNOs, calculates
-    the 12-1 momentum factor, and saves the results to a CSV file.
+    the 12-1 momentum factor, and saves the results to a CSV file. Results are
+    cached by input content and parameters, so re-running on unchanged data
+    neither recomputes the factor nor rewrites an existing CSV.
     """
     # Define a list of PERMNOs to analyze (sample tech stocks for now)
     permnos = [10107, 12490, 14593, 11850]  # Example PERMNOs
@@ -28,20 +31,37 @@ def run_analysis():
         # Fetch CRSP monthly returns for the last 5 years
         start_date = (datetime.now() - pd.DateOffset(years=5)).strftime("%Y-%m-%d")
         end_date = datetime.now().strftime("%Y-%m-%d")
-        crsp_data = fetch_crsp_monthly_returns(permnos, start_date=start_date, end_date=end_date)
+        crsp_data = fetch_crsp_data(permnos, start_date=start_date, end_date=end_date)
 
         # Convert the data into a pandas DataFrame
         crsp_df = pd.DataFrame(crsp_data)
 
-        # Calculate the 12-1 momentum factor
-        momentum_df = calculate_12_1_momentum(crsp_df)
+        # Calculate the 12-1 momentum factor, reusing a cached result for identical inputs
+        cache = FactorCache()
+        params = {
+            "factor": "calculate_12_1_momentum",
+            "date_col": "date",
+            "permno_col": "permno",
+            "ret_col": "ret",
+            "lookback": 12,
+            "skip": 1,
+        }
+        columns = ["date", "permno", "ret"]
+        cache_key = cache.key(crsp_df, params, columns)
+        cache_hit = cache_key in cache
+        momentum_df = cache.get_or_compute(
+            crsp_df, params, lambda: calculate_12_1_momentum(crsp_df), columns, key=cache_key
+        )
 
         # Create the artifacts directory if it doesn't exist
         artifacts_dir = Path("artifacts")
         artifacts_dir.mkdir(parents=True, exist_ok=True)
 
-        # Save the results to a CSV file
+        # Save the results to a CSV file (unchanged inputs leave an existing file untouched)
         output_file = artifacts_dir / f"momentum_{datetime.now().strftime('%Y-%m-%d')}.csv"
+        if cache_hit and output_file.exists():
+            logger.info(f"Inputs unchanged; keeping existing results at {output_file}")
+            return
         momentum_df.to_csv(output_file, index=False)
 
         # Log a success message
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import asyncio
 import os
+from collections.abc import Awaitable
 from datetime import date
 from html import escape
 
@@ -53,6 +54,41 @@ def _markdown_to_html(markdown_text: str) -> str:
     return markdown.markdown(markdown_text, extensions=["tables", "fenced_code"])
 
 
+async def _gather_with_deadline(
+    fetches: dict[str, Awaitable[object]], deadline: float | None
+) -> tuple[dict[str, object], list[str]]:
+    """
+    Run named fetches concurrently, giving up on whatever is unfinished at ``deadline``.
+
+    Returns each fetch's result (or exception, as ``gather(return_exceptions=True)``
+    would) and the names of fetches that missed the deadline; those are cancelled and
+    reported as ``asyncio.TimeoutError`` so ``unwrap_result`` applies their fallbacks.
+    """
+    tasks = {name: asyncio.ensure_future(fetch) for name, fetch in fetches.items()}
+    _, pending = await asyncio.wait(tasks.values(), timeout=deadline)
+    for task in pending:
+        task.cancel()
+    await asyncio.gather(*pending, return_exceptions=True)
+
+    results: dict[str, object] = {}
+    missed: list[str] = []
+    for name, task in tasks.items():
+        if task in pending:
+            missed.append(name)
+            results[name] = asyncio.TimeoutError(f"missed the {deadline}s digest deadline")
+        elif task.cancelled():
+            results[name] = asyncio.CancelledError()
+        else:
+            results[name] = task.exception() or task.result()
+    if missed:
+        logger.warning(
+            "Digest deadline of {deadline}s expired; continuing without: {sources}",
+            deadline=deadline,
+            sources=", ".join(missed),
+        )
+    return results, missed
+
+
 async def main():
     """Asynchronously fetches, analyzes, and sends the daily quant digest."""
     logger.info("Starting daily quant digest generation...")
@@ -65,24 +101,28 @@ async def main():
         async with AsyncHttpClient() as client:
             # --- Concurrent Data Fetching ---
             logger.info("Fetching all data sources concurrently...")
-            benchmark_symbols = settings.digest.benchmarks or ["SPY", "QQQ"]
-            quote_tasks = [global_quote_async(client, symbol) for symbol in benchmark_symbols]
-            tasks = [
-                latest_vix_close(client),
-                upcoming_cpi_releases(client),
-                latest_arxiv_qfin_async(client),
-                search_papers_async(client, "quantitative finance"),
-                *quote_tasks,
-            ]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+            # Fetches are keyed by name, so a symbol listed twice is fetched once.
+            benchmark_symbols = list(dict.fromkeys(settings.digest.benchmarks or ["SPY", "QQQ"]))
+            fetches = {
+                "VIX": latest_vix_close(client),
+                "CPI Schedule": upcoming_cpi_releases(client),
+                "arXiv": latest_arxiv_qfin_async(client),
+                "Semantic Scholar": search_papers_async(client, "quantitative finance"),
+                **{
+                    f"Quote {symbol}": global_quote_async(client, symbol)
+                    for symbol in benchmark_symbols
+                },
+            }
+            results, missed = await _gather_with_deadline(fetches, settings.digest.deadline_seconds)
 
             # --- Process Fetcher Results ---
-            vix_res, cpi_res, arxiv_res, s2_res, *quote_results = results
-
-            vix = unwrap_result(vix_res, VixClose, lambda: VixClose(date=today, close=0.0), "VIX")
-            cpi = unwrap_result(cpi_res, list, list, "CPI Schedule")
-            arxiv = unwrap_result(arxiv_res, list, list, "arXiv")
-            s2 = unwrap_result(s2_res, list, list, "Semantic Scholar")
+            vix = unwrap_result(
+                results["VIX"], VixClose, lambda: VixClose(date=today, close=0.0), "VIX"
+            )
+            cpi = unwrap_result(results["CPI Schedule"], list, list, "CPI Schedule")
+            arxiv = unwrap_result(results["arXiv"], list, list, "arXiv")
+            s2 = unwrap_result(results["Semantic Scholar"], list, list, "Semantic Scholar")
+            quote_results = [results[f"Quote {symbol}"] for symbol in benchmark_symbols]
 
             quotes: list[PriceSnapshot] = []
             for symbol, result in zip(benchmark_symbols, quote_results):
@@ -110,6 +150,7 @@ async def main():
                 cpi=cpi,
                 arxiv=arxiv,
                 s2=s2,
+                missed_sources=missed,
                 # Add other data fields here as they are implemented
             )
 
@@ -40,6 +40,40 @@ class AnalyzerSettings(BaseModel):
 
 class DigestSettings(BaseModel):
     benchmarks: list[str] = Field(default_factory=lambda: ["SPY", "QQQ"])
+    deadline_seconds: Optional[float] = None  # end-to-end fetch budget; unlimited if unset
+
+
+class RateLimitSettings(BaseModel):
+    calls: int  # requests allowed per period
+    period: float  # seconds
+    burst: Optional[int] = None  # bucket size; defaults to calls
+
+
+class HedgeSettings(BaseModel):
+    percentile: float = 95.0  # hedge once a request is slower than this latency percentile
+    min_samples: int = 20  # observations needed before the percentile is trusted
+    initial_delay: float = 2.0  # seconds to wait before hedging until then
+
+
+class HttpSettings(BaseModel):
+    """Connection pool settings for the shared ``AsyncHttpClient`` connector."""
+
+    limit: int = 100  # total simultaneous connections
+    limit_per_host: int = 8
+    keepalive_timeout: float = 30.0  # seconds an idle connection stays open
+    ttl_dns_cache: int = 300  # seconds a resolved address is reused
+    cache_dir: Optional[str] = None  # on-disk HTTP cache; disabled when unset
+    cache_max_bytes: int = 256 << 20
+    cache_default_ttl: float = 0.0  # 0 = always revalidate
+    cache_ttls: Dict[str, float] = Field(default_factory=dict)  # "host[/path]" -> seconds
+    rate_limits: Dict[str, RateLimitSettings] = Field(default_factory=dict)  # keyed by host
+    breaker_failure_threshold: int = 3  # consecutive failures that open a host's circuit
+    breaker_reset_timeout: float = 300.0  # seconds before an open circuit is probed
+    breaker_state_path: Optional[str] = None  # JSON file persisting circuits between runs
+    hedging: Dict[str, HedgeSettings] = Field(default_factory=dict)  # "host[/path]" opt-ins
+    hedge_budget: int = 0  # hedged requests allowed per client (i.e. per run)
+    hedge_state_path: Optional[str] = None  # JSON file persisting hedge latencies between runs
+    metrics_path: Optional[str] = None  # JSON file the client's request metrics go to on close
 
 
 # --- Custom YAML Source Function ---
@@ -83,6 +117,7 @@ class Settings(BaseSettings):
     fetcher_settings: FetcherSettings
     analyzer_settings: AnalyzerSettings
     digest: DigestSettings = Field(default_factory=DigestSettings)
+    http: HttpSettings = Field(default_factory=HttpSettings)
 
     model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8")
 
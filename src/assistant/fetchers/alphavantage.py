@@ -118,6 +118,9 @@ async def global_quote_async(client: AsyncHttpClient, symbol: str) -> Optional[P
     try:
         response = await client.get(ALPHAVANTAGE_URL, params=params)
         data = await response.json()
+        if isinstance(data, dict) and data.get("Note"):
+            # Throttling arrives as HTTP 200; hold back the remaining symbols.
+            client.report_throttled(ALPHAVANTAGE_URL)
     except ClientResponseError as exc:
         safe_url = exc.request_info.url.with_query({}) if exc.request_info else "unknown"
         body = ""
@@ -0,0 +1,261 @@
+"""Local year-partitioned Parquet mirror of CRSP monthly returns."""
+
+from __future__ import annotations
+
+import json
+import os
+from datetime import date
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from assistant.fetchers.wrds_crsp import _msf_query
+from assistant.fetchers.wrds_pool import WrdsConnectionPool, get_default_pool
+from assistant.utils.logging import logger
+
+DEFAULT_MIRROR_DIR = Path("data") / "crsp_mirror"
+CRSP_FIRST_MONTH = "1925-12-01"
+
+Interval = Tuple[int, int]  # inclusive month ordinals (months since 1970-01)
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow as pa  # type: ignore
+        import pyarrow.dataset as ds  # type: ignore
+        import pyarrow.fs as pafs  # type: ignore
+        import pyarrow.parquet as pq  # type: ignore
+    except ImportError as exc:  # pragma: no cover - depends on the environment
+        raise ImportError(
+            "The CRSP mirror requires the 'pyarrow' package (pip install pyarrow)."
+        ) from exc
+    return pa, ds, pafs, pq
+
+
+def _month_ordinal(value: str | date | pd.Timestamp) -> int:
+    return int(np.datetime64(pd.Timestamp(value).to_period("M").start_time, "M").astype(np.int64))
+
+
+def _month_bounds(interval: Interval) -> Tuple[str, str]:
+    """First and last calendar day of an inclusive month interval, as YYYY-MM-DD."""
+    first = np.datetime64(interval[0], "M").astype("datetime64[D]")
+    last = (np.datetime64(interval[1] + 1, "M").astype("datetime64[D]")) - np.timedelta64(1, "D")
+    return str(first), str(last)
+
+
+def _merge_intervals(intervals: Iterable[Interval]) -> List[Interval]:
+    merged: List[Interval] = []
+    for lo, hi in sorted(intervals):
+        if merged and lo <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], hi))
+        else:
+            merged.append((lo, hi))
+    return merged
+
+
+def _subtract(interval: Interval, covered: List[Interval]) -> List[Interval]:
+    """Parts of ``interval`` not inside any of the sorted, merged ``covered`` intervals."""
+    gaps: List[Interval] = []
+    cursor, end = interval
+    for lo, hi in covered:
+        if hi < cursor:
+            continue
+        if lo > end:
+            break
+        if lo > cursor:
+            gaps.append((cursor, lo - 1))
+        cursor = max(cursor, hi + 1)
+        if cursor > end:
+            break
+    if cursor <= end:
+        gaps.append((cursor, end))
+    return gaps
+
+
+class CrspMirror:
+    """
+    Read-through local mirror of ``crsp.msf`` stored as year-partitioned Parquet.
+
+    A JSON manifest records, per PERMNO, which whole months the mirror already
+    holds. :meth:`fetch` asks WRDS only for the missing months (PERMNOs sharing the
+    same gap are queried together), appends the new rows under ``year=YYYY/`` and
+    serves the request from memory-mapped Parquet.
+
+    Args:
+        root (str | Path): Mirror directory.
+        pool (WrdsConnectionPool | None): Pool to borrow WRDS connections from; defaults to
+            the shared process-wide pool.
+        table (str): Source table.
+    """
+
+    MANIFEST = "coverage.json"
+
+    def __init__(
+        self,
+        root: str | Path = DEFAULT_MIRROR_DIR,
+        pool: Optional[WrdsConnectionPool] = None,
+        table: str = "crsp.msf",
+    ) -> None:
+        self.root = Path(root)
+        self.pool = pool or get_default_pool()
+        self.table = table
+        self._coverage = self._load_manifest()
+
+    # --- Coverage bookkeeping ---
+
+    def _load_manifest(self) -> Dict[int, List[Interval]]:
+        path = self.root / self.MANIFEST
+        if not path.is_file():
+            return {}
+        with open(path, "r", encoding="utf-8") as f:
+            raw = json.load(f)
+        if raw.get("table") != self.table:
+            raise ValueError(f"Mirror at {self.root} holds {raw.get('table')}, not {self.table}.")
+        return {int(p): [tuple(i) for i in spans] for p, spans in raw["coverage"].items()}
+
+    def _save_manifest(self) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        path = self.root / self.MANIFEST
+        tmp = path.with_suffix(".json.tmp")
+        payload = {
+            "table": self.table,
+            "coverage": {str(p): [list(i) for i in spans] for p, spans in self._coverage.items()},
+        }
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(payload, f)
+        os.replace(tmp, path)
+
+    def coverage(self, permno: int) -> List[Tuple[str, str]]:
+        """Date ranges held locally for ``permno``."""
+        return [_month_bounds(i) for i in self._coverage.get(int(permno), [])]
+
+    def missing(
+        self, permnos: List[int], start_date: str, end_date: str
+    ) -> Dict[Interval, List[int]]:
+        """Month intervals that still need downloading, mapped to the PERMNOs lacking them."""
+        wanted = (_month_ordinal(start_date), _month_ordinal(end_date))
+        gaps: Dict[Interval, List[int]] = {}
+        for permno in sorted({int(p) for p in permnos}):
+            for gap in _subtract(wanted, self._coverage.get(permno, [])):
+                gaps.setdefault(gap, []).append(permno)
+        return gaps
+
+    # --- Sync and read ---
+
+    def _latest_published(self, conn) -> Optional[int]:
+        """Month ordinal of the newest row in the source table, or None if it is empty."""
+        df = conn.raw_sql(f"SELECT MAX(date) AS date FROM {self.table}")
+        if df is None or df.empty or pd.isna(df["date"].iloc[0]):
+            return None
+        return _month_ordinal(df["date"].iloc[0])
+
+    def sync(self, permnos: List[int], start_date: str, end_date: str) -> int:
+        """Download whatever the mirror lacks for the request; returns rows added."""
+        gaps = self.missing(permnos, start_date, end_date)
+        if not gaps:
+            return 0
+        pa, _, _, pq = _require_pyarrow()
+
+        added = 0
+        published: Optional[int] = None
+        published_known = False
+        with self.pool.connection() as conn:
+            for interval, gap_permnos in sorted(gaps.items()):
+                first, last = _month_bounds(interval)
+                sql_query, params = _msf_query(gap_permnos, first, last, table=self.table)
+                df = conn.raw_sql(sql_query, params=params)
+                through: Optional[int] = None
+                if df is not None and not df.empty:
+                    frame = pd.DataFrame(
+                        {
+                            "permno": pd.to_numeric(df["permno"]).astype("int64"),
+                            "date": pd.to_datetime(df["date"]).astype("datetime64[ns]"),
+                            "ret": pd.to_numeric(df["ret"], errors="coerce").astype("float64"),
+                        }
+                    )
+                    frame["year"] = frame["date"].dt.year.astype("int32")
+                    pq.write_to_dataset(
+                        pa.Table.from_pandas(frame, preserve_index=False),
+                        str(self.root),
+                        partition_cols=["year"],
+                    )
+                    added += len(frame)
+                    through = _month_ordinal(frame["date"].max())
+
+                # Months up to the newest one published in the table are settled even
+                # if they hold no rows (delisted or not-yet-listed PERMNOs); later
+                # months are requested again next time.
+                if through is None or through < interval[1]:
+                    if not published_known:
+                        published = self._latest_published(conn)
+                        published_known = True
+                    if published is not None:
+                        through = published if through is None else max(through, published)
+                if through is None or through < interval[0]:
+                    continue
+                covered = (interval[0], min(interval[1], through))
+                for permno in gap_permnos:
+                    spans = self._coverage.get(permno, []) + [covered]
+                    self._coverage[permno] = _merge_intervals(spans)
+                # Persist after every batch so an interrupted sync keeps its progress.
+                self._save_manifest()
+
+        logger.info(
+            "CRSP mirror synced {rows} rows across {gaps} gap(s)", rows=added, gaps=len(gaps)
+        )
+        return added
+
+    def read(self, permnos: List[int], start_date: str, end_date: str) -> pd.DataFrame:
+        """Serve ``permno, date, ret`` rows from the local mirror only."""
+        columns = ["permno", "date", "ret"]
+        if not any(self.root.glob("year=*")):
+            return pd.DataFrame(columns=columns)
+        pa, ds, pafs, _ = _require_pyarrow()
+
+        start, end = pd.Timestamp(start_date), pd.Timestamp(end_date)
+        dataset = ds.dataset(
+            str(self.root),
+            format="parquet",
+            partitioning="hive",
+            filesystem=pafs.LocalFileSystem(use_mmap=True),
+            exclude_invalid_files=True,
+        )
+        expression = (
+            (ds.field("year") >= start.year)
+            & (ds.field("year") <= end.year)
+            & ds.field("permno").isin(pa.array([int(p) for p in permnos], type=pa.int64()))
+            & (ds.field("date") >= pa.scalar(start, type=pa.timestamp("ns")))
+            & (ds.field("date") <= pa.scalar(end, type=pa.timestamp("ns")))
+        )
+        df = dataset.to_table(columns=columns, filter=expression).to_pandas()
+        return df.sort_values(["permno", "date"], kind="mergesort").reset_index(drop=True)
+
+    def fetch(
+        self,
+        permnos: List[int],
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+    ) -> pd.DataFrame:
+        """
+        Fetch CRSP monthly returns, downloading only months the mirror does not hold.
+
+        Args:
+            permnos (List[int]): List of permnos to fetch data for.
+            start_date (Optional[str]): Start date in YYYY-MM-DD format; defaults to the
+                start of CRSP.
+            end_date (Optional[str]): End date in YYYY-MM-DD format; defaults to today.
+
+        Returns:
+            pd.DataFrame: DataFrame with ``permno``, ``date`` and ``ret`` sorted by PERMNO
+            and date, or an empty DataFrame if the WRDS top-up fails.
+        """
+        start_date = start_date or CRSP_FIRST_MONTH
+        end_date = end_date or date.today().isoformat()
+        try:
+            self.sync(permnos, start_date, end_date)
+        except Exception as e:
+            logger.error(f"Failed to top up CRSP mirror: {e}")
+            return pd.DataFrame()
+        return self.read(permnos, start_date, end_date)
@@ -0,0 +1,208 @@
+"""On-disk, memory-mapped storage for daily CRSP returns."""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import List
+
+import numpy as np
+import pandas as pd
+
+_EPOCH = np.datetime64("1970-01-01", "D")
+
+
+class DailyReturnStore:
+    """
+    PERMNO-sorted daily return panel opened as read-only memory maps.
+
+    A store directory holds one flat binary file per column (``codes.bin`` with
+    ``int32`` PERMNO codes, ``days.bin`` with ``int32`` days since 1970-01-01 and
+    ``returns.bin``), ``permnos.npy`` mapping codes to PERMNOs and a ``manifest.json``
+    describing lengths and dtypes. The manifest is written last, so a directory
+    without one is an incomplete download. Rows are ordered by PERMNO and date and
+    ``offsets`` marks where each PERMNO starts, as in :class:`factors.panel.ReturnPanel`.
+
+    Because the arrays are ``np.memmap`` views, any number of processes can open the
+    same store and share its pages through the OS cache without copying.
+    """
+
+    MANIFEST = "manifest.json"
+
+    def __init__(self, directory: str | Path) -> None:
+        self.directory = Path(directory)
+        manifest_path = self.directory / self.MANIFEST
+        if not manifest_path.is_file():
+            raise FileNotFoundError(f"No daily return store at {self.directory}.")
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            self.manifest = json.load(f)
+
+        n_rows = int(self.manifest["rows"])
+        self.permno_ids = np.load(self.directory / "permnos.npy")
+        self.codes = _open_column(self.directory / "codes.bin", np.int32, n_rows)
+        self.days = _open_column(self.directory / "days.bin", np.int32, n_rows)
+        self.returns = _open_column(
+            self.directory / "returns.bin", np.dtype(self.manifest["ret_dtype"]), n_rows
+        )
+        self.offsets = np.asarray(self.manifest["offsets"], dtype=np.int64)
+        self._lookup = {int(permno): code for code, permno in enumerate(self.permno_ids)}
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    @property
+    def n_permnos(self) -> int:
+        return len(self.permno_ids)
+
+    @property
+    def permnos(self) -> np.ndarray:
+        """PERMNO of every row."""
+        return self.permno_ids[self.codes]
+
+    @property
+    def dates(self) -> np.ndarray:
+        """Trading date of every row as ``datetime64[D]``."""
+        return _EPOCH + self.days.astype("timedelta64[D]")
+
+    def rows(self, permno: int) -> slice:
+        """Row slice holding ``permno``'s history."""
+        code = self._lookup.get(int(permno))
+        if code is None:
+            raise KeyError(f"PERMNO {permno} is not in the store.")
+        return slice(int(self.offsets[code]), int(self.offsets[code + 1]))
+
+    def history(self, permno: int) -> tuple[np.ndarray, np.ndarray]:
+        """Day indexes and returns for ``permno`` as zero-copy views."""
+        rows = self.rows(permno)
+        return self.days[rows], self.returns[rows]
+
+    def to_frame(
+        self, date_col: str = "date", permno_col: str = "permno", ret_col: str = "ret"
+    ) -> pd.DataFrame:
+        """Materialize the store as a CRSP-style DataFrame (copies into memory)."""
+        return pd.DataFrame(
+            {
+                date_col: self.dates.astype("datetime64[ns]"),
+                permno_col: self.permnos,
+                ret_col: np.asarray(self.returns),
+            }
+        )
+
+
+class DailyStoreWriter:
+    """
+    Append PERMNO-ordered batches to a new :class:`DailyReturnStore` directory.
+
+    Batches must arrive in PERMNO order and must not split a PERMNO, which is what
+    fetching a sorted PERMNO list in chunks produces. Each batch is encoded and
+    written straight to the column files, so memory use is bounded by one batch.
+
+    Files are written to a hidden sibling of ``directory`` and only moved into place
+    by :meth:`close`, so the previous store stays readable until the new one is
+    complete and survives a failed refresh.
+
+    Args:
+        directory (str | Path): Target directory; an existing store there is replaced
+            on :meth:`close`.
+        permnos (List[int]): Every PERMNO that may appear, fixing the code mapping.
+        dtype (type[np.floating]): ``np.float32`` (default) or ``np.float64`` returns.
+
+    Raises:
+        FileExistsError: If ``directory`` exists and is neither empty nor a store.
+    """
+
+    def __init__(
+        self, directory: str | Path, permnos: List[int], dtype: type[np.floating] = np.float32
+    ) -> None:
+        self.directory = Path(directory)
+        self.permno_ids = np.unique(np.asarray(permnos, dtype=np.int64))
+        self.dtype = np.dtype(dtype)
+        if self.dtype not in (np.float32, np.float64):
+            raise ValueError("`dtype` must be float32 or float64.")
+        if (
+            self.directory.exists()
+            and any(self.directory.iterdir())
+            and not (self.directory / DailyReturnStore.MANIFEST).is_file()
+        ):
+            raise FileExistsError(f"{self.directory} exists and is not a daily return store.")
+        self.directory.parent.mkdir(parents=True, exist_ok=True)
+        self.staging = Path(
+            tempfile.mkdtemp(prefix=f".{self.directory.name}.", dir=self.directory.parent)
+        )
+        self._files = {
+            name: open(self.staging / f"{name}.bin", "wb") for name in ("codes", "days", "returns")
+        }
+        self._counts = np.zeros(len(self.permno_ids), dtype=np.int64)
+        self._last_code = -1
+        self.rows = 0
+
+    def append(self, df: pd.DataFrame) -> int:
+        """Encode and write one ``permno, date, ret`` batch; returns rows written."""
+        dates = pd.to_datetime(df["date"], errors="coerce")
+        returns = pd.to_numeric(df["ret"], errors="coerce")
+        permnos = pd.to_numeric(df["permno"], errors="coerce")
+        valid = (dates.notna() & returns.notna() & permnos.notna()).to_numpy()
+        if not valid.any():
+            return 0
+
+        permno_values = permnos.to_numpy()[valid].astype(np.int64)
+        if not np.isin(permno_values, self.permno_ids).all():
+            raise ValueError("Batch contains PERMNOs the writer was not told about.")
+        codes = np.searchsorted(self.permno_ids, permno_values)
+        days = (dates.to_numpy(dtype="datetime64[D]")[valid] - _EPOCH).astype(np.int32)
+        order = np.lexsort((days, codes))
+        codes = codes[order].astype(np.int32)
+        if codes[0] <= self._last_code:
+            raise ValueError("Batches must arrive in PERMNO order without splitting a PERMNO.")
+
+        self._files["codes"].write(codes.tobytes())
+        self._files["days"].write(days[order].tobytes())
+        self._files["returns"].write(
+            returns.to_numpy(dtype=np.float64)[valid][order].astype(self.dtype).tobytes()
+        )
+        self._counts += np.bincount(codes, minlength=len(self.permno_ids))
+        self._last_code = int(codes[-1])
+        self.rows += len(codes)
+        return len(codes)
+
+    def close(self) -> DailyReturnStore:
+        """Flush the column files, write the manifest and move the store into place."""
+        for f in self._files.values():
+            f.close()
+        np.save(self.staging / "permnos.npy", self.permno_ids)
+        manifest = {
+            "rows": self.rows,
+            "ret_dtype": self.dtype.name,
+            "offsets": np.concatenate(([0], np.cumsum(self._counts))).tolist(),
+        }
+        with open(self.staging / DailyReturnStore.MANIFEST, "w", encoding="utf-8") as f:
+            json.dump(manifest, f)
+
+        # A directory cannot be replaced in one step, so park the old store next to
+        # the target first. Readers that already mapped its files keep working.
+        retired = None
+        if self.directory.exists():
+            retired = Path(
+                tempfile.mkdtemp(prefix=f".{self.directory.name}.old.", dir=self.directory.parent)
+            )
+            os.replace(self.directory, retired / "store")
+        os.replace(self.staging, self.directory)
+        if retired is not None:
+            shutil.rmtree(retired, ignore_errors=True)
+        return DailyReturnStore(self.directory)
+
+    def abort(self) -> None:
+        """Discard the partially written store, leaving any previous one untouched."""
+        for f in self._files.values():
+            f.close()
+        shutil.rmtree(self.staging, ignore_errors=True)
+
+
+def _open_column(path: Path, dtype: np.dtype, n_rows: int) -> np.ndarray:
+    if n_rows == 0:
+        # np.memmap cannot map an empty file.
+        return np.empty(0, dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode="r", shape=(n_rows,))
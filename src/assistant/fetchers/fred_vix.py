@@ -6,11 +6,27 @@ from contextlib import suppress
 from aiohttp import ClientConnectorError, ClientResponseError
 
 from assistant.config import settings
-from assistant.utils.async_http import AsyncHttpClient
-from assistant.utils.dto import VixClose
+from assistant.utils.async_http import (
+    TYPED_DECODING,
+    AsyncHttpClient,
+    HttpResponse,
+    convert_json_as,
+)
+from assistant.utils.dto import FredObservation, FredObservations, VixClose
 from assistant.utils.logging import logger
 
 
+async def _last_observation(response: HttpResponse) -> Optional[FredObservation]:
+    """Most recent observation of a FRED series payload, or None if it has none."""
+    if TYPED_DECODING:
+        observations = (await response.decode(FredObservations)).observations
+        return observations[-1] if observations else None
+    # Without msgspec, typing all ~9k VIXCLS observations would cost ~10x the parse
+    # for the one that is used; validate just that one.
+    observations = (await response.json()).get("observations") or []
+    return convert_json_as(observations[-1], FredObservation) if observations else None
+
+
 async def latest_vix_close(client: AsyncHttpClient) -> Optional[VixClose]:
     """Fetch latest VIXCLS daily close from FRED asynchronously."""
     if not settings.FRED_API_KEY:
@@ -24,7 +40,7 @@ async def latest_vix_close(client: AsyncHttpClient) -> Optional[VixClose]:
 
     try:
         response = await client.get(settings.api_endpoints.fred, params=params)
-        data = await response.json()
+        last = await _last_observation(response)
     except ClientResponseError as exc:
         safe_url = exc.request_info.url.with_query({}) if exc.request_info else "unknown"
         body = ""
@@ -45,14 +61,12 @@ async def latest_vix_close(client: AsyncHttpClient) -> Optional[VixClose]:
         logger.warning(f"Failed to fetch VIX from FRED: {exc}")
         return None
 
-    obs = data.get("observations", [])
-    if not obs:
+    if last is None:
         logger.warning("FRED response did not contain observations.")
         return None
 
-    last = obs[-1]
-    date = last.get("date")
-    value_str = last.get("value")
+    date = last.date
+    value_str = last.value
     try:
         # FRED sometimes returns '.' for value on non-trading days
         if value_str == ".":
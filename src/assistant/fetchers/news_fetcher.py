@@ -4,13 +4,15 @@ from typing import List, Dict
 from contextlib import suppress
 from pydantic import BaseModel
 from assistant.config import settings
-from assistant.utils.async_http import AsyncHttpClient
+from assistant.utils.async_http import AsyncHttpClient, client_scope
 from assistant.utils.logging import logger
 import aiohttp
 import json
 from cachetools import TTLCache
 from aiohttp import ClientConnectorError, ClientResponseError
 
+NEWS_API_EVERYTHING = "https://newsapi.org/v2/everything"
+
 # Create a cache with a TTL of 15 minutes
 cache = TTLCache(maxsize=100, ttl=900)
 
@@ -68,13 +70,15 @@ async def fetch_financial_news(client: AsyncHttpClient) -> List[NewsArticle]:
         return []
 
 
-async def fetch_news(api_key: str, query: str) -> List[Dict]:
+async def fetch_news(api_key: str, query: str, client: AsyncHttpClient | None = None) -> List[Dict]:
     """
     Fetch news articles from the NewsAPI with caching.
 
     Args:
         api_key (str): API key for NewsAPI.
         query (str): Search query.
+        client (AsyncHttpClient | None): Shared client to send the request through; a
+            temporary one is created if omitted.
 
     Returns:
         List[Dict]: List of news articles.
@@ -82,34 +86,30 @@ async def fetch_news(api_key: str, query: str) -> List[Dict]:
     if query in cache:
         return cache[query]
 
-    url = "https://newsapi.org/v2/everything"
     params = {"q": query, "apiKey": api_key}
 
-    async with aiohttp.ClientSession() as session:
+    async with client_scope(client) as http:
         try:
-            async with session.get(url, params=params) as response:
-                if response.status == 429:
-                    logger.warning("Rate limit exceeded for NewsAPI.")
-                    return []
-                elif response.status != 200:
-                    logger.error(
-                        f"NewsAPI call failed with status code {response.status}: {response.reason}"
-                    )
-                    return []
-
-                try:
-                    data = await response.json()
-                    articles = data.get("articles", [])
-                    if not articles:
-                        logger.warning("No articles found in NewsAPI response.")
-                    cache[query] = articles
-                    return articles
-                except json.JSONDecodeError as e:
-                    logger.error(f"Failed to decode JSON response from NewsAPI: {e}")
-                    return []
+            response = await http.get(NEWS_API_EVERYTHING, params=params)
+            data = await response.json()
+        except ClientResponseError as e:
+            if e.status == 429:
+                logger.warning("Rate limit exceeded for NewsAPI.")
+            else:
+                logger.error(f"NewsAPI call failed with status code {e.status}: {e.message}")
+            return []
+        except json.JSONDecodeError as e:
+            logger.error(f"Failed to decode JSON response from NewsAPI: {e}")
+            return []
         except aiohttp.ClientError as e:
             logger.error(f"HTTP client error occurred while fetching news: {e}")
             return []
         except Exception as e:
             logger.error(f"Unexpected error occurred while fetching news: {e}")
             return []
+
+    articles = data.get("articles", [])
+    if not articles:
+        logger.warning("No articles found in NewsAPI response.")
+    cache[query] = articles
+    return articles
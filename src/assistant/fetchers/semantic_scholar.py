@@ -7,8 +7,8 @@ import requests
 from aiohttp import ClientConnectorError, ClientResponseError
 
 from assistant.config import settings
-from assistant.utils.async_http import AsyncHttpClient
-from assistant.utils.dto import PaperItem
+from assistant.utils.async_http import TYPED_DECODING, AsyncHttpClient
+from assistant.utils.dto import PaperItem, S2SearchPage
 from assistant.utils.http import HttpClient
 from assistant.utils.logging import logger
 
@@ -32,18 +32,32 @@ def _build_items(payload: Mapping[str, Any] | None) -> List[PaperItem]:
     if not payload:
         return items
 
-    entries: Iterable[Any] = payload.get("data", [])
+    entries: Iterable[Any] = payload.get("data") or []
     for entry in entries:
         if not isinstance(entry, Mapping):
             continue
-        title = entry.get("title", "")
-        url = entry.get("url", "")
-        authors = [a.get("name") for a in entry.get("authors", []) if a and a.get("name")]
+        title = entry.get("title") or ""
+        url = entry.get("url") or ""
+        authors = [a.get("name") for a in entry.get("authors") or [] if a and a.get("name")]
         year = entry.get("year")
+        if not isinstance(year, int):
+            year = None
         items.append(PaperItem(title=title, authors=authors, year=year, url=url))
     return items
 
 
+def _items_from_page(page: S2SearchPage) -> List[PaperItem]:
+    return [
+        PaperItem(
+            title=paper.title or "",
+            authors=[a.name for a in paper.authors or [] if a and a.name],
+            year=paper.year if isinstance(paper.year, int) else None,
+            url=paper.url or "",
+        )
+        for paper in page.data or []
+    ]
+
+
 def _maybe_log_rate_limit(status: int | None) -> None:
     if status == 429:
         logger.warning(
@@ -97,7 +111,10 @@ async def search_papers_async(
             params=params,
             headers=_api_headers(),
         )
-        data = await response.json()
+        if TYPED_DECODING:
+            items = _items_from_page(await response.decode(S2SearchPage))
+        else:
+            items = _build_items(await response.json())
     except ClientResponseError as exc:
         safe_url = exc.request_info.url.with_query({}) if exc.request_info else "unknown"
         body = ""
@@ -120,7 +137,7 @@ async def search_papers_async(
         logger.warning(f"Semantic Scholar search failed for '{query}': {exc}")
         return []
 
-    return _build_items(data)
+    return items
 
 
 __all__ = ["search_papers", "search_papers_async"]
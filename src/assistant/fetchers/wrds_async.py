@@ -0,0 +1,138 @@
+"""Run blocking WRDS queries and factor computations off the event loop."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from concurrent.futures import Executor, ThreadPoolExecutor
+from functools import partial
+from typing import Callable, List, Optional, TypeVar
+
+import pandas as pd
+
+from assistant.fetchers.wrds_crsp import DEFAULT_MAX_CONNECTIONS, fetch_crsp_data
+from assistant.fetchers.wrds_pool import WrdsConnectionPool
+from assistant.utils.logging import logger
+from factors.momentum import calculate_12_1_momentum
+
+T = TypeVar("T")
+
+DEFAULT_WRDS_TIMEOUT = 120.0
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_wrds_executor() -> ThreadPoolExecutor:
+    """Dedicated executor for WRDS work, sized to the default connection pool."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=DEFAULT_MAX_CONNECTIONS, thread_name_prefix="wrds"
+            )
+        return _executor
+
+
+async def run_wrds_call(
+    func: Callable[[], T],
+    fallback: Callable[[], T],
+    name: str,
+    timeout: Optional[float] = DEFAULT_WRDS_TIMEOUT,
+    executor: Optional[Executor] = None,
+) -> T:
+    """
+    Await a blocking callable on the WRDS executor without stalling the event loop.
+
+    On timeout or failure the error is logged and ``fallback()`` is returned, so the
+    caller can keep going like it does for the HTTP fetchers. If the awaiting task is
+    cancelled, the cancellation propagates. Either way a call that has not started yet
+    is withdrawn from the executor; one that is already running cannot be interrupted
+    and finishes in the background, its result discarded. The executor's fixed size
+    bounds how much such abandoned work can pile up.
+
+    Args:
+        func (Callable[[], T]): Zero-argument callable to run (use ``functools.partial``).
+        fallback (Callable[[], T]): Factory for the value returned on timeout or error.
+        name (str): Label used in log messages.
+        timeout (Optional[float]): Seconds to wait; waits indefinitely if None.
+        executor (Optional[Executor]): Executor to use; defaults to :func:`get_wrds_executor`.
+
+    Returns:
+        T: The callable's result, or ``fallback()``.
+    """
+    future = (executor or get_wrds_executor()).submit(func)
+    try:
+        return await asyncio.wait_for(asyncio.wrap_future(future), timeout)
+    except asyncio.TimeoutError:
+        future.cancel()
+        logger.error("{name} timed out after {timeout}s", name=name, timeout=timeout)
+    except asyncio.CancelledError:
+        future.cancel()
+        raise
+    except Exception as e:
+        logger.error("{name} failed: {error}", name=name, error=e)
+    return fallback()
+
+
+async def fetch_crsp_data_async(
+    permnos: List[int],
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    timeout: Optional[float] = DEFAULT_WRDS_TIMEOUT,
+    pool: Optional[WrdsConnectionPool] = None,
+) -> pd.DataFrame:
+    """
+    Async counterpart of :func:`~assistant.fetchers.wrds_crsp.fetch_crsp_data`.
+
+    Returns:
+        pd.DataFrame: DataFrame containing the CRSP data, or an empty DataFrame on
+        timeout or failure.
+    """
+    return await run_wrds_call(
+        partial(fetch_crsp_data, permnos, start_date, end_date, pool=pool),
+        pd.DataFrame,
+        "CRSP fetch",
+        timeout=timeout,
+    )
+
+
+def _momentum_signal(
+    permnos: List[int],
+    start_date: Optional[str],
+    end_date: Optional[str],
+    lookback: int,
+    skip: int,
+    pool: Optional[WrdsConnectionPool],
+) -> pd.DataFrame:
+    crsp_df = fetch_crsp_data(permnos, start_date, end_date, pool=pool)
+    if crsp_df.empty:
+        return pd.DataFrame()
+    return calculate_12_1_momentum(crsp_df, lookback=lookback, skip=skip)
+
+
+async def momentum_signal_async(
+    permnos: List[int],
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    lookback: int = 12,
+    skip: int = 1,
+    timeout: Optional[float] = DEFAULT_WRDS_TIMEOUT,
+    pool: Optional[WrdsConnectionPool] = None,
+) -> pd.DataFrame:
+    """
+    Fetch CRSP returns and compute momentum in one off-loop call.
+
+    Meant to be scheduled next to the HTTP fetchers in ``asyncio.gather`` so the WRDS
+    leg overlaps with them instead of adding to the digest's latency.
+
+    Returns:
+        pd.DataFrame: Momentum signal with ``date``, ``permno`` and ``momentum`` columns,
+        or an empty DataFrame on timeout or failure.
+    """
+    return await run_wrds_call(
+        partial(_momentum_signal, permnos, start_date, end_date, lookback, skip, pool),
+        pd.DataFrame,
+        "Momentum signal",
+        timeout=timeout,
+    )
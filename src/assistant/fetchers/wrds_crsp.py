@@ -1,12 +1,47 @@
-import os
-import wrds
-from typing import List, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+import numpy as np
 import pandas as pd
-from src.assistant.utils.logging import logger
+
+from assistant.fetchers.daily_store import DailyReturnStore, DailyStoreWriter
+from assistant.fetchers.wrds_pool import WrdsConnectionPool, get_default_pool
+from assistant.utils.logging import logger
+
+DEFAULT_BATCH_SIZE = 500
+DEFAULT_MAX_CONNECTIONS = 4
+DEFAULT_DAILY_BATCH_SIZE = 200
+
+
+def _msf_query(
+    permnos: List[int],
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    table: str = "crsp.msf",
+) -> Tuple[str, tuple]:
+    """Build the ``permno, date, ret`` query and its parameters for a CRSP stock file."""
+    sql_query = f"""
+    SELECT permno, date, ret
+    FROM {table}
+    WHERE permno IN %s
+    """
+    params: tuple = (tuple(int(p) for p in permnos),)
+    if start_date:
+        sql_query += " AND date >= %s"
+        params += (start_date,)
+    if end_date:
+        sql_query += " AND date <= %s"
+        params += (end_date,)
+    return sql_query, params
 
 
 def fetch_crsp_data(
-    permnos: List[int], start_date: Optional[str] = None, end_date: Optional[str] = None
+    permnos: List[int],
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    pool: Optional[WrdsConnectionPool] = None,
 ) -> pd.DataFrame:
     """
     Fetch CRSP monthly stock returns for the given permnos and date range.
@@ -15,33 +50,188 @@ def fetch_crsp_data(
         permnos (List[int]): List of permnos to fetch data for.
         start_date (Optional[str]): Start date in YYYY-MM-DD format.
         end_date (Optional[str]): End date in YYYY-MM-DD format.
+        pool (Optional[WrdsConnectionPool]): Pool to borrow a connection from; defaults to
+            the shared process-wide pool.
 
     Returns:
         pd.DataFrame: DataFrame containing the CRSP data.
     """
-    conn = None
+    pool = pool or get_default_pool()
     try:
-        conn = wrds.Connection(wrds_username=os.getenv("WRDS_USERNAME"))
-        sql_query = """
-        SELECT permno, date, ret
-        FROM crsp.msf
-        WHERE permno IN %s
-        """
-        params = (tuple(permnos),)
-        if start_date:
-            sql_query += " AND date >= %s"
-            params += (start_date,)
-        if end_date:
-            sql_query += " AND date <= %s"
-            params += (end_date,)
-
-        df = conn.raw_sql(sql_query, params=params)
+        with pool.connection() as conn:
+            sql_query, params = _msf_query(permnos, start_date, end_date)
+            df = conn.raw_sql(sql_query, params=params)
         return df
 
     except Exception as e:
         logger.error(f"Failed to fetch CRSP data: {e}")
         return pd.DataFrame()
 
-    finally:
-        if conn:
-            conn.close()
+
+class _PanelBuffer:
+    """Preallocated, typed ``permno``/``date``/``ret`` columns filled batch by batch."""
+
+    def __init__(self, capacity: int) -> None:
+        capacity = max(capacity, 1)
+        self.permno = np.empty(capacity, dtype=np.int64)
+        self.date = np.empty(capacity, dtype="datetime64[ns]")
+        self.ret = np.empty(capacity, dtype=np.float64)
+        self.size = 0
+        self._lock = threading.Lock()
+
+    def _grow(self, needed: int) -> None:
+        capacity = max(needed, 2 * len(self.permno))
+        for name in ("permno", "date", "ret"):
+            old = getattr(self, name)
+            new = np.empty(capacity, dtype=old.dtype)
+            new[: self.size] = old[: self.size]
+            setattr(self, name, new)
+
+    def append(self, df: pd.DataFrame) -> None:
+        n = len(df)
+        permno = pd.to_numeric(df["permno"]).to_numpy(dtype=np.int64)
+        dates = pd.to_datetime(df["date"]).to_numpy(dtype="datetime64[ns]")
+        ret = pd.to_numeric(df["ret"], errors="coerce").to_numpy(dtype=np.float64)
+        with self._lock:
+            if self.size + n > len(self.permno):
+                self._grow(self.size + n)
+            end = self.size + n
+            self.permno[self.size : end] = permno
+            self.date[self.size : end] = dates
+            self.ret[self.size : end] = ret
+            self.size = end
+
+    def to_frame(self) -> pd.DataFrame:
+        n = self.size
+        order = np.lexsort((self.date[:n], self.permno[:n]))
+        return pd.DataFrame(
+            {
+                "permno": self.permno[:n][order],
+                "date": self.date[:n][order],
+                "ret": self.ret[:n][order],
+            }
+        )
+
+
+def _estimated_rows(n_permnos: int, start_date: Optional[str], end_date: Optional[str]) -> int:
+    """Upper bound on monthly rows when the range is known, else a modest initial guess."""
+    if start_date and end_date:
+        months = pd.Timestamp(end_date).to_period("M") - pd.Timestamp(start_date).to_period("M")
+        return n_permnos * (months.n + 1)
+    return n_permnos * 120
+
+
+def fetch_crsp_data_batched(
+    permnos: List[int],
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    max_connections: int = DEFAULT_MAX_CONNECTIONS,
+    pool: Optional[WrdsConnectionPool] = None,
+) -> pd.DataFrame:
+    """
+    Fetch CRSP monthly returns for a large PERMNO universe in concurrent batches.
+
+    The PERMNO list is split into ``batch_size`` chunks so each ``IN`` list stays
+    small enough for the server to plan well. Batches run on at most
+    ``max_connections`` threads that borrow connections from ``pool``, and each batch is copied
+    into one preallocated typed panel as soon as it arrives instead of being
+    concatenated at the end.
+
+    Args:
+        permnos (List[int]): List of permnos to fetch data for.
+        start_date (Optional[str]): Start date in YYYY-MM-DD format.
+        end_date (Optional[str]): End date in YYYY-MM-DD format.
+        batch_size (int): Maximum number of PERMNOs per query.
+        max_connections (int): Maximum number of concurrent WRDS connections.
+        pool (Optional[WrdsConnectionPool]): Pool to borrow connections from; defaults to the
+            shared process-wide pool.
+
+    Returns:
+        pd.DataFrame: ``permno`` (int64), ``date`` (datetime64) and ``ret`` (float64) sorted by
+        PERMNO and date, or an empty DataFrame if any batch fails.
+    """
+    if batch_size <= 0 or max_connections <= 0:
+        raise ValueError("`batch_size` and `max_connections` must be > 0.")
+    unique = sorted({int(p) for p in permnos})
+    if not unique:
+        return pd.DataFrame(columns=["permno", "date", "ret"])
+
+    batches = [unique[i : i + batch_size] for i in range(0, len(unique), batch_size)]
+    pool = pool or get_default_pool()
+    panel = _PanelBuffer(_estimated_rows(len(unique), start_date, end_date))
+
+    def _run(batch: List[int]) -> None:
+        with pool.connection() as conn:
+            sql_query, params = _msf_query(batch, start_date, end_date)
+            frame = conn.raw_sql(sql_query, params=params)
+        panel.append(frame)
+
+    try:
+        with ThreadPoolExecutor(
+            max_workers=min(max_connections, len(batches)), thread_name_prefix="crsp-batch"
+        ) as executor:
+            for future in [executor.submit(_run, batch) for batch in batches]:
+                future.result()
+        return panel.to_frame()
+
+    except Exception as e:
+        logger.error(f"Failed to fetch CRSP data in batches: {e}")
+        return pd.DataFrame()
+
+
+def fetch_crsp_daily_data(
+    permnos: List[int],
+    directory: str | Path,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    batch_size: int = DEFAULT_DAILY_BATCH_SIZE,
+    dtype: type[np.floating] = np.float32,
+    pool: Optional[WrdsConnectionPool] = None,
+) -> Optional[DailyReturnStore]:
+    """
+    Fetch CRSP daily stock returns (``crsp.dsf``) into a memory-mapped store on disk.
+
+    Daily data is roughly 20x the size of the monthly file, so instead of building a
+    DataFrame the PERMNOs are fetched in sorted batches and each batch is encoded and
+    appended to the store's column files as it arrives. The result can be reopened
+    zero-copy from any process with ``DailyReturnStore(directory)``.
+
+    Args:
+        permnos (List[int]): List of permnos to fetch data for.
+        directory (str | Path): Store directory; an existing store there is replaced.
+        start_date (Optional[str]): Start date in YYYY-MM-DD format.
+        end_date (Optional[str]): End date in YYYY-MM-DD format.
+        batch_size (int): Maximum number of PERMNOs per query.
+        dtype (type[np.floating]): ``np.float32`` (default) or ``np.float64`` returns.
+        pool (Optional[WrdsConnectionPool]): Pool to borrow a connection from; defaults to
+            the shared process-wide pool.
+
+    Returns:
+        Optional[DailyReturnStore]: The opened store, or None if the download failed (the
+        partial download is removed and any previous store is left in place).
+    """
+    if batch_size <= 0:
+        raise ValueError("`batch_size` must be > 0.")
+    unique = sorted({int(p) for p in permnos})
+    pool = pool or get_default_pool()
+    writer = DailyStoreWriter(directory, unique, dtype=dtype)
+    try:
+        with pool.connection() as conn:
+            for i in range(0, len(unique), batch_size):
+                batch = unique[i : i + batch_size]
+                sql_query, params = _msf_query(batch, start_date, end_date, table="crsp.dsf")
+                writer.append(conn.raw_sql(sql_query, params=params))
+        store = writer.close()
+        logger.info(
+            "Stored {rows} daily CRSP rows for {n} PERMNOs in {path}",
+            rows=len(store),
+            n=len(unique),
+            path=str(directory),
+        )
+        return store
+
+    except Exception as e:
+        logger.error(f"Failed to fetch CRSP daily data: {e}")
+        writer.abort()
+        return None
@@ -0,0 +1,198 @@
+"""Shared, lazily populated pool of WRDS connections."""
+
+from __future__ import annotations
+
+import atexit
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, List, Optional, Tuple
+
+import wrds
+
+from assistant.utils.logging import logger
+
+DEFAULT_POOL_SIZE = 4
+DEFAULT_IDLE_TIMEOUT = 300.0
+DEFAULT_HEALTH_CHECK_AFTER = 30.0
+
+
+def _connect() -> wrds.Connection:
+    """Open an authenticated WRDS connection for the configured user."""
+    return wrds.Connection(wrds_username=os.getenv("WRDS_USERNAME"))
+
+
+class WrdsConnectionPool:
+    """
+    Thread-safe pool that hands out WRDS connections through a context manager.
+
+    Connections are created lazily, up to ``max_size`` at a time, and returned to the
+    pool after use so the authentication handshake is paid once per connection
+    rather than once per query. Connections idle for longer than ``idle_timeout``
+    are closed, both whenever the pool is used and by a background timer that runs
+    while idle connections remain; ones idle for more than ``health_check_after``
+    are probed with ``SELECT 1`` before being handed out and replaced if the probe
+    fails.
+
+    Example:
+        >>> with get_default_pool().connection() as conn:
+        ...     df = conn.raw_sql("SELECT permno, date, ret FROM crsp.msf LIMIT 5")
+    """
+
+    def __init__(
+        self,
+        connect: Optional[Callable[[], Any]] = None,
+        max_size: int = DEFAULT_POOL_SIZE,
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+        health_check_after: float = DEFAULT_HEALTH_CHECK_AFTER,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_size <= 0:
+            raise ValueError("`max_size` must be > 0.")
+        self.connect = connect or _connect
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.health_check_after = health_check_after
+        self._clock = clock
+        self._slots = threading.BoundedSemaphore(max_size)
+        self._lock = threading.Lock()
+        self._idle: List[Tuple[Any, float]] = []  # (connection, returned_at), most recent last
+        self._closed = False
+        self._reaper: Optional[threading.Timer] = None
+        self.created = 0
+
+    @contextmanager
+    def connection(self, timeout: Optional[float] = None) -> Iterator[Any]:
+        """
+        Borrow a connection for the duration of the ``with`` block.
+
+        Args:
+            timeout (Optional[float]): Seconds to wait for a free slot; waits forever if None.
+
+        Raises:
+            TimeoutError: If no connection frees up within ``timeout``.
+            RuntimeError: If the pool has been closed.
+        """
+        if self._closed:
+            raise RuntimeError("WRDS connection pool is closed.")
+        if not self._slots.acquire(timeout=timeout if timeout is not None else -1):
+            raise TimeoutError(f"No WRDS connection available within {timeout}s.")
+        conn = None
+        try:
+            conn = self._checkout()
+            yield conn
+        except Exception:
+            # The connection may be mid-transaction or broken; never hand it out again.
+            if conn is not None:
+                self._discard(conn)
+                conn = None
+            raise
+        finally:
+            if conn is not None:
+                self._checkin(conn)
+            self._slots.release()
+
+    def _checkout(self) -> Any:
+        self.prune()
+        now = self._clock()
+        while True:
+            with self._lock:
+                if not self._idle:
+                    break
+                conn, returned_at = self._idle.pop()
+            idle_for = now - returned_at
+            if idle_for > self.idle_timeout:
+                self._discard(conn)
+                continue
+            if idle_for > self.health_check_after and not self._healthy(conn):
+                self._discard(conn)
+                continue
+            return conn
+
+        conn = self.connect()
+        self.created += 1
+        logger.debug("Opened WRDS connection #{n}", n=self.created)
+        return conn
+
+    def _checkin(self, conn: Any) -> None:
+        with self._lock:
+            closed = self._closed
+            if not closed:
+                self._idle.append((conn, self._clock()))
+        if closed:
+            self._discard(conn)
+            return
+        self.prune()
+        self._schedule_reaper()
+
+    def _schedule_reaper(self) -> None:
+        """Start a timer that prunes once the idle timeout passes, if none is pending."""
+        with self._lock:
+            if self._closed or not self._idle or self._reaper is not None:
+                return
+            self._reaper = threading.Timer(self.idle_timeout, self._reap)
+            self._reaper.daemon = True
+            self._reaper.start()
+
+    def _reap(self) -> None:
+        with self._lock:
+            self._reaper = None
+        self.prune()
+        self._schedule_reaper()
+
+    @staticmethod
+    def _healthy(conn: Any) -> bool:
+        try:
+            conn.raw_sql("SELECT 1")
+            return True
+        except Exception as e:
+            logger.warning(f"Dropping unhealthy WRDS connection: {e}")
+            return False
+
+    @staticmethod
+    def _discard(conn: Any) -> None:
+        try:
+            conn.close()
+        except Exception as e:  # pragma: no cover - best effort cleanup
+            logger.debug(f"Ignoring error while closing WRDS connection: {e}")
+
+    def prune(self) -> int:
+        """Close idle connections past ``idle_timeout``; returns how many were closed."""
+        now = self._clock()
+        with self._lock:
+            expired = [c for c, t in self._idle if now - t > self.idle_timeout]
+            self._idle = [(c, t) for c, t in self._idle if now - t <= self.idle_timeout]
+        for conn in expired:
+            self._discard(conn)
+        return len(expired)
+
+    @property
+    def idle_count(self) -> int:
+        with self._lock:
+            return len(self._idle)
+
+    def close(self) -> None:
+        """Close every idle connection; borrowed ones are closed when returned."""
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            reaper, self._reaper = self._reaper, None
+        if reaper is not None:
+            reaper.cancel()
+        for conn, _ in idle:
+            self._discard(conn)
+
+
+_default_pool: Optional[WrdsConnectionPool] = None
+_default_pool_lock = threading.Lock()
+
+
+def get_default_pool() -> WrdsConnectionPool:
+    """Process-wide pool shared by the CRSP fetchers, created on first use."""
+    global _default_pool
+    with _default_pool_lock:
+        if _default_pool is None or _default_pool._closed:
+            _default_pool = WrdsConnectionPool()
+            atexit.register(_default_pool.close)
+        return _default_pool
@@ -1,21 +1,474 @@
 # src/assistant/utils/async_http.py
 from __future__ import annotations
 
+import asyncio
+import dataclasses
+import hashlib
+import importlib
+import json
+import os
+import ssl
+import time
+import types
+import typing
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field, replace
+from functools import lru_cache, partial
+from pathlib import Path
+from typing import Any, AsyncIterator, Callable, Mapping, Sequence, TypeVar
+
 import aiohttp
 from aiohttp_retry import RetryClient, ExponentialRetry
+from multidict import CIMultiDict, CIMultiDictProxy
+from yarl import URL
+
+from assistant.config import HttpSettings, settings
+from assistant.utils.circuit_breaker import CircuitBreaker
+from assistant.utils.hedging import Hedger
+from assistant.utils.http_metrics import HttpMetrics, RequestRecord, dump_json, endpoint_of
+from assistant.utils.logging import logger
+from assistant.utils.rate_limit import RateLimiter, parse_retry_after
+
+try:
+    import msgspec  # type: ignore
+except ImportError:  # pragma: no cover - optional single-pass typed decoding
+    msgspec = None
+
+# Typed decoding only pays off with msgspec; the pure-Python conversion walks every
+# record again, so fetchers read large payloads with ``json_loads`` without it.
+TYPED_DECODING = msgspec is not None
 
 # CORRECTED: Changed the User-Agent to mimic a standard web browser.
 DEFAULT_UA = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/129.0.0.0 Safari/537.36"
 
 
+T = TypeVar("T")
+
+# --- JSON decoding ---
+
+# Fastest first; each entry builds a ``loads(bytes | str)`` callable.
+_JSON_BACKENDS: dict[str, Callable[[], Callable[[bytes | str], Any]]] = {
+    "orjson": lambda: importlib.import_module("orjson").loads,
+    "msgspec": lambda: importlib.import_module("msgspec").json.Decoder().decode,
+    "json": lambda: json.loads,
+}
+
+
+def select_json_backend(
+    preferred: Sequence[str] = ("orjson", "msgspec", "json"),
+) -> tuple[str, Callable[[bytes | str], Any]]:
+    """Return ``(name, loads)`` for the first preferred JSON backend that is installed."""
+    for name in preferred:
+        try:
+            return name, _JSON_BACKENDS[name]()
+        except ImportError:
+            continue
+    return "json", json.loads
+
+
+JSON_BACKEND, json_loads = select_json_backend()
+
+
+def use_json_backend(name: str) -> None:
+    """Switch the decoder used by :meth:`HttpResponse.json` (e.g. ``"json"`` to debug)."""
+    global JSON_BACKEND, json_loads
+    JSON_BACKEND, json_loads = name, _JSON_BACKENDS[name]()
+
+
+def decode_json_as(data: bytes | str, schema: type[T]) -> T:
+    """
+    Decode JSON straight into ``schema`` (a dataclass, possibly nested in lists/Optionals).
+
+    With msgspec installed the bytes are decoded and validated in one pass without
+    building intermediate dicts; otherwise the active backend's output is converted,
+    which costs far more than the parse on large payloads (see ``TYPED_DECODING``).
+    Unknown fields are ignored and missing ones take their dataclass defaults.
+
+    Raises:
+        ValueError: If the payload does not match ``schema``.
+    """
+    if msgspec is None:
+        return _convert(json_loads(data), schema)
+    try:
+        return msgspec.json.decode(data, type=schema)
+    except msgspec.DecodeError as exc:
+        raise ValueError(str(exc)) from exc
+
+
+def convert_json_as(value: Any, schema: type[T]) -> T:
+    """
+    Convert an already decoded JSON value into ``schema``, like :func:`decode_json_as`.
+
+    Useful for validating the entries of a payload one by one, so a single malformed
+    record can be skipped instead of failing the whole document.
+
+    Raises:
+        ValueError: If ``value`` does not match ``schema``.
+    """
+    if msgspec is None:
+        return _convert(value, schema)
+    try:
+        return msgspec.convert(value, type=schema)
+    except msgspec.ValidationError as exc:
+        raise ValueError(str(exc)) from exc
+
+
+@lru_cache(maxsize=None)
+def _type_hints(schema: type) -> dict[str, Any]:
+    return typing.get_type_hints(schema)
+
+
+def _convert(value: Any, tp: Any) -> Any:
+    """Validate and convert decoded JSON ``value`` into type ``tp``."""
+    if tp is Any:
+        return value
+    origin = typing.get_origin(tp)
+    if origin in (typing.Union, types.UnionType):
+        args = typing.get_args(tp)
+        if value is None and type(None) in args:
+            return None
+        for arg in args:
+            if arg is type(None):
+                continue
+            try:
+                return _convert(value, arg)
+            except ValueError:
+                continue
+        raise ValueError(f"{value!r} matches none of {tp}")
+    if origin in (list, typing.List):
+        if not isinstance(value, list):
+            raise ValueError(f"Expected array, got {type(value).__name__}")
+        (item_type,) = typing.get_args(tp) or (Any,)
+        return [_convert(item, item_type) for item in value]
+    if dataclasses.is_dataclass(tp):
+        if not isinstance(value, dict):
+            raise ValueError(f"Expected object for {tp.__name__}, got {type(value).__name__}")
+        hints = _type_hints(tp)
+        kwargs = {
+            f.name: _convert(value[f.name], hints[f.name])
+            for f in dataclasses.fields(tp)
+            if f.name in value
+        }
+        try:
+            return tp(**kwargs)
+        except TypeError as exc:
+            raise ValueError(str(exc)) from exc
+    if tp is float and isinstance(value, int) and not isinstance(value, bool):
+        return float(value)
+    if isinstance(value, tp) and not (tp is int and isinstance(value, bool)):
+        return value
+    raise ValueError(f"Expected {getattr(tp, '__name__', tp)}, got {type(value).__name__}")
+
+
+@lru_cache(maxsize=1)
+def shared_ssl_context() -> ssl.SSLContext:
+    """
+    Process-wide TLS context so the CA bundle is loaded and parsed once.
+
+    Sharing the context does not make aiohttp resume TLS sessions; avoiding repeat
+    handshakes relies on the connector's keep-alive connections.
+    """
+    return ssl.create_default_context()
+
+
+def build_connector(http_settings: HttpSettings | None = None) -> aiohttp.TCPConnector:
+    """Create the pooled, DNS-caching connector every fetcher request goes through."""
+    http_settings = http_settings or settings.http
+    return aiohttp.TCPConnector(
+        limit=http_settings.limit,
+        limit_per_host=http_settings.limit_per_host,
+        keepalive_timeout=http_settings.keepalive_timeout,
+        use_dns_cache=True,
+        ttl_dns_cache=http_settings.ttl_dns_cache,
+        ssl=shared_ssl_context(),
+    )
+
+
+DEFAULT_HTTP_CACHE_DIR = Path("artifacts") / "http_cache"
+DEFAULT_HTTP_CACHE_BYTES = 256 << 20  # 256 MiB
+# Response headers kept alongside a cached body.
+_CACHED_HEADERS = ("Content-Type", "ETag", "Last-Modified")
+
+
+@dataclass
+class HttpResponse:
+    """
+    Fully read GET response, either fresh from the network or replayed from the cache.
+
+    Mirrors the parts of ``aiohttp.ClientResponse`` the fetchers use (``status``,
+    ``headers``, ``await read()/text()/json()`` and ``raise_for_status()``), so callers
+    do not need to know where the body came from.
+    """
+
+    status: int
+    headers: CIMultiDictProxy[str]
+    body: bytes
+    url: URL
+    reason: str | None = None
+    from_cache: bool = False
+    request_info: aiohttp.RequestInfo | None = field(default=None, repr=False)
+
+    @classmethod
+    async def read_from(cls, response: aiohttp.ClientResponse) -> "HttpResponse":
+        """Buffer ``response``'s body and release its connection back to the pool."""
+        async with response:
+            body = await response.read()
+        return cls(
+            status=response.status,
+            headers=response.headers,
+            body=body,
+            url=response.url,
+            reason=response.reason,
+            request_info=response.request_info,
+        )
+
+    @property
+    def ok(self) -> bool:
+        return self.status < 400
+
+    async def read(self) -> bytes:
+        return self.body
+
+    async def text(self, encoding: str | None = None) -> str:
+        if encoding is None:
+            _, _, charset = self.headers.get("Content-Type", "").partition("charset=")
+            encoding = charset.split(";")[0].strip() or "utf-8"
+        return self.body.decode(encoding, errors="replace")
+
+    async def json(self, loads: Callable[[bytes | str], Any] | None = None) -> Any:
+        """Decode the body with ``loads`` or the fastest installed backend."""
+        if loads is not None:
+            return loads(await self.text())
+        return json_loads(self.body)
+
+    async def decode(self, schema: type[T]) -> T:
+        """Decode the body straight into ``schema``; see :func:`decode_json_as`."""
+        return decode_json_as(self.body, schema)
+
+    def raise_for_status(self) -> None:
+        if self.ok:
+            return
+        request_info = self.request_info or aiohttp.RequestInfo(
+            self.url, "GET", CIMultiDictProxy(CIMultiDict()), self.url
+        )
+        raise aiohttp.ClientResponseError(
+            request_info, (), status=self.status, message=self.reason or "", headers=self.headers
+        )
+
+
+class HttpCache:
+    """
+    On-disk cache of GET bodies with conditional revalidation.
+
+    Each entry is one file named by a hash of the URL and query: a JSON header line
+    (status, validators, storage time) followed by the raw body. Within an endpoint's
+    TTL an entry is served without touching the network. After that the client sends
+    ``If-None-Match``/``If-Modified-Since`` and a ``304 Not Modified`` replays the
+    stored body. Responses with neither a TTL nor a validator are not stored, since
+    they could never be reused. Reads refresh an entry's modification time and writes
+    evict the least recently used entries once the directory exceeds ``max_bytes``.
+
+    Args:
+        directory (str | Path): Cache directory.
+        max_bytes (int): Size budget for the directory.
+        default_ttl (float): Seconds a response is served without revalidation.
+        ttls (Mapping[str, float] | None): Per-endpoint TTL overrides keyed by
+            ``host`` or ``host/path`` prefix; the longest matching prefix wins.
+        clock (Callable[[], float]): Wall-clock source, injectable for tests.
+    """
+
+    SUFFIX = ".http"
+
+    def __init__(
+        self,
+        directory: str | Path = DEFAULT_HTTP_CACHE_DIR,
+        max_bytes: int = DEFAULT_HTTP_CACHE_BYTES,
+        default_ttl: float = 0.0,
+        ttls: Mapping[str, float] | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if max_bytes <= 0:
+            raise ValueError("`max_bytes` must be > 0.")
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.ttls = dict(ttls or {})
+        self._clock = clock
+
+    @classmethod
+    def from_settings(cls, http_settings: HttpSettings) -> "HttpCache | None":
+        """Cache configured by ``http_settings``, or None when caching is disabled."""
+        if not http_settings.cache_dir:
+            return None
+        return cls(
+            directory=http_settings.cache_dir,
+            max_bytes=http_settings.cache_max_bytes,
+            default_ttl=http_settings.cache_default_ttl,
+            ttls=http_settings.cache_ttls,
+        )
+
+    @staticmethod
+    def key(url: str | URL, params: Mapping[str, Any] | None = None) -> str:
+        """Cache key for a GET of ``url`` with ``params`` (parameter order ignored)."""
+        target = URL(str(url))
+        if params:
+            target = target.update_query({k: str(v) for k, v in params.items()})
+        query = sorted(target.query.items())
+        return hashlib.sha256(f"{target.with_query(None)}?{query}".encode()).hexdigest()
+
+    def ttl_for(self, url: str | URL) -> float:
+        """TTL of the longest configured ``host[/path]`` prefix matching ``url``."""
+        target = URL(str(url))
+        location = f"{target.host}{target.path}"
+        matches = [prefix for prefix in self.ttls if location.startswith(prefix)]
+        return self.ttls[max(matches, key=len)] if matches else self.default_ttl
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}{self.SUFFIX}"
+
+    def get(self, key: str) -> tuple[dict[str, Any], bytes] | None:
+        """Return ``(meta, body)`` for ``key`` or None, marking it as recently used."""
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                meta = json.loads(f.readline())
+                body = f.read()
+        except (FileNotFoundError, ValueError):
+            return None
+        os.utime(path)
+        return meta, body
+
+    def is_fresh(self, meta: Mapping[str, Any], url: str | URL) -> bool:
+        return self._clock() - meta["stored_at"] < self.ttl_for(url)
+
+    @staticmethod
+    def validators(meta: Mapping[str, Any]) -> dict[str, str]:
+        """Conditional request headers for a stored entry."""
+        headers = {}
+        if "ETag" in meta["headers"]:
+            headers["If-None-Match"] = meta["headers"]["ETag"]
+        if "Last-Modified" in meta["headers"]:
+            headers["If-Modified-Since"] = meta["headers"]["Last-Modified"]
+        return headers
+
+    def replay(self, meta: Mapping[str, Any], body: bytes, url: str | URL) -> HttpResponse:
+        """Rebuild a response from a stored entry."""
+        return HttpResponse(
+            status=meta["status"],
+            headers=CIMultiDictProxy(CIMultiDict(meta["headers"])),
+            body=body,
+            url=URL(str(url)),
+            reason="OK",
+            from_cache=True,
+        )
+
+    def put(self, key: str, url: str | URL, response: HttpResponse) -> bool:
+        """Store a ``200`` response if it can ever be reused; returns whether it was stored."""
+        if response.status != 200 or "no-store" in response.headers.get("Cache-Control", ""):
+            return False
+        headers = {h: response.headers[h] for h in _CACHED_HEADERS if h in response.headers}
+        if self.ttl_for(url) <= 0 and not {"ETag", "Last-Modified"} & headers.keys():
+            return False
+        self._write(
+            key, {"status": 200, "headers": headers, "stored_at": self._clock()}, response.body
+        )
+        return True
+
+    def touch(self, key: str, meta: dict[str, Any], body: bytes, revalidated: HttpResponse) -> None:
+        """Restart an entry's TTL after a ``304``, adopting any updated validators."""
+        for name in ("ETag", "Last-Modified"):
+            if name in revalidated.headers:
+                meta["headers"][name] = revalidated.headers[name]
+        meta["stored_at"] = self._clock()
+        self._write(key, meta, body)
+
+    def _write(self, key: str, meta: Mapping[str, Any], body: bytes) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._path(key)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp, "wb") as f:
+            f.write(json.dumps(meta).encode() + b"\n")
+            f.write(body)
+        os.replace(tmp, path)
+        self.evict()
+
+    def evict(self) -> list[Path]:
+        """Delete least recently used entries until the cache fits in ``max_bytes``."""
+        entries = []
+        for path in self.directory.glob(f"*{self.SUFFIX}"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        entries.sort()
+
+        total = sum(size for _, size, _ in entries)
+        removed = []
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            removed.append(path)
+        if removed:
+            logger.debug("Evicted {count} HTTP cache entries", count=len(removed))
+        return removed
+
+
 class AsyncHttpClient:
-    """Resilient asynchronous HTTP client with retries and a default User-Agent."""
+    """
+    Resilient asynchronous HTTP client with retries and a default User-Agent.
+
+    The client owns a single ``TCPConnector`` (see :func:`build_connector`), so all
+    fetchers sharing one client reuse keep-alive connections (so a TLS handshake is
+    paid once per connection, not per request), cached DNS lookups and one TLS
+    context. GETs go through
+    an optional :class:`HttpCache` that persists bodies between runs, and every
+    request attempt that reaches the network, retries included, first waits on its
+    host's token bucket (see :class:`~assistant.utils.rate_limit.RateLimiter`). Concurrent identical GETs are
+    coalesced into one request whose body every caller shares, and hosts that keep
+    failing are short-circuited by a :class:`~assistant.utils.circuit_breaker.CircuitBreaker`.
+    Endpoints that opt in to hedging get a duplicate request when the first one is
+    unusually slow (see :class:`~assistant.utils.hedging.Hedger`). Every request is
+    timed through an aiohttp trace config into per-endpoint histograms
+    (:class:`~assistant.utils.http_metrics.HttpMetrics`), written to
+    ``metrics_path`` when the client closes.
+    """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        http_settings: HttpSettings | None = None,
+        cache: HttpCache | None = None,
+        rate_limiter: RateLimiter | None = None,
+        breaker: CircuitBreaker | None = None,
+        hedger: Hedger | None = None,
+    ) -> None:
         retry_options = ExponentialRetry(attempts=3)
+        http_settings = http_settings or settings.http
 
         headers = {"User-Agent": DEFAULT_UA}
-        self.session = RetryClient(retry_options=retry_options, headers=headers)
+        self.cache = cache if cache is not None else HttpCache.from_settings(http_settings)
+        self.rate_limiter = rate_limiter or RateLimiter(http_settings.rate_limits)
+        self.breaker = breaker or CircuitBreaker.from_settings(http_settings)
+        self.hedger = hedger or Hedger.from_settings(http_settings)
+        self.connector = build_connector(http_settings)
+        self.metrics = HttpMetrics()
+        self.metrics_path = http_settings.metrics_path
+        self.session = RetryClient(
+            retry_options=retry_options,
+            headers=headers,
+            connector=self.connector,
+            # The limiter runs first so its queueing is not counted as request latency.
+            trace_configs=[
+                self.breaker.trace_config(),
+                self.rate_limiter.trace_config(),
+                self.metrics.trace_config(),
+            ],
+        )
+        self._inflight: dict[str, asyncio.Future[HttpResponse]] = {}
+        self._waiters: dict[asyncio.Future[HttpResponse], int] = {}
+        self.coalesced = 0
         self._closed = False
 
     async def __aenter__(self) -> "AsyncHttpClient":
@@ -26,12 +479,196 @@ class AsyncHttpClient:
 
     async def get(
         self, url: str, params: dict | None = None, headers: dict | None = None
-    ) -> aiohttp.ClientResponse:
-        """Perform an asynchronous GET request."""
-        response = await self.session.get(url, params=params, headers=headers, timeout=20)
+    ) -> HttpResponse:
+        """
+        Perform an asynchronous GET request and return the fully read response.
+
+        A GET identical to one already in flight (same URL, params and headers) waits
+        for that request instead of sending its own. The shared request is shielded, so
+        cancelling one caller does not cancel it for the others; it is cancelled once
+        every caller waiting on it has been.
+        """
+        key = _request_key(url, params, headers)
+        shared = self._inflight.get(key)
+        if shared is None:
+            shared = asyncio.ensure_future(self._get(url, params, headers))
+            self._inflight[key] = shared
+            shared.add_done_callback(partial(self._forget, key))
+        else:
+            self.coalesced += 1
+        self._waiters[shared] = self._waiters.get(shared, 0) + 1
+        try:
+            response = await asyncio.shield(shared)
+        except asyncio.CancelledError:
+            if self._waiters.get(shared) == 1:
+                # Nobody is left to use the result; later callers start afresh.
+                if self._inflight.get(key) is shared:
+                    del self._inflight[key]
+                shared.cancel()
+            raise
+        finally:
+            if shared in self._waiters:
+                self._waiters[shared] -= 1
+        # Callers get their own response object over the same immutable body.
+        return replace(response)
+
+    def _forget(self, key: str, shared: asyncio.Future[HttpResponse]) -> None:
+        self._waiters.pop(shared, None)
+        if self._inflight.get(key) is shared:
+            del self._inflight[key]
+        if not shared.cancelled():
+            shared.exception()  # mark as retrieved even if every caller gave up
+
+    async def _get(
+        self, url: str, params: dict | None = None, headers: dict | None = None
+    ) -> HttpResponse:
+        """
+        Uncoalesced GET through the cache.
+
+        With a cache configured, a fresh stored body is returned without a request and
+        a stale one is revalidated; a ``304`` is answered from disk.
+        """
+        if self.cache is None:
+            response = await self._fetch_hedged(url, params, headers)
+            response.raise_for_status()
+            return response
+
+        key = self.cache.key(url, params)
+        entry = self.cache.get(key)
+        if entry is not None and self.cache.is_fresh(entry[0], url):
+            self.metrics.count_cache(url, "hit")
+            return self.cache.replay(*entry, url)
+
+        conditional = dict(headers or {})
+        if entry is not None:
+            conditional.update(self.cache.validators(entry[0]))
+        response = await self._fetch_hedged(url, params, conditional)
+        if response.status == 304 and entry is not None:
+            self.metrics.count_cache(url, "revalidated")
+            self.cache.touch(key, *entry, response)
+            return self.cache.replay(*entry, url)
+
+        self.metrics.count_cache(url, "miss")
+
         response.raise_for_status()
+        self.cache.put(key, url, response)
+        return response
+
+    async def _fetch_hedged(
+        self, url: str, params: dict | None = None, headers: dict | None = None
+    ) -> HttpResponse:
+        """
+        Fetch with a backup request if the endpoint opted in and the first is slow.
+
+        The first response to arrive wins and the other request is cancelled; a failed
+        attempt only loses to one still running, and an error is raised only once every
+        attempt has failed.
+
+        The hedge clock starts once the rate limiter has let the first request out, so
+        time spent queueing for a token neither triggers a hedge nor counts as latency,
+        and no hedge is sent while the host has no token to spare.
+        """
+        endpoint = self.hedger.endpoint(url)
+        if endpoint is None:
+            return await self._fetch(url, params, headers)
+
+        loop = asyncio.get_running_loop()
+        granted = asyncio.Event()
+        primary = asyncio.ensure_future(self._fetch(url, params, headers, granted))
+        racers = {primary}
+        try:
+            token = asyncio.ensure_future(granted.wait())
+            try:
+                await asyncio.wait({primary, token}, return_when=asyncio.FIRST_COMPLETED)
+            finally:
+                token.cancel()
+            started = loop.time()
+            await asyncio.wait(racers, timeout=self.hedger.delay(endpoint))
+            if not primary.done() and self.rate_limiter.available(url) and self.hedger.try_spend():
+                logger.debug("Hedging slow request to {endpoint}", endpoint=endpoint)
+                racers.add(asyncio.ensure_future(self._fetch(url, params, headers)))
+            while True:
+                done, racers = await asyncio.wait(racers, return_when=asyncio.FIRST_COMPLETED)
+                # Both attempts can finish in the same loop iteration; prefer a success,
+                # and the primary among equals.
+                ranked = sorted(
+                    done, key=lambda task: (task.exception() is not None, task is not primary)
+                )
+                winner = ranked[0]
+                if winner.exception() is None or not racers:
+                    break
+            if winner is not primary:
+                self.hedger.won += 1
+            self.hedger.record(endpoint, loop.time() - started)
+            return winner.result()
+        finally:
+            for task in racers:
+                task.cancel()
+
+    async def _fetch(
+        self,
+        url: str,
+        params: dict | None = None,
+        headers: dict | None = None,
+        granted: asyncio.Event | None = None,
+    ) -> HttpResponse:
+        """
+        Send one GET through the retrying session and buffer the body.
+
+        Each attempt the session makes waits for a rate-limit token in the limiter's
+        trace hook, and failed attempts are counted by the breaker's trace hook.
+
+        Args:
+            granted (asyncio.Event | None): Set once the first attempt has its token.
+
+        Raises:
+            CircuitOpenError: If the host's circuit is open.
+        """
+        self.breaker.before_request(url)
+        record = RequestRecord(endpoint_of(url))
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        request_ctx: dict[str, Any] = {"http_record": record}
+        if granted is not None:
+            request_ctx["token_granted"] = granted
+        raw = None
+        try:
+            raw = await self.session.get(
+                url,
+                params=params,
+                headers=headers,
+                timeout=20,
+                trace_request_ctx=request_ctx,
+            )
+            response = await HttpResponse.read_from(raw)
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as exc:
+            # Failed attempts were counted by the trace hook; only a body that broke
+            # off after the headers arrived is left to record here.
+            if raw is not None:
+                self.breaker.record_failure(url)
+            record.error = type(exc).__name__
+            raise
+        except BaseException as exc:
+            # Not the host's fault (e.g. cancellation); free a half-open probe slot.
+            self.breaker.release(url)
+            record.error = type(exc).__name__
+            raise
+        else:
+            record.status = response.status
+            record.bytes = len(response.body)
+        finally:
+            record.total = loop.time() - started
+            self.metrics.observe(record)
+        if response.status < 500:
+            self.breaker.record_success(url)
+        if response.status == 429:
+            self.report_throttled(url, parse_retry_after(response.headers.get("Retry-After")))
         return response
 
+    def report_throttled(self, url: str, retry_after: float | None = None) -> None:
+        """Pause requests to ``url``'s host, e.g. after a throttling notice in a 200 body."""
+        self.rate_limiter.penalize(url, retry_after)
+
     async def post(
         self, url: str, headers: dict | None = None, json: dict | None = None
     ) -> aiohttp.ClientResponse:
@@ -40,8 +677,49 @@ class AsyncHttpClient:
         response.raise_for_status()
         return response
 
+    def metrics_report(self) -> dict[str, Any]:
+        """Per-endpoint request histograms plus rate-limit, coalescing and hedge counters."""
+        return {
+            "endpoints": self.metrics.to_dict(),
+            "rate_limits": self.rate_limiter.metrics(),
+            "coalesced": self.coalesced,
+            "hedges": {"sent": self.hedger.sent, "won": self.hedger.won},
+        }
+
     async def close(self) -> None:
-        """Close the client session."""
+        """
+        Close the client session, saving hedge latencies and writing request metrics
+        if paths for them are configured.
+
+        Requests still in flight are cancelled first, so tearing down their connections
+        is not mistaken for a host failure.
+        """
         if not self._closed:
+            pending = list(self._inflight.values())
+            for shared in pending:
+                shared.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
             await self.session.close()
             self._closed = True
+            self.hedger.save()
+            if self.metrics_path and self.metrics.endpoints:
+                path = dump_json(self.metrics_report(), self.metrics_path)
+                logger.info("HTTP request metrics written to {path}", path=str(path))
+
+
+def _request_key(
+    url: str, params: Mapping[str, Any] | None, headers: Mapping[str, str] | None
+) -> str:
+    """Identity of a GET for coalescing: URL, query and request headers."""
+    header_items = sorted((k.lower(), str(v)) for k, v in (headers or {}).items())
+    return f"{HttpCache.key(url, params)}:{header_items}"
+
+
+@asynccontextmanager
+async def client_scope(client: AsyncHttpClient | None = None) -> AsyncIterator[AsyncHttpClient]:
+    """Yield ``client`` untouched, or a temporary client that is closed on exit."""
+    if client is not None:
+        yield client
+        return
+    async with AsyncHttpClient() as owned:
+        yield owned
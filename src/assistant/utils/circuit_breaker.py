@@ -0,0 +1,185 @@
+"""Per-host circuit breaker with state persisted between runs."""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+import aiohttp
+from yarl import URL
+
+from assistant.config import HttpSettings
+from assistant.utils.logging import logger
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(aiohttp.ClientError):
+    """Raised instead of sending a request to a host whose circuit is open."""
+
+    def __init__(self, host: str, retry_in: float) -> None:
+        super().__init__(f"Circuit open for {host}; retrying in {retry_in:.0f}s")
+        self.host = host
+        self.retry_in = retry_in
+
+
+class CircuitBreaker:
+    """
+    Fail fast on hosts that keep failing.
+
+    Each host starts ``closed``. ``failure_threshold`` consecutive failed attempts
+    (connection errors, timeouts or 5xx responses, counting every retry through
+    :meth:`trace_config`) open its circuit, and requests then raise
+    :class:`CircuitOpenError` without touching the network, so fetchers drop straight
+    into their fallback paths. A circuit that opens mid-call also stops the remaining
+    retries of that call. After ``reset_timeout`` seconds the circuit is
+    ``half_open``: one probe request goes out, closing the circuit on success and
+    reopening it on failure. With a ``state_path`` the per-host state is saved as JSON
+    on every change, so a host that was down at the end of one run is probed rather
+    than retried in full on the next.
+
+    Args:
+        failure_threshold (int): Consecutive failures that open a circuit.
+        reset_timeout (float): Seconds an open circuit waits before a probe.
+        state_path (str | Path | None): JSON file to persist state in; memory only if None.
+        clock (Callable[[], float]): Wall-clock source, injectable for tests.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 3,
+        reset_timeout: float = 300.0,
+        state_path: str | Path | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if failure_threshold <= 0:
+            raise ValueError("`failure_threshold` must be > 0.")
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state_path = Path(state_path) if state_path else None
+        self._clock = clock
+        self._hosts: Dict[str, Dict[str, Any]] = self._load()
+        self._probing: set[str] = set()
+
+    @classmethod
+    def from_settings(cls, http_settings: HttpSettings) -> "CircuitBreaker":
+        return cls(
+            failure_threshold=http_settings.breaker_failure_threshold,
+            reset_timeout=http_settings.breaker_reset_timeout,
+            state_path=http_settings.breaker_state_path,
+        )
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        if self.state_path is None or not self.state_path.is_file():
+            return {}
+        try:
+            with open(self.state_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable circuit breaker state: {e}")
+            return {}
+
+    def _save(self) -> None:
+        if self.state_path is None:
+            return
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.state_path.with_suffix(".json.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self._hosts, f, indent=2)
+        os.replace(tmp, self.state_path)
+
+    def state(self, url: str | URL) -> str:
+        """Current state of ``url``'s host, moving ``open`` to ``half_open`` once due."""
+        host = _host(url)
+        entry = self._hosts.get(host)
+        if entry is None:
+            return CLOSED
+        if entry["state"] == OPEN and self._clock() - entry["opened_at"] >= self.reset_timeout:
+            entry["state"] = HALF_OPEN
+            self._save()
+        return entry["state"]
+
+    def before_request(self, url: str | URL) -> None:
+        """
+        Admit a request to ``url`` or fail fast.
+
+        Raises:
+            CircuitOpenError: If the host's circuit is open, or half-open with its
+            probe already in flight.
+        """
+        host = _host(url)
+        state = self.state(url)
+        if state == CLOSED:
+            return
+        if state == HALF_OPEN and host not in self._probing:
+            self._probing.add(host)
+            logger.info("Probing {host} after its circuit cooled down", host=host)
+            return
+        opened_at = self._hosts[host]["opened_at"]
+        raise CircuitOpenError(host, max(opened_at + self.reset_timeout - self._clock(), 0.0))
+
+    def trace_config(self) -> aiohttp.TraceConfig:
+        """
+        ``aiohttp.TraceConfig`` that records the outcome of every attempt a session sends.
+
+        Retries (``current_attempt`` > 1 in the retry client's trace context) are
+        checked against the breaker first, so they are not sent once the circuit opened.
+        The final success is recorded by the caller with :meth:`record_success`.
+        """
+        trace = aiohttp.TraceConfig()
+
+        async def on_request_start(_session, ctx, params) -> None:
+            request_ctx = ctx.trace_request_ctx
+            if isinstance(request_ctx, dict) and request_ctx.get("current_attempt", 1) > 1:
+                self.before_request(params.url)
+
+        async def on_request_end(_session, _ctx, params) -> None:
+            if params.response.status >= 500:
+                self.record_failure(params.url)
+
+        async def on_request_exception(_session, _ctx, params) -> None:
+            if isinstance(params.exception, (aiohttp.ClientConnectionError, TimeoutError)):
+                self.record_failure(params.url)
+
+        trace.on_request_start.append(on_request_start)
+        trace.on_request_end.append(on_request_end)
+        trace.on_request_exception.append(on_request_exception)
+        return trace
+
+    def release(self, url: str | URL) -> None:
+        """Forget an in-flight probe whose outcome says nothing about the host."""
+        self._probing.discard(_host(url))
+
+    def record_success(self, url: str | URL) -> None:
+        host = _host(url)
+        self._probing.discard(host)
+        if host in self._hosts:
+            if self._hosts[host]["state"] != CLOSED:
+                logger.info("Circuit for {host} closed again", host=host)
+            del self._hosts[host]
+            self._save()
+
+    def record_failure(self, url: str | URL) -> None:
+        host = _host(url)
+        self._probing.discard(host)
+        entry = self._hosts.setdefault(host, {"state": CLOSED, "failures": 0, "opened_at": 0.0})
+        entry["failures"] += 1
+        if entry["state"] == HALF_OPEN or entry["failures"] >= self.failure_threshold:
+            if entry["state"] != OPEN:
+                logger.warning(
+                    "Opening circuit for {host} after {failures} failure(s)",
+                    host=host,
+                    failures=entry["failures"],
+                )
+            entry["state"] = OPEN
+            entry["opened_at"] = self._clock()
+        self._save()
+
+
+def _host(url: str | URL) -> str:
+    return URL(str(url)).host or ""
@@ -1,7 +1,7 @@
 # src/assistant/utils/dto.py
 from __future__ import annotations
-from dataclasses import dataclass
-from typing import Optional, List
+from dataclasses import dataclass, field
+from typing import Optional, List, Union
 
 # --- Existing DTOs ---
 
@@ -34,6 +34,39 @@ class PaperItem:
     url: str
 
 
+# --- Wire schemas decoded straight from JSON payloads ---
+
+
+@dataclass(frozen=True)
+class FredObservation:
+    date: str
+    value: str  # "." on days without a print
+
+
+@dataclass(frozen=True)
+class FredObservations:
+    observations: List[FredObservation] = field(default_factory=list)
+
+
+@dataclass(frozen=True)
+class S2Author:
+    name: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class S2Paper:
+    title: Optional[str] = None
+    url: Optional[str] = None
+    # Lenient so one odd value (e.g. "n/a") cannot fail the page; non-ints become None.
+    year: Union[int, str, None] = None
+    authors: Optional[List[Optional[S2Author]]] = None
+
+
+@dataclass(frozen=True)
+class S2SearchPage:
+    data: Optional[List[S2Paper]] = None
+
+
 @dataclass(frozen=True)
 class DigestContext:
     """A single object to hold all data for rendering the digest template."""
@@ -44,6 +77,8 @@ class DigestContext:
     cpi: List[CpiRelease]
     arxiv: List[PaperItem]
     s2: List[PaperItem]
+    # Sources that had not answered when the digest deadline expired
+    missed_sources: List[str] = field(default_factory=list)
     # Add other fields as you implement the new modules
     # market_summary: str
     # alpha_idea: Optional[AlphaIdea]
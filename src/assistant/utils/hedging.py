@@ -0,0 +1,106 @@
+"""Opt-in request hedging for endpoints with a long latency tail."""
+
+from __future__ import annotations
+
+import json
+import os
+from collections import deque
+from pathlib import Path
+from typing import Deque, Dict, Mapping
+
+import numpy as np
+from yarl import URL
+
+from assistant.config import HedgeSettings, HttpSettings
+from assistant.utils.logging import logger
+
+# Recent latencies kept per endpoint when estimating the hedge threshold.
+_WINDOW = 200
+
+
+class Hedger:
+    """
+    Decide when a slow GET deserves a duplicate request.
+
+    Endpoints opt in through ``policies`` keyed by ``host`` or ``host/path`` prefix
+    (the longest match wins). For each one the hedger keeps a window of recent
+    latencies; once ``min_samples`` are in, the hedge delay is their ``percentile``,
+    before that it is ``initial_delay``. ``budget`` caps how many hedges the client
+    may send in total, so a slow day cannot double quota use. A run makes only a
+    handful of calls per endpoint, so with a ``state_path`` the windows are loaded
+    from and saved back to a JSON file, letting the samples build up across runs.
+
+    Args:
+        policies (Mapping[str, HedgeSettings]): Hedge settings by endpoint prefix.
+        budget (int): Maximum number of hedged requests for the client's lifetime.
+        state_path (str | Path | None): JSON file to persist latencies in; memory only if None.
+    """
+
+    def __init__(
+        self,
+        policies: Mapping[str, HedgeSettings] | None = None,
+        budget: int = 0,
+        state_path: str | Path | None = None,
+    ) -> None:
+        self.policies = dict(policies or {})
+        self.budget = budget
+        self.state_path = Path(state_path) if state_path else None
+        self.sent = 0
+        self.won = 0
+        self._latencies: Dict[str, Deque[float]] = self._load()
+
+    @classmethod
+    def from_settings(cls, http_settings: HttpSettings) -> "Hedger":
+        return cls(
+            http_settings.hedging, http_settings.hedge_budget, http_settings.hedge_state_path
+        )
+
+    def _load(self) -> Dict[str, Deque[float]]:
+        if self.state_path is None or not self.state_path.is_file():
+            return {}
+        try:
+            with open(self.state_path, "r", encoding="utf-8") as f:
+                stored = json.load(f)
+            return {
+                endpoint: deque(map(float, samples), maxlen=_WINDOW)
+                for endpoint, samples in stored.items()
+                if endpoint in self.policies
+            }
+        except (OSError, ValueError, TypeError, AttributeError) as e:
+            logger.warning(f"Ignoring unreadable hedge latency state: {e}")
+            return {}
+
+    def save(self) -> None:
+        """Write the latency windows to ``state_path``, if one is configured."""
+        if self.state_path is None or not self._latencies:
+            return
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.state_path.with_suffix(".json.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({k: [round(v, 4) for v in d] for k, d in self._latencies.items()}, f)
+        os.replace(tmp, self.state_path)
+
+    def endpoint(self, url: str | URL) -> str | None:
+        """Policy key matching ``url``, or None if the endpoint is not hedged."""
+        target = URL(str(url))
+        location = f"{target.host}{target.path}"
+        matches = [prefix for prefix in self.policies if location.startswith(prefix)]
+        return max(matches, key=len) if matches else None
+
+    def delay(self, endpoint: str) -> float:
+        """Seconds to wait for the first response before sending a hedge."""
+        policy = self.policies[endpoint]
+        samples = self._latencies.get(endpoint, ())
+        if len(samples) < policy.min_samples:
+            return policy.initial_delay
+        return float(np.percentile(np.fromiter(samples, dtype=float), policy.percentile))
+
+    def record(self, endpoint: str, seconds: float) -> None:
+        self._latencies.setdefault(endpoint, deque(maxlen=_WINDOW)).append(seconds)
+
+    def try_spend(self) -> bool:
+        """Reserve one hedge from the budget; False once it is used up."""
+        if self.sent >= self.budget:
+            return False
+        self.sent += 1
+        return True
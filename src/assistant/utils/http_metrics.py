@@ -0,0 +1,199 @@
+"""Per-request timing and size instrumentation for the async HTTP client."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Dict, List
+
+import aiohttp
+from yarl import URL
+
+# Upper bounds of the latency histogram buckets in milliseconds (last bucket is open).
+LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1_000, 2_500, 5_000, 10_000, 30_000)
+# Upper bounds of the response-size histogram buckets in bytes.
+SIZE_BUCKETS = (1 << 10, 8 << 10, 64 << 10, 512 << 10, 4 << 20, 32 << 20)
+TIMINGS = ("dns", "connect", "ttfb", "total")
+CACHE_OUTCOMES = ("hit", "revalidated", "miss")
+
+
+def endpoint_of(url: str | URL) -> str:
+    """Endpoint label for metrics: host and path, never the query (it may hold API keys)."""
+    target = URL(str(url))
+    return f"{target.host}{target.path}"
+
+
+@dataclass
+class RequestRecord:
+    """Timings (seconds) and counters collected for one logical GET, across retries."""
+
+    endpoint: str
+    attempts: int = 0
+    dns: float = 0.0
+    connect: float = 0.0
+    ttfb: float | None = None
+    total: float | None = None
+    bytes: int = 0
+    status: int | None = None
+    error: str | None = None
+
+
+@dataclass
+class Histogram:
+    """Fixed-bucket histogram; ``counts[i]`` counts values ``<= bounds[i]``, plus overflow."""
+
+    bounds: tuple[float, ...]
+    counts: List[int] = field(default_factory=list)
+    total: float = 0.0
+    n: int = 0
+    max: float = 0.0
+
+    def __post_init__(self) -> None:
+        if not self.counts:
+            self.counts = [0] * (len(self.bounds) + 1)
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.n += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "bounds": list(self.bounds),
+            "counts": self.counts,
+            "count": self.n,
+            "sum": round(self.total, 3),
+            "mean": round(self.total / self.n, 3) if self.n else 0.0,
+            "max": round(self.max, 3),
+        }
+
+
+@dataclass
+class EndpointStats:
+    requests: int = 0
+    errors: int = 0
+    retries: int = 0
+    bytes: int = 0
+    statuses: Dict[str, int] = field(default_factory=dict)
+    cache: Dict[str, int] = field(default_factory=lambda: dict.fromkeys(CACHE_OUTCOMES, 0))
+    timings_ms: Dict[str, Histogram] = field(
+        default_factory=lambda: {name: Histogram(LATENCY_BUCKETS_MS) for name in TIMINGS}
+    )
+    sizes: Histogram = field(default_factory=lambda: Histogram(SIZE_BUCKETS))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "retries": self.retries,
+            "bytes": self.bytes,
+            "statuses": self.statuses,
+            "cache": self.cache,
+            "timings_ms": {name: h.to_dict() for name, h in self.timings_ms.items()},
+            "response_bytes": self.sizes.to_dict(),
+        }
+
+
+class HttpMetrics:
+    """
+    Aggregate per-endpoint latency, size, retry and cache histograms.
+
+    :meth:`trace_config` returns an ``aiohttp.TraceConfig`` that fills the
+    :class:`RequestRecord` passed as ``trace_request_ctx={"http_record": record}``:
+    DNS resolution and connection setup time (summed over attempts), time to response
+    headers of the final attempt, and the number of attempts made by the retry
+    client. The caller sets ``total``, ``bytes`` and ``status`` and hands the record to
+    :meth:`observe`.
+    """
+
+    def __init__(self) -> None:
+        self.endpoints: Dict[str, EndpointStats] = {}
+
+    def _stats(self, endpoint: str) -> EndpointStats:
+        return self.endpoints.setdefault(endpoint, EndpointStats())
+
+    def trace_config(self) -> aiohttp.TraceConfig:
+        trace = aiohttp.TraceConfig(trace_config_ctx_factory=SimpleNamespace)
+
+        def _record(ctx: SimpleNamespace) -> RequestRecord | None:
+            request_ctx = ctx.trace_request_ctx
+            return request_ctx.get("http_record") if isinstance(request_ctx, dict) else None
+
+        def _now() -> float:
+            return asyncio.get_running_loop().time()
+
+        async def on_request_start(_session, ctx, _params) -> None:
+            record = _record(ctx)
+            if record is not None:
+                record.attempts += 1
+                ctx.started = _now()
+
+        async def on_dns_start(_session, ctx, _params) -> None:
+            ctx.dns_started = _now()
+
+        async def on_dns_end(_session, ctx, _params) -> None:
+            record = _record(ctx)
+            if record is not None and hasattr(ctx, "dns_started"):
+                record.dns += _now() - ctx.dns_started
+
+        async def on_connect_start(_session, ctx, _params) -> None:
+            ctx.connect_started = _now()
+
+        async def on_connect_end(_session, ctx, _params) -> None:
+            record = _record(ctx)
+            if record is not None and hasattr(ctx, "connect_started"):
+                record.connect += _now() - ctx.connect_started
+
+        async def on_request_end(_session, ctx, _params) -> None:
+            record = _record(ctx)
+            if record is not None and hasattr(ctx, "started"):
+                record.ttfb = _now() - ctx.started
+
+        trace.on_request_start.append(on_request_start)
+        trace.on_dns_resolvehost_start.append(on_dns_start)
+        trace.on_dns_resolvehost_end.append(on_dns_end)
+        trace.on_connection_create_start.append(on_connect_start)
+        trace.on_connection_create_end.append(on_connect_end)
+        trace.on_request_end.append(on_request_end)
+        return trace
+
+    def observe(self, record: RequestRecord) -> None:
+        """Fold a finished request into its endpoint's histograms."""
+        stats = self._stats(record.endpoint)
+        stats.requests += 1
+        stats.retries += max(record.attempts - 1, 0)
+        stats.bytes += record.bytes
+        if record.error is not None:
+            stats.errors += 1
+        if record.status is not None:
+            key = str(record.status)
+            stats.statuses[key] = stats.statuses.get(key, 0) + 1
+            stats.sizes.observe(record.bytes)
+        for name in TIMINGS:
+            value = getattr(record, name)
+            if value is not None and (value > 0 or name in ("ttfb", "total")):
+                stats.timings_ms[name].observe(value * 1_000)
+
+    def count_cache(self, url: str | URL, outcome: str) -> None:
+        """Count a cache ``hit``, ``revalidated`` (304) or ``miss`` for ``url``."""
+        self._stats(endpoint_of(url)).cache[outcome] += 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {endpoint: stats.to_dict() for endpoint, stats in sorted(self.endpoints.items())}
+
+
+def dump_json(payload: Dict[str, Any], path: str | Path) -> Path:
+    """Write ``payload`` to ``path`` atomically."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(payload, f, indent=2)
+    os.replace(tmp, path)
+    return path
@@ -0,0 +1,215 @@
+"""Per-host token-bucket rate limiting for the async HTTP client."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Awaitable, Callable, Dict, Mapping
+
+import aiohttp
+from yarl import URL
+
+from assistant.config import RateLimitSettings
+from assistant.utils.logging import logger
+
+
+class TokenBucket:
+    """
+    Async token bucket: ``calls`` tokens per ``period`` seconds, holding at most ``burst``.
+
+    :meth:`acquire` queues callers in arrival order and sleeps until a token is
+    available instead of letting a request spend upstream quota it does not have.
+
+    Args:
+        calls (int): Tokens added per ``period``.
+        period (float): Refill period in seconds.
+        burst (int | None): Bucket capacity; defaults to ``calls``.
+        clock (Callable[[], float]): Monotonic time source, injectable for tests.
+        sleep (Callable[[float], Awaitable[None]]): Sleep function, injectable for tests.
+    """
+
+    def __init__(
+        self,
+        calls: int,
+        period: float,
+        burst: int | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ) -> None:
+        if calls <= 0 or period <= 0:
+            raise ValueError("`calls` and `period` must be > 0.")
+        self.rate = calls / period
+        self.capacity = float(burst or calls)
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._blocked_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self) -> float:
+        """Take one token, waiting as needed; returns the seconds spent waiting."""
+        started = self._clock()
+        async with self._lock:
+            while True:
+                now = self._clock()
+                self._refill(now)
+                if now >= self._blocked_until and self._tokens >= 1:
+                    self._tokens -= 1
+                    return self._clock() - started
+                delay = max(self._blocked_until - now, (1 - self._tokens) / self.rate)
+                await self._sleep(delay)
+
+    def available(self) -> bool:
+        """True if a token can be taken right now without queueing behind anyone."""
+        if self._lock.locked():
+            return False
+        now = self._clock()
+        self._refill(now)
+        return now >= self._blocked_until and self._tokens >= 1
+
+    def penalize(self, seconds: float) -> None:
+        """Drain the bucket and hold every caller back for ``seconds`` (e.g. ``Retry-After``)."""
+        now = self._clock()
+        self._refill(now)
+        self._tokens = 0.0
+        self._blocked_until = max(self._blocked_until, now + seconds)
+
+
+@dataclass
+class WaitStats:
+    """Queueing time accumulated by one host's bucket."""
+
+    requests: int = 0
+    waited: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+    throttled: int = 0
+
+    def record(self, wait: float) -> None:
+        self.requests += 1
+        if wait > 0:
+            self.waited += 1
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+
+
+class RateLimiter:
+    """
+    Token buckets keyed by host; hosts without a configured limit pass straight through.
+
+    Args:
+        limits (Mapping[str, RateLimitSettings]): Limits keyed by host name.
+        clock (Callable[[], float]): Monotonic time source, injectable for tests.
+        sleep (Callable[[float], Awaitable[None]]): Sleep function, injectable for tests.
+    """
+
+    def __init__(
+        self,
+        limits: Mapping[str, RateLimitSettings] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ) -> None:
+        self.limits = dict(limits or {})
+        self._clock = clock
+        self._sleep = sleep
+        self._buckets: Dict[str, TokenBucket] = {}
+        self.stats: Dict[str, WaitStats] = {}
+
+    def _bucket(self, host: str) -> TokenBucket | None:
+        limit = self.limits.get(host)
+        if limit is None:
+            return None
+        if host not in self._buckets:
+            self._buckets[host] = TokenBucket(
+                limit.calls, limit.period, limit.burst, clock=self._clock, sleep=self._sleep
+            )
+        return self._buckets[host]
+
+    async def acquire(self, url: str | URL) -> float:
+        """Wait for ``url``'s host to have capacity; returns the seconds waited."""
+        host = URL(str(url)).host or ""
+        bucket = self._bucket(host)
+        if bucket is None:
+            return 0.0
+        wait = await bucket.acquire()
+        self.stats.setdefault(host, WaitStats()).record(wait)
+        if wait > 0:
+            logger.debug("Rate limiter held {host} request for {wait:.2f}s", host=host, wait=wait)
+        return wait
+
+    def available(self, url: str | URL) -> bool:
+        """True if a request to ``url`` would get its token without waiting."""
+        bucket = self._bucket(URL(str(url)).host or "")
+        return bucket is None or bucket.available()
+
+    def trace_config(self) -> aiohttp.TraceConfig:
+        """
+        ``aiohttp.TraceConfig`` that takes a token before every attempt a session sends.
+
+        Acquiring in ``on_request_start`` rather than once per call means the retries of
+        a retrying session are rate-limited too, so failures cannot multiply the rate. An
+        ``asyncio.Event`` passed as ``trace_request_ctx={"token_granted": event}`` is set
+        once the first attempt has its token.
+        """
+        trace = aiohttp.TraceConfig()
+
+        async def on_request_start(_session, ctx, params) -> None:
+            await self.acquire(params.url)
+            request_ctx = ctx.trace_request_ctx
+            if isinstance(request_ctx, dict) and "token_granted" in request_ctx:
+                request_ctx["token_granted"].set()
+
+        trace.on_request_start.append(on_request_start)
+        return trace
+
+    def penalize(self, url: str | URL, retry_after: float | None = None) -> None:
+        """Back off ``url``'s host after it signalled throttling (HTTP 429 or similar)."""
+        host = URL(str(url)).host or ""
+        bucket = self._bucket(host)
+        if bucket is None:
+            return
+        seconds = retry_after if retry_after is not None else self.limits[host].period
+        bucket.penalize(seconds)
+        self.stats.setdefault(host, WaitStats()).throttled += 1
+        logger.warning(
+            "{host} throttled the client; pausing requests for {seconds:.1f}s",
+            host=host,
+            seconds=seconds,
+        )
+
+    def metrics(self) -> Dict[str, Dict[str, float]]:
+        """Per-host request counts and queueing times."""
+        return {
+            host: {
+                "requests": s.requests,
+                "waited": s.waited,
+                "throttled": s.throttled,
+                "total_wait_s": round(s.total_wait, 3),
+                "mean_wait_s": round(s.total_wait / s.requests, 3) if s.requests else 0.0,
+                "max_wait_s": round(s.max_wait, 3),
+            }
+            for host, s in self.stats.items()
+        }
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Seconds to wait from a ``Retry-After`` header (delta-seconds or HTTP date)."""
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max((when - datetime.now(timezone.utc)).total_seconds(), 0.0)
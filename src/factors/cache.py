@@ -0,0 +1,135 @@
+"""Content-addressed on-disk cache for factor results."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Callable, Mapping
+
+import pandas as pd
+
+from assistant.utils.logging import logger
+
+DEFAULT_CACHE_DIR = Path("artifacts") / "factor_cache"
+DEFAULT_MAX_BYTES = 1 << 30  # 1 GiB
+
+
+def panel_fingerprint(df: pd.DataFrame, columns: list[str] | None = None) -> str:
+    """SHA-256 over the values, column names and dtypes of ``df`` (row order matters)."""
+    frame = df[columns] if columns is not None else df
+    digest = hashlib.sha256()
+    digest.update(json.dumps([(str(c), str(t)) for c, t in frame.dtypes.items()]).encode())
+    digest.update(pd.util.hash_pandas_object(frame, index=False).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+class FactorCache:
+    """
+    Factor results stored as compressed Parquet files named by a content hash.
+
+    The key combines a fingerprint of the input panel with the factor parameters
+    (e.g. ``lookback``, ``skip`` and column names), so a repeat run on unchanged data
+    is a single file read. Reads refresh a file's modification time and writes evict
+    the least recently used entries once the directory exceeds ``max_bytes``.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path = DEFAULT_CACHE_DIR,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        compression: str = "zstd",
+    ) -> None:
+        if max_bytes <= 0:
+            raise ValueError("`max_bytes` must be > 0.")
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.compression = compression
+
+    def key(
+        self, crsp_df: pd.DataFrame, params: Mapping[str, Any], columns: list[str] | None = None
+    ) -> str:
+        """Cache key for ``params`` applied to ``crsp_df`` (restricted to ``columns``)."""
+        payload = json.dumps(dict(params), sort_keys=True, default=str)
+        digest = hashlib.sha256(panel_fingerprint(crsp_df, columns).encode())
+        digest.update(payload.encode())
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.parquet"
+
+    def __contains__(self, key: str) -> bool:
+        return self._path(key).is_file()
+
+    def get(self, key: str) -> pd.DataFrame | None:
+        """Return the cached frame for ``key`` or None, marking it as recently used."""
+        path = self._path(key)
+        try:
+            df = pd.read_parquet(path)
+        except FileNotFoundError:
+            return None
+        os.utime(path)
+        return df
+
+    def put(self, key: str, df: pd.DataFrame) -> Path:
+        """Store ``df`` under ``key`` atomically, then enforce the size budget."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._path(key)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        df.to_parquet(tmp, compression=self.compression)
+        os.replace(tmp, path)
+        self.evict()
+        return path
+
+    def evict(self) -> list[Path]:
+        """Delete least recently used entries until the cache fits in ``max_bytes``."""
+        entries = []
+        for path in self.directory.glob("*.parquet"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        entries.sort()
+
+        total = sum(size for _, size, _ in entries)
+        removed = []
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            removed.append(path)
+        if removed:
+            logger.debug("Evicted {count} factor cache entries", count=len(removed))
+        return removed
+
+    def get_or_compute(
+        self,
+        crsp_df: pd.DataFrame,
+        params: Mapping[str, Any],
+        compute: Callable[[], pd.DataFrame],
+        columns: list[str] | None = None,
+        key: str | None = None,
+    ) -> pd.DataFrame:
+        """
+        Return the cached result for ``(crsp_df, params)`` or compute and store it.
+
+        Pass ``key`` when it has already been computed with :meth:`key` to avoid
+        hashing the panel twice. Without a Parquet engine the result is computed
+        uncached rather than failing.
+        """
+        if key is None:
+            key = self.key(crsp_df, params, columns)
+        try:
+            cached = self.get(key)
+        except ImportError as exc:
+            logger.warning("Factor cache unavailable, computing uncached: {error}", error=exc)
+            return compute()
+        if cached is not None:
+            logger.info("Factor cache hit for {key}", key=key[:12])
+            return cached
+        result = compute()
+        self.put(key, result)
+        return result
@@ -0,0 +1,248 @@
+"""Shared-pass engine computing several rolling-window factors over one sorted panel."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Callable, Sequence
+
+import numpy as np
+import pandas as pd
+
+from factors.momentum import (
+    _group_layout,
+    _grouped_cumsum,
+    _load_panel,
+    _log_return_prefix,
+    _LogReturnPrefix,
+    _window_log_sum,
+)
+from factors.panel import ReturnPanel
+
+
+@dataclass(frozen=True)
+class FactorSpec:
+    """A registered factor: a column name and a kernel over :class:`PanelWindows`."""
+
+    name: str
+    compute: Callable[["PanelWindows"], np.ndarray]
+    description: str = ""
+
+
+FACTOR_REGISTRY: dict[str, FactorSpec] = {}
+
+
+def register_factor(name: str, description: str = ""):
+    """Decorator adding a ``PanelWindows -> np.ndarray`` kernel to :data:`FACTOR_REGISTRY`."""
+
+    def decorator(func: Callable[["PanelWindows"], np.ndarray]):
+        if name in FACTOR_REGISTRY:
+            raise ValueError(f"Factor '{name}' is already registered.")
+        FACTOR_REGISTRY[name] = FactorSpec(name=name, compute=func, description=description)
+        return func
+
+    return decorator
+
+
+class _Prefix:
+    """Per-PERMNO prefix sums of one series plus a global count of its valid rows."""
+
+    def __init__(self, values: np.ndarray, valid: np.ndarray, group_ids: np.ndarray) -> None:
+        self.sums = _grouped_cumsum(np.where(valid, values, 0.0), group_ids)
+        self.counts = np.cumsum(valid, dtype=np.int64)
+
+
+class PanelWindows:
+    """
+    Lazily built prefix sums shared by every factor kernel in a single engine run.
+
+    Rows are sorted by PERMNO and date. Each cumulative sum (log returns, returns,
+    squared returns, market returns and return x market cross-products) is built at
+    most once, on first use, and any trailing-window statistic is then a pair of
+    prefix lookups per row.
+    """
+
+    def __init__(self, permnos: np.ndarray, returns: np.ndarray, market: np.ndarray) -> None:
+        self.permnos = permnos
+        self.returns = returns
+        self.market = market
+        self.group_ids, self.positions = _group_layout(permnos)
+        self._pair_valid = np.isfinite(returns) & np.isfinite(market)
+
+    def __len__(self) -> int:
+        return len(self.returns)
+
+    @cached_property
+    def log_returns(self) -> _LogReturnPrefix:
+        return _log_return_prefix(self.permnos, self.returns)
+
+    @cached_property
+    def ret(self) -> _Prefix:
+        return _Prefix(self.returns, np.isfinite(self.returns), self.group_ids)
+
+    @cached_property
+    def ret_sq(self) -> _Prefix:
+        return _Prefix(self.returns**2, np.isfinite(self.returns), self.group_ids)
+
+    @cached_property
+    def pair_ret(self) -> _Prefix:
+        return _Prefix(self.returns, self._pair_valid, self.group_ids)
+
+    @cached_property
+    def pair_ret_sq(self) -> _Prefix:
+        return _Prefix(self.returns**2, self._pair_valid, self.group_ids)
+
+    @cached_property
+    def pair_mkt(self) -> _Prefix:
+        return _Prefix(self.market, self._pair_valid, self.group_ids)
+
+    @cached_property
+    def pair_mkt_sq(self) -> _Prefix:
+        return _Prefix(self.market**2, self._pair_valid, self.group_ids)
+
+    @cached_property
+    def pair_cross(self) -> _Prefix:
+        return _Prefix(self.returns * self.market, self._pair_valid, self.group_ids)
+
+    def momentum(self, lookback: int, skip: int) -> np.ndarray:
+        """Compounded return over rows ``t - skip - lookback`` .. ``t - skip - 1``."""
+        return np.expm1(_window_log_sum(self.log_returns, lookback, skip))
+
+    def window(self, window: int, min_periods: int, *prefixes: _Prefix):
+        """
+        Trailing sums over rows ``t - window`` .. ``t - 1`` of each PERMNO.
+
+        Returns the row indexes that have at least ``min_periods`` valid observations,
+        their observation counts and one array of window sums per prefix.
+        """
+        n_prior = np.minimum(self.positions, window)
+        rows = np.flatnonzero(n_prior > 0)
+        hi = rows - 1
+        lo = rows - n_prior[rows]
+        at_start = self.positions[lo] == 0
+
+        count_source = prefixes[0].counts
+        counts = count_source[hi] - np.where(lo > 0, count_source[np.maximum(lo - 1, 0)], 0)
+        keep = counts >= min_periods
+        rows, hi, lo, at_start, counts = (
+            rows[keep],
+            hi[keep],
+            lo[keep],
+            at_start[keep],
+            counts[keep],
+        )
+
+        sums = [
+            p.sums[hi] - np.where(at_start, 0.0, p.sums[np.maximum(lo - 1, 0)]) for p in prefixes
+        ]
+        return rows, counts, sums
+
+
+@register_factor("momentum_12_1", "Compounded return from t-13 to t-2 (Jegadeesh-Titman).")
+def _momentum_12_1(panel: PanelWindows) -> np.ndarray:
+    return panel.momentum(lookback=12, skip=1)
+
+
+@register_factor("reversal_1_0", "Prior-month return; short-term reversal characteristic.")
+def _reversal_1_0(panel: PanelWindows) -> np.ndarray:
+    return panel.momentum(lookback=1, skip=0)
+
+
+@register_factor("volatility_12", "Sample std of the prior 12 monthly returns.")
+def _volatility_12(panel: PanelWindows) -> np.ndarray:
+    out = np.full(len(panel), np.nan)
+    rows, n, (s, ss) = panel.window(12, 12, panel.ret, panel.ret_sq)
+    var = (ss - s * s / n) / (n - 1)
+    out[rows] = np.sqrt(np.maximum(var, 0.0))
+    return out
+
+
+def _market_regression(panel: PanelWindows, window: int = 60, min_periods: int = 24):
+    rows, n, (sy, syy, sx, sxx, sxy) = panel.window(
+        window,
+        min_periods,
+        panel.pair_ret,
+        panel.pair_ret_sq,
+        panel.pair_mkt,
+        panel.pair_mkt_sq,
+        panel.pair_cross,
+    )
+    var_x = sxx - sx * sx / n
+    cov_xy = sxy - sx * sy / n
+    var_y = syy - sy * sy / n
+    with np.errstate(divide="ignore", invalid="ignore"):
+        beta = np.where(var_x > 0, cov_xy / var_x, np.nan)
+        resid_var = np.maximum(var_y - beta * cov_xy, 0.0) / (n - 2)
+    return rows, beta, resid_var
+
+
+@register_factor("beta_60", "OLS market beta over the prior 60 months (24 required).")
+def _beta_60(panel: PanelWindows) -> np.ndarray:
+    out = np.full(len(panel), np.nan)
+    rows, beta, _ = _market_regression(panel)
+    out[rows] = beta
+    return out
+
+
+@register_factor("idio_vol_60", "Residual std of the 60-month market regression.")
+def _idio_vol_60(panel: PanelWindows) -> np.ndarray:
+    out = np.full(len(panel), np.nan)
+    rows, _, resid_var = _market_regression(panel)
+    out[rows] = np.sqrt(resid_var)
+    return out
+
+
+def compute_factors(
+    crsp_df: pd.DataFrame | ReturnPanel,
+    factors: Sequence[str] | None = None,
+    market: pd.Series | None = None,
+    date_col: str = "date",
+    permno_col: str = "permno",
+    ret_col: str = "ret",
+) -> pd.DataFrame:
+    """
+    Compute registered factors in one pass over the PERMNO-sorted panel.
+
+    The panel is cleaned and sorted once; factors then share the prefix sums in
+    :class:`PanelWindows`, so e.g. ``beta_60`` and ``idio_vol_60`` reuse the same
+    return/market cross-products. All windows end at ``t - 1`` (or ``t - 2`` for
+    12-1 momentum), so values at date ``t`` only use information available before it.
+
+    Args:
+        crsp_df (pd.DataFrame | ReturnPanel): Input DataFrame containing stock return data,
+            or a :class:`~factors.panel.ReturnPanel`.
+        factors (Sequence[str] | None): Names from :data:`FACTOR_REGISTRY`; all when None.
+        market (pd.Series | None): Market return indexed by date (e.g. CRSP ``vwretd``).
+            Defaults to the equal-weighted cross-sectional mean of the panel's returns.
+        date_col (str): Column name for dates.
+        permno_col (str): Column name for stock identifiers (PERMNOs).
+        ret_col (str): Column name for returns.
+
+    Returns:
+        pd.DataFrame: Wide DataFrame with `date_col`, `permno_col` and one column per factor.
+
+    Raises:
+        ValueError: If required columns are missing or a factor name is unknown.
+    """
+    names = list(factors) if factors is not None else list(FACTOR_REGISTRY)
+    unknown = [name for name in names if name not in FACTOR_REGISTRY]
+    if unknown:
+        raise ValueError(f"Unknown factors: {unknown}. Registered: {sorted(FACTOR_REGISTRY)}")
+
+    keys, permnos, returns = _load_panel(crsp_df, date_col, permno_col, ret_col)
+    dates = keys[date_col]
+    if market is None:
+        market_by_row = pd.Series(returns, index=keys.index).groupby(dates).transform("mean")
+    else:
+        market_index = pd.to_datetime(market.index)
+        market_by_row = pd.Series(market.to_numpy(dtype=np.float64), index=market_index).reindex(
+            dates
+        )
+    panel = PanelWindows(permnos, returns, market_by_row.to_numpy(dtype=np.float64))
+
+    result = keys.copy()
+    for name in names:
+        result[name] = FACTOR_REGISTRY[name].compute(panel)
+    result[permno_col] = result[permno_col].astype(int)
+
+    return result
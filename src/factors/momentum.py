@@ -1,12 +1,20 @@
+from pathlib import Path
+from typing import NamedTuple, Sequence
+
 import numpy as np
 import pandas as pd
 from assistant.config import settings
 from assistant.utils.logging import logger
-from assistant.utils.async_http import AsyncHttpClient
+from assistant.utils.async_http import AsyncHttpClient, client_scope
+from factors.panel import ReturnPanel
+
+# Common (lookback, skip) pairs: 12-1 and 6-1 momentum, 36-13 long-term reversal and
+# 1-0 short-term reversal.
+DEFAULT_HORIZONS: tuple[tuple[int, int], ...] = ((12, 1), (6, 1), (36, 13), (1, 0))
 
 
 def calculate_12_1_momentum(
-    crsp_df: pd.DataFrame,
+    crsp_df: pd.DataFrame | ReturnPanel,
     date_col: str = "date",
     permno_col: str = "permno",
     ret_col: str = "ret",
@@ -24,7 +32,8 @@ def calculate_12_1_momentum(
     finance for portfolio construction and alpha generation.
 
     Args:
-        crsp_df (pd.DataFrame): Input DataFrame containing stock return data.
+        crsp_df (pd.DataFrame | ReturnPanel): Input DataFrame containing stock return data,
+            or a :class:`~factors.panel.ReturnPanel` (dates are then calendar month-ends).
         date_col (str): Column name for dates.
         permno_col (str): Column name for stock identifiers (PERMNOs).
         ret_col (str): Column name for returns.
@@ -41,37 +50,357 @@ def calculate_12_1_momentum(
         The 12-1 momentum factor is based on the seminal work by Jegadeesh and Titman (1993), which demonstrated
         that stocks with high past returns tend to outperform stocks with low past returns over intermediate
         horizons. This phenomenon is often attributed to behavioral biases and underreaction to information.
+
+        The rolling window is evaluated for every PERMNO at once from grouped prefix sums of log returns,
+        so the cost is a handful of vector operations regardless of how many stocks are in the panel.
     """
-    # Validate inputs
-    required_columns = {date_col, permno_col, ret_col}
-    if not required_columns.issubset(crsp_df.columns):
-        raise ValueError(f"Input DataFrame must contain the columns: {required_columns}")
+    # Validate inputs and prepare data
+    _validate_window(lookback, skip)
+    keys, permnos, returns = _load_panel(crsp_df, date_col, permno_col, ret_col)
+
+    # Momentum calculation over one PERMNO-sorted buffer (no per-group Python)
+    prefix = _log_return_prefix(permnos, returns)
+    momentum = np.expm1(_window_log_sum(prefix, lookback, skip))
+
+    result = keys.copy()
+    result["momentum"] = momentum
+    result[permno_col] = result[permno_col].astype(int)
+
+    return result
+
+
+def calculate_momentum_grid(
+    crsp_df: pd.DataFrame | ReturnPanel,
+    horizons: Sequence[tuple[int, int]] = DEFAULT_HORIZONS,
+    date_col: str = "date",
+    permno_col: str = "permno",
+    ret_col: str = "ret",
+) -> pd.DataFrame:
+    """
+    Calculate momentum for several ``(lookback, skip)`` horizons in a single pass.
+
+    The panel is cleaned, sorted and log-transformed once; each horizon is then a
+    vector subtraction over the shared per-PERMNO prefix sums. Column
+    ``momentum_{lookback}_{skip}`` holds the same values :func:`calculate_12_1_momentum`
+    returns for that horizon.
+
+    Args:
+        crsp_df (pd.DataFrame | ReturnPanel): Input DataFrame containing stock return data,
+            or a :class:`~factors.panel.ReturnPanel`.
+        horizons (Sequence[tuple[int, int]]): ``(lookback, skip)`` pairs to compute.
+        date_col (str): Column name for dates.
+        permno_col (str): Column name for stock identifiers (PERMNOs).
+        ret_col (str): Column name for returns.
+
+    Returns:
+        pd.DataFrame: Wide DataFrame with `date_col`, `permno_col` and one column per horizon.
+
+    Raises:
+        ValueError: If required columns are missing, no horizons are given, or a horizon
+        has invalid lookback/skip parameters.
+    """
+    if not horizons:
+        raise ValueError("At least one (lookback, skip) horizon is required.")
+    for lookback, skip in horizons:
+        _validate_window(lookback, skip)
+
+    keys, permnos, returns = _load_panel(crsp_df, date_col, permno_col, ret_col)
+    prefix = _log_return_prefix(permnos, returns)
+
+    result = keys.copy()
+    for lookback, skip in dict.fromkeys(horizons):
+        result[f"momentum_{lookback}_{skip}"] = np.expm1(_window_log_sum(prefix, lookback, skip))
+    result[permno_col] = result[permno_col].astype(int)
+
+    return result
+
+
+def _validate_window(lookback: int, skip: int) -> None:
     if lookback <= 0 or skip < 0:
         raise ValueError("`lookback` must be > 0 and `skip` must be >= 0.")
 
-    # Data preparation
+
+def _prepare_returns(
+    crsp_df: pd.DataFrame, date_col: str, permno_col: str, ret_col: str
+) -> pd.DataFrame:
+    """Return a cleaned copy of the panel sorted by PERMNO and date."""
     df = crsp_df[[date_col, permno_col, ret_col]].copy()
     df[date_col] = pd.to_datetime(df[date_col], errors="coerce")
     df[ret_col] = pd.to_numeric(df[ret_col], errors="coerce")
-    df = df.dropna(subset=[date_col, ret_col])
-    df = df.sort_values(by=[permno_col, date_col])
-
-    # Momentum calculation
-    def _group_momentum(group):
-        group["log_ret"] = np.log1p(group[ret_col])
-        group["rolling_sum"] = (
-            group["log_ret"].shift(skip + 1).rolling(window=lookback, min_periods=lookback).sum()
+    df = df.dropna(subset=[date_col, permno_col, ret_col])
+    return df.sort_values(by=[permno_col, date_col], kind="mergesort")
+
+
+def _load_panel(
+    crsp_df: pd.DataFrame | ReturnPanel, date_col: str, permno_col: str, ret_col: str
+) -> tuple[pd.DataFrame, np.ndarray, np.ndarray]:
+    """
+    Return the ``(date, permno)`` key frame plus the PERMNO-sorted PERMNO and return arrays.
+
+    A :class:`ReturnPanel` is already clean and sorted, so it is used as-is with its
+    integer PERMNO codes and calendar month-end dates.
+    """
+    if isinstance(crsp_df, ReturnPanel):
+        keys = pd.DataFrame(
+            {date_col: crsp_df.dates.astype("datetime64[ns]"), permno_col: crsp_df.permnos}
         )
-        group["momentum"] = np.expm1(group["rolling_sum"])
-        return group[[date_col, permno_col, "momentum"]]
+        return keys, crsp_df.codes, crsp_df.returns.astype(np.float64)
 
-    result = df.groupby(permno_col, group_keys=False).apply(_group_momentum)
-    result[permno_col] = result[permno_col].astype(int)
+    required_columns = {date_col, permno_col, ret_col}
+    if not required_columns.issubset(crsp_df.columns):
+        raise ValueError(f"Input DataFrame must contain the columns: {required_columns}")
+    df = _prepare_returns(crsp_df, date_col, permno_col, ret_col)
+    return df[[date_col, permno_col]], df[permno_col].to_numpy(), df[ret_col].to_numpy("float64")
+
+
+class _LogReturnPrefix(NamedTuple):
+    """Per-PERMNO prefix sums of log returns over a panel sorted by PERMNO."""
+
+    sums: np.ndarray  # inclusive cumulative sum of finite log returns, reset per PERMNO
+    non_finite: np.ndarray  # global inclusive count of non-finite log returns
+    positions: np.ndarray  # zero-based row position within each PERMNO
+
+
+def _group_layout(permnos: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Return the group id and within-group position of each row of a PERMNO-sorted array."""
+    n = len(permnos)
+    boundaries = np.flatnonzero(permnos[1:] != permnos[:-1]) + 1
+    starts = np.concatenate(([0], boundaries)).astype(np.int64)
+    lengths = np.diff(np.append(starts, n))
+    group_ids = np.repeat(np.arange(len(starts)), lengths)
+    positions = np.arange(n) - np.repeat(starts, lengths)
+    return group_ids, positions
+
+
+def _grouped_cumsum(values: np.ndarray, group_ids: np.ndarray) -> np.ndarray:
+    """Inclusive cumulative sum of ``values`` that restarts at zero for every group."""
+    # Restarting per PERMNO makes each stock's prefix depend only on its own history
+    # (and never on how the panel was ordered or split across processes).
+    return pd.Series(values).groupby(group_ids, sort=False).cumsum().to_numpy()
+
+
+def _log_return_prefix(permnos: np.ndarray, returns: np.ndarray) -> _LogReturnPrefix:
+    """Take logs once and build the prefix sums every window query is answered from."""
+    if len(permnos) == 0:
+        empty = np.empty(0, dtype=np.float64)
+        return _LogReturnPrefix(empty, np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64))
+
+    group_ids, positions = _group_layout(permnos)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        log_ret = np.log1p(returns)
+    finite = np.isfinite(log_ret)
+
+    sums = _grouped_cumsum(np.where(finite, log_ret, 0.0), group_ids)
+    non_finite = np.cumsum(~finite, dtype=np.int64)
+    return _LogReturnPrefix(sums, non_finite, positions)
 
-    return result
+
+def _window_log_sum(prefix: _LogReturnPrefix, lookback: int, skip: int) -> np.ndarray:
+    """
+    Sum log returns over rows ``t - skip - lookback`` .. ``t - skip - 1`` of each PERMNO.
+
+    Mirrors ``shift(skip + 1).rolling(lookback, min_periods=lookback).sum()``: rows
+    without a full window, or whose window holds a non-finite log return, are NaN.
+    """
+    n = len(prefix.positions)
+    out = np.full(n, np.nan)
+    rows = np.flatnonzero(prefix.positions >= skip + lookback)
+    if rows.size == 0:
+        return out
+
+    hi = rows - skip - 1
+    lo = rows - skip - lookback
+    at_start = prefix.positions[rows] == skip + lookback
+    before = np.where(at_start, 0, lo - 1)
+
+    window = prefix.sums[hi] - np.where(at_start, 0.0, prefix.sums[before])
+    bad = prefix.non_finite[hi] - np.where(lo > 0, prefix.non_finite[lo - 1], 0)
+    out[rows] = np.where(bad > 0, np.nan, window)
+    return out
 
 
-async def generate_market_summary():
+class IncrementalMomentum:
+    """
+    Stateful month-append variant of :func:`calculate_12_1_momentum`.
+
+    The calculator keeps, for every PERMNO it has seen, the trailing ``lookback + skip``
+    log returns. Feeding it one month of returns yields that month's momentum
+    cross-section in O(number of stocks) and then rolls the window forward, so a
+    month-end job only has to process the new rows instead of the whole history.
+
+    Feeding the months of a panel one at a time produces the same values as running
+    :func:`calculate_12_1_momentum` over the full panel.
+
+    Example:
+        >>> state = IncrementalMomentum.from_history(crsp_history)
+        >>> latest = state.update(new_month_df)
+        >>> state.save("artifacts/momentum_state.npz")
+    """
+
+    def __init__(self, lookback: int = 12, skip: int = 1) -> None:
+        _validate_window(lookback, skip)
+        self.lookback = lookback
+        self.skip = skip
+        self.last_date: pd.Timestamp | None = None
+        self._index = pd.Index([], dtype="int64")
+        # Oldest log return in column 0, most recent in the last column.
+        self._buffer = np.empty((0, self.window), dtype=np.float64)
+        self._counts = np.empty(0, dtype=np.int64)
+
+    @property
+    def window(self) -> int:
+        """Number of trailing log returns retained per PERMNO."""
+        return self.lookback + self.skip
+
+    @property
+    def permnos(self) -> np.ndarray:
+        return self._index.to_numpy()
+
+    @classmethod
+    def from_history(
+        cls,
+        crsp_df: pd.DataFrame,
+        date_col: str = "date",
+        permno_col: str = "permno",
+        ret_col: str = "ret",
+        lookback: int = 12,
+        skip: int = 1,
+    ) -> "IncrementalMomentum":
+        """Seed the state from a historical panel so the next :meth:`update` is month-ahead."""
+        required_columns = {date_col, permno_col, ret_col}
+        if not required_columns.issubset(crsp_df.columns):
+            raise ValueError(f"Input DataFrame must contain the columns: {required_columns}")
+        state = cls(lookback=lookback, skip=skip)
+        df = _prepare_returns(crsp_df, date_col, permno_col, ret_col)
+        if df.empty:
+            return state
+
+        permnos = df[permno_col].to_numpy().astype(np.int64)
+        group_ids, positions = _group_layout(permnos)
+        lengths = np.bincount(group_ids)
+        remaining = (
+            lengths[group_ids] - positions
+        )  # rows left in the stock's history, incl. this one
+        tail = remaining <= state.window
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            log_ret = np.log1p(df[ret_col].to_numpy(dtype="float64"))
+
+        state._index = pd.Index(permnos[np.r_[0, np.flatnonzero(np.diff(group_ids)) + 1]])
+        state._buffer = np.full((len(lengths), state.window), np.nan)
+        state._buffer[group_ids[tail], state.window - remaining[tail]] = log_ret[tail]
+        state._counts = np.minimum(lengths, state.window).astype(np.int64)
+        state.last_date = df[date_col].max()
+        return state
+
+    def update(
+        self,
+        month_df: pd.DataFrame,
+        date_col: str = "date",
+        permno_col: str = "permno",
+        ret_col: str = "ret",
+    ) -> pd.DataFrame:
+        """
+        Append one month of returns and return that month's momentum cross-section.
+
+        Args:
+            month_df (pd.DataFrame): Returns for a single calendar month, one row per PERMNO.
+            date_col (str): Column name for dates.
+            permno_col (str): Column name for stock identifiers (PERMNOs).
+            ret_col (str): Column name for returns.
+
+        Returns:
+            pd.DataFrame: DataFrame with columns `date_col`, `permno_col`, and `momentum`,
+            sorted by PERMNO.
+
+        Raises:
+            ValueError: If columns are missing, the rows span several months, a PERMNO
+            appears twice, or the month is not after the last month already applied.
+        """
+        required_columns = {date_col, permno_col, ret_col}
+        if not required_columns.issubset(month_df.columns):
+            raise ValueError(f"Input DataFrame must contain the columns: {required_columns}")
+        df = _prepare_returns(month_df, date_col, permno_col, ret_col)
+        if df.empty:
+            return pd.DataFrame(columns=[date_col, permno_col, "momentum"])
+
+        months = df[date_col].dt.to_period("M").unique()
+        if len(months) != 1:
+            raise ValueError("`update` expects returns for exactly one month.")
+        if self.last_date is not None and months[0] <= self.last_date.to_period("M"):
+            raise ValueError(
+                f"Month {months[0]} is not after the last applied month "
+                f"{self.last_date.to_period('M')}."
+            )
+        permnos = df[permno_col].to_numpy().astype(np.int64)
+        if pd.Index(permnos).has_duplicates:
+            raise ValueError("`update` received more than one row for the same PERMNO.")
+
+        slots = self._slots_for(permnos)
+        window = self._buffer[slots, : self.lookback]
+        full = self._counts[slots] >= self.window
+        valid = full & np.isfinite(window).all(axis=1)
+        momentum = np.full(len(slots), np.nan)
+        momentum[valid] = np.expm1(window[valid].sum(axis=1))
+
+        # Roll each stock's window forward by one observation.
+        with np.errstate(divide="ignore", invalid="ignore"):
+            log_ret = np.log1p(df[ret_col].to_numpy(dtype="float64"))
+        self._buffer[slots, :-1] = self._buffer[slots, 1:]
+        self._buffer[slots, -1] = log_ret
+        self._counts[slots] = np.minimum(self._counts[slots] + 1, self.window)
+        self.last_date = df[date_col].max()
+
+        result = df[[date_col, permno_col]].copy()
+        result["momentum"] = momentum
+        result[permno_col] = result[permno_col].astype(int)
+        return result.reset_index(drop=True)
+
+    def _slots_for(self, permnos: np.ndarray) -> np.ndarray:
+        """Map PERMNOs to buffer rows, allocating empty rows for first-time PERMNOs."""
+        slots = self._index.get_indexer(permnos)
+        new = slots == -1
+        if new.any():
+            fresh = permnos[new]
+            slots[new] = np.arange(len(self._index), len(self._index) + len(fresh))
+            self._index = self._index.append(pd.Index(fresh))
+            self._buffer = np.vstack([self._buffer, np.full((len(fresh), self.window), np.nan)])
+            self._counts = np.concatenate([self._counts, np.zeros(len(fresh), dtype=np.int64)])
+        return slots
+
+    def save(self, path: str | Path) -> Path:
+        """Persist the state as a compressed ``.npz`` archive."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        last_date = "NaT" if self.last_date is None else self.last_date.to_datetime64()
+        with path.open("wb") as fh:
+            np.savez_compressed(
+                fh,
+                lookback=np.int64(self.lookback),
+                skip=np.int64(self.skip),
+                last_date=np.datetime64(last_date, "ns"),
+                permnos=self.permnos.astype(np.int64),
+                buffer=self._buffer,
+                counts=self._counts,
+            )
+        return path
+
+    @classmethod
+    def load(cls, path: str | Path) -> "IncrementalMomentum":
+        """Restore a state written by :meth:`save`."""
+        with np.load(Path(path), allow_pickle=False) as archive:
+            state = cls(lookback=int(archive["lookback"]), skip=int(archive["skip"]))
+            last_date = archive["last_date"][()]
+            state.last_date = None if np.isnat(last_date) else pd.Timestamp(last_date)
+            state._index = pd.Index(archive["permnos"])
+            state._buffer = archive["buffer"].copy()
+            state._counts = archive["counts"].copy()
+        if state._buffer.shape != (len(state._index), state.window):
+            raise ValueError(f"Momentum state at {path} is inconsistent with its window size.")
+        return state
+
+
+async def generate_market_summary(client: AsyncHttpClient | None = None):
     """
     Generate a daily market summary using the Llama Cloud API.
 
@@ -79,6 +408,10 @@ async def generate_market_summary():
     and returns the model's response. If the API call fails, it logs the error and returns
     a fallback string.
 
+    Args:
+        client (AsyncHttpClient | None): Shared client to send the request through; a
+            temporary one is created if omitted.
+
     Returns:
         str: The market summary generated by the Llama model, or a fallback string on failure.
     """
@@ -101,8 +434,8 @@ async def generate_market_summary():
     headers = {"Authorization": f"Bearer {settings.LLAMA_CLOUD_API_KEY}"}
 
     try:
-        # Initialize the HTTP client
-        async with AsyncHttpClient() as http:
+        # Reuse the caller's HTTP client when given one
+        async with client_scope(client) as http:
             # Make the API call
             response = await http.post(
                 url=settings.LLAMA_CLOUD_API_ENDPOINT, json=payload, headers=headers
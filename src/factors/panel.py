@@ -0,0 +1,155 @@
+"""Compact columnar storage for PERMNO x month return panels."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+_MAX_MONTH_INDEX = np.iinfo(np.int16).max
+
+
+class ReturnPanel:
+    """
+    PERMNO-sorted monthly return panel held in contiguous, narrowly typed arrays.
+
+    Rows are ordered by PERMNO and then date. Each row stores an ``int32`` PERMNO
+    code, an ``int16`` month index (months since :attr:`base_month`) and a ``float32``
+    return (``float64`` on request), i.e. 10 bytes per stock-month instead of the
+    24+ bytes of a typical ``date``/``permno``/``ret`` DataFrame. ``offsets`` marks
+    where each PERMNO's history starts, so any stock's rows are an O(1) slice.
+
+    Dates are parsed once at construction; factor code works on the month index.
+    Factor functions in :mod:`factors` accept a panel wherever they accept a CRSP
+    DataFrame.
+    """
+
+    def __init__(
+        self,
+        permno_ids: np.ndarray,
+        codes: np.ndarray,
+        months: np.ndarray,
+        returns: np.ndarray,
+        base_month: np.datetime64,
+    ) -> None:
+        if not (len(codes) == len(months) == len(returns)):
+            raise ValueError("`codes`, `months` and `returns` must have the same length.")
+        self.permno_ids = np.ascontiguousarray(permno_ids, dtype=np.int64)
+        self.codes = np.ascontiguousarray(codes, dtype=np.int32)
+        self.months = np.ascontiguousarray(months, dtype=np.int16)
+        self.returns = np.ascontiguousarray(returns)
+        if self.returns.dtype not in (np.float32, np.float64):
+            raise ValueError("`returns` must be float32 or float64.")
+        self.base_month = np.datetime64(base_month, "M")
+        counts = np.bincount(self.codes, minlength=len(self.permno_ids))
+        self.offsets = np.concatenate(([0], np.cumsum(counts))).astype(np.int64)
+        self._lookup = {int(permno): code for code, permno in enumerate(self.permno_ids)}
+
+    @classmethod
+    def from_frame(
+        cls,
+        crsp_df: pd.DataFrame,
+        date_col: str = "date",
+        permno_col: str = "permno",
+        ret_col: str = "ret",
+        dtype: type[np.floating] = np.float32,
+    ) -> "ReturnPanel":
+        """
+        Build a panel from a CRSP-style DataFrame.
+
+        Rows with unparseable dates, returns or PERMNOs are dropped, as in
+        :func:`factors.momentum.calculate_12_1_momentum`.
+
+        Args:
+            crsp_df (pd.DataFrame): Input DataFrame containing stock return data.
+            date_col (str): Column name for dates.
+            permno_col (str): Column name for stock identifiers (PERMNOs).
+            ret_col (str): Column name for returns.
+            dtype (type[np.floating]): ``np.float32`` (default) or ``np.float64`` returns.
+
+        Returns:
+            ReturnPanel: The compact panel.
+
+        Raises:
+            ValueError: If required columns are missing or the history spans more
+            months than an ``int16`` month index can address.
+        """
+        required_columns = {date_col, permno_col, ret_col}
+        if not required_columns.issubset(crsp_df.columns):
+            raise ValueError(f"Input DataFrame must contain the columns: {required_columns}")
+
+        dates = pd.to_datetime(crsp_df[date_col], errors="coerce")
+        returns = pd.to_numeric(crsp_df[ret_col], errors="coerce")
+        permnos = pd.to_numeric(crsp_df[permno_col], errors="coerce")
+        valid = (dates.notna() & returns.notna() & permnos.notna()).to_numpy()
+
+        day_values = dates.to_numpy(dtype="datetime64[ns]")[valid]
+        month_values = day_values.astype("datetime64[M]")
+        permno_values = permnos.to_numpy()[valid].astype(np.int64)
+        permno_ids, codes = np.unique(permno_values, return_inverse=True)
+
+        if len(month_values):
+            base_month = month_values.min()
+            months = (month_values - base_month).astype(np.int64)
+            if months.max() > _MAX_MONTH_INDEX:
+                raise ValueError("Panel spans more months than an int16 month index can hold.")
+        else:
+            base_month = np.datetime64("1970-01", "M")
+            months = np.empty(0, dtype=np.int64)
+
+        order = np.lexsort((day_values, codes))
+        return cls(
+            permno_ids=permno_ids,
+            codes=codes[order],
+            months=months[order],
+            returns=returns.to_numpy(dtype=np.float64)[valid][order].astype(dtype),
+            base_month=base_month,
+        )
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    @property
+    def n_permnos(self) -> int:
+        return len(self.permno_ids)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the per-row and per-PERMNO arrays."""
+        return sum(
+            a.nbytes for a in (self.permno_ids, self.codes, self.months, self.returns, self.offsets)
+        )
+
+    @property
+    def permnos(self) -> np.ndarray:
+        """PERMNO of every row."""
+        return self.permno_ids[self.codes]
+
+    @property
+    def dates(self) -> np.ndarray:
+        """Calendar month-end date of every row as ``datetime64[D]``."""
+        month = self.base_month + self.months.astype(np.int64)
+        return (month + 1).astype("datetime64[D]") - np.timedelta64(1, "D")
+
+    def rows(self, permno: int) -> slice:
+        """Row slice holding ``permno``'s history."""
+        code = self._lookup.get(int(permno))
+        if code is None:
+            raise KeyError(f"PERMNO {permno} is not in the panel.")
+        return slice(int(self.offsets[code]), int(self.offsets[code + 1]))
+
+    def history(self, permno: int) -> tuple[np.ndarray, np.ndarray]:
+        """Month indexes and returns for ``permno`` as zero-copy views."""
+        rows = self.rows(permno)
+        return self.months[rows], self.returns[rows]
+
+    def to_frame(
+        self, date_col: str = "date", permno_col: str = "permno", ret_col: str = "ret"
+    ) -> pd.DataFrame:
+        """Expand the panel back to a CRSP-style DataFrame with month-end dates."""
+        return pd.DataFrame(
+            {
+                date_col: self.dates.astype("datetime64[ns]"),
+                permno_col: self.permnos,
+                ret_col: self.returns,
+            }
+        )
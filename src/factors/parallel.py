@@ -0,0 +1,156 @@
+"""Process-pool momentum sharded by PERMNO over shared-memory buffers."""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+
+from factors.momentum import (
+    _load_panel,
+    _log_return_prefix,
+    _validate_window,
+    _window_log_sum,
+)
+from factors.panel import ReturnPanel
+
+_HASH_MULTIPLIER = np.uint64(0x9E3779B97F4A7C15)  # Fibonacci hashing constant
+
+
+@dataclass(frozen=True)
+class _SharedArraySpec:
+    """Picklable handle that lets a worker attach to a parent-owned NumPy buffer."""
+
+    name: str
+    shape: tuple[int, ...]
+    dtype: str
+
+
+def _share(stack: ExitStack, array: np.ndarray) -> _SharedArraySpec:
+    """Copy ``array`` into a new shared-memory block owned (and unlinked) by ``stack``."""
+    shm = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    stack.callback(shm.unlink)
+    stack.callback(shm.close)
+    np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)[...] = array
+    return _SharedArraySpec(shm.name, array.shape, array.dtype.str)
+
+
+def _attach(stack: ExitStack, spec: _SharedArraySpec) -> np.ndarray:
+    shm = shared_memory.SharedMemory(name=spec.name)
+    stack.callback(shm.close)
+    return np.ndarray(spec.shape, dtype=np.dtype(spec.dtype), buffer=shm.buf)
+
+
+def shard_ids(permnos: np.ndarray, n_shards: int) -> np.ndarray:
+    """Assign each PERMNO to one of ``n_shards`` shards with a multiplicative hash."""
+    hashed = permnos.astype(np.int64).view(np.uint64) * _HASH_MULTIPLIER
+    return ((hashed >> np.uint64(32)) % np.uint64(n_shards)).astype(np.int64)
+
+
+def _momentum_shard(
+    permnos_spec: _SharedArraySpec,
+    returns_spec: _SharedArraySpec,
+    out_spec: _SharedArraySpec,
+    start: int,
+    stop: int,
+    lookback: int,
+    skip: int,
+) -> int:
+    """Worker: compute momentum for one shard's contiguous block of the shared buffers."""
+    with ExitStack() as stack:
+        permnos = _attach(stack, permnos_spec)[start:stop]
+        returns = _attach(stack, returns_spec)[start:stop]
+        out = _attach(stack, out_spec)
+
+        prefix = _log_return_prefix(permnos, returns)
+        out[start:stop] = np.expm1(_window_log_sum(prefix, lookback, skip))
+        del permnos, returns, out
+    return stop - start
+
+
+def parallel_momentum(
+    crsp_df: pd.DataFrame | ReturnPanel,
+    n_workers: int | None = None,
+    date_col: str = "date",
+    permno_col: str = "permno",
+    ret_col: str = "ret",
+    lookback: int = 12,
+    skip: int = 1,
+) -> pd.DataFrame:
+    """
+    Calculate momentum on a process pool, hash-sharding the panel by PERMNO.
+
+    The parent cleans and sorts the panel once, hashes each PERMNO to a shard and
+    reorders the rows so every shard is one contiguous block, then places the PERMNO
+    and return columns in shared memory. Each worker attaches to those buffers,
+    computes momentum over its ``[start, stop)`` block and writes the values into the
+    same block of a shared output array, which the parent scatters back to the
+    original row order. Every stock's result depends only on its own history, which makes the
+    output bit-for-bit identical to :func:`factors.momentum.calculate_12_1_momentum`.
+
+    Args:
+        crsp_df (pd.DataFrame | ReturnPanel): Input DataFrame containing stock return data,
+            or a :class:`~factors.panel.ReturnPanel`.
+        n_workers (int | None): Number of worker processes; defaults to ``os.cpu_count()``.
+        date_col (str): Column name for dates.
+        permno_col (str): Column name for stock identifiers (PERMNOs).
+        ret_col (str): Column name for returns.
+        lookback (int): Number of months in the lookback window.
+        skip (int): Number of months to skip before the lookback window.
+
+    Returns:
+        pd.DataFrame: DataFrame with columns `date_col`, `permno_col`, and `momentum`.
+
+    Raises:
+        ValueError: If required columns are missing or parameters are invalid.
+    """
+    _validate_window(lookback, skip)
+    if n_workers is None:
+        n_workers = os.cpu_count() or 1
+    if n_workers <= 0:
+        raise ValueError("`n_workers` must be > 0.")
+
+    keys, permnos, returns = _load_panel(crsp_df, date_col, permno_col, ret_col)
+    permnos = permnos.astype(np.int64)
+
+    # A stable sort by shard keeps each stock's rows contiguous and date-ordered.
+    shards = shard_ids(permnos, n_workers)
+    order = np.argsort(shards, kind="stable")
+    bounds = np.searchsorted(shards[order], np.arange(n_workers + 1))
+
+    with ExitStack() as stack:
+        permnos_spec = _share(stack, permnos[order])
+        returns_spec = _share(stack, returns[order])
+        out_spec = _share(stack, np.full(len(keys), np.nan))
+
+        with ProcessPoolExecutor(max_workers=n_workers) as pool:
+            futures = [
+                pool.submit(
+                    _momentum_shard,
+                    permnos_spec,
+                    returns_spec,
+                    out_spec,
+                    int(start),
+                    int(stop),
+                    lookback,
+                    skip,
+                )
+                for start, stop in zip(bounds[:-1], bounds[1:])
+                if stop > start
+            ]
+            for future in futures:
+                future.result()
+
+        momentum = np.empty(len(keys))
+        momentum[order] = _attach(stack, out_spec)
+
+    result = keys.copy()
+    result["momentum"] = momentum
+    result[permno_col] = result[permno_col].astype(int)
+
+    return result
@@ -0,0 +1,133 @@
+"""Momentum computed inside the database with a window query."""
+
+from __future__ import annotations
+
+from typing import List, Optional, Tuple
+
+import pandas as pd
+
+from assistant.fetchers.wrds_pool import WrdsConnectionPool, get_default_pool
+from assistant.utils.logging import logger
+from factors.momentum import _validate_window
+
+
+def momentum_query(
+    lookback: int = 12,
+    skip: int = 1,
+    permnos: Optional[List[int]] = None,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    table: str = "crsp.msf",
+) -> Tuple[str, tuple]:
+    """
+    Build a window query that returns the momentum signal instead of raw returns.
+
+    The window mirrors :func:`~factors.momentum.calculate_12_1_momentum`: missing
+    returns are dropped first, and the signal at each row compounds the ``lookback``
+    returns that end ``skip`` rows earlier, i.e. rows ``skip + lookback`` through
+    ``skip + 1`` PRECEDING. Rows with a short window or a return of -100% or worse
+    (whose log is undefined) get NULL. ``start_date`` only filters the output, so
+    early rows still see their full history.
+
+    Args:
+        lookback (int): Number of months in the lookback window.
+        skip (int): Number of months to skip before the lookback window.
+        permnos (Optional[List[int]]): PERMNOs to include; the whole table if None.
+        start_date (Optional[str]): First signal date in YYYY-MM-DD format.
+        end_date (Optional[str]): Last signal date in YYYY-MM-DD format.
+        table (str): Source table with ``permno``, ``date`` and ``ret`` columns.
+
+    Returns:
+        Tuple[str, tuple]: SQL with psycopg2-style ``%s`` placeholders and its parameters.
+
+    Raises:
+        ValueError: If lookback/skip parameters are invalid.
+    """
+    _validate_window(lookback, skip)
+    filters = ["ret IS NOT NULL"]
+    params: tuple = ()
+    if permnos is not None:
+        filters.append("permno IN %s")
+        params += (tuple(int(p) for p in permnos),)
+    if end_date:
+        filters.append("date <= %s")
+        params += (end_date,)
+
+    sql_query = f"""
+    WITH returns AS (
+        SELECT permno, date, ret
+        FROM {table}
+        WHERE {" AND ".join(filters)}
+    ),
+    windows AS (
+        SELECT
+            permno,
+            date,
+            COUNT(*) OVER w AS n_obs,
+            SUM(CASE WHEN ret > -1 THEN 0 ELSE 1 END) OVER w AS n_invalid,
+            SUM(CASE WHEN ret > -1 THEN LN(1 + ret) END) OVER w AS log_sum
+        FROM returns
+        WINDOW w AS (
+            PARTITION BY permno ORDER BY date
+            ROWS BETWEEN {skip + lookback} PRECEDING AND {skip + 1} PRECEDING
+        )
+    )
+    SELECT
+        date,
+        permno,
+        CASE WHEN n_obs = {lookback} AND n_invalid = 0 THEN EXP(log_sum) - 1 END AS momentum
+    FROM windows
+    """
+    if start_date:
+        sql_query += " WHERE date >= %s"
+        params += (start_date,)
+    sql_query += " ORDER BY permno, date"
+    return sql_query, params
+
+
+def fetch_momentum_pushdown(
+    permnos: Optional[List[int]] = None,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    lookback: int = 12,
+    skip: int = 1,
+    table: str = "crsp.msf",
+    pool: Optional[WrdsConnectionPool] = None,
+) -> pd.DataFrame:
+    """
+    Compute momentum on the WRDS server and download only the signal.
+
+    Produces the same ``date``, ``permno``, ``momentum`` frame as
+    :func:`~factors.momentum.calculate_12_1_momentum` run on the full return history,
+    without shipping every monthly return to the client.
+
+    Args:
+        permnos (Optional[List[int]]): PERMNOs to include; the whole table if None.
+        start_date (Optional[str]): First signal date in YYYY-MM-DD format.
+        end_date (Optional[str]): Last signal date in YYYY-MM-DD format.
+        lookback (int): Number of months in the lookback window.
+        skip (int): Number of months to skip before the lookback window.
+        table (str): Source table with ``permno``, ``date`` and ``ret`` columns.
+        pool (Optional[WrdsConnectionPool]): Pool to borrow a connection from; defaults to
+            the shared process-wide pool.
+
+    Returns:
+        pd.DataFrame: Momentum signal sorted by PERMNO and date, or an empty DataFrame on
+        failure.
+
+    Raises:
+        ValueError: If lookback/skip parameters are invalid.
+    """
+    sql_query, params = momentum_query(lookback, skip, permnos, start_date, end_date, table)
+    pool = pool or get_default_pool()
+    try:
+        with pool.connection() as conn:
+            df = conn.raw_sql(sql_query, params=params)
+    except Exception as e:
+        logger.error(f"Failed to compute momentum on the server: {e}")
+        return pd.DataFrame()
+
+    df["date"] = pd.to_datetime(df["date"])
+    df["permno"] = pd.to_numeric(df["permno"]).astype("int64")
+    df["momentum"] = pd.to_numeric(df["momentum"], errors="coerce").astype("float64")
+    return df
@@ -0,0 +1,135 @@
+"""Out-of-core momentum over PERMNO-partitioned Parquet datasets."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Iterator
+
+import pandas as pd
+
+from assistant.utils.logging import logger
+from factors.momentum import calculate_12_1_momentum
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow as pa  # type: ignore
+        import pyarrow.dataset as ds  # type: ignore
+        import pyarrow.parquet as pq  # type: ignore
+    except ImportError as exc:  # pragma: no cover - depends on the environment
+        raise ImportError(
+            "Streaming momentum requires the 'pyarrow' package (pip install pyarrow)."
+        ) from exc
+    return pa, ds, pq
+
+
+def _plan_chunks(fragments: list, chunk_rows: int) -> Iterator[list]:
+    """Group whole fragments into chunks of roughly ``chunk_rows`` rows using file metadata."""
+    chunk: list = []
+    rows = 0
+    for fragment in fragments:
+        fragment_rows = fragment.count_rows()
+        if chunk and rows + fragment_rows > chunk_rows:
+            yield chunk
+            chunk, rows = [], 0
+        chunk.append(fragment)
+        rows += fragment_rows
+    if chunk:
+        yield chunk
+
+
+def stream_momentum_parquet(
+    source: str | Path,
+    sink: str | Path,
+    chunk_rows: int = 5_000_000,
+    date_col: str = "date",
+    permno_col: str = "permno",
+    ret_col: str = "ret",
+    lookback: int = 12,
+    skip: int = 1,
+    partitioning: str | None = "hive",
+) -> int:
+    """
+    Compute momentum over a PERMNO-partitioned Parquet dataset one chunk at a time.
+
+    Whole dataset fragments (files) are grouped into chunks of about ``chunk_rows``
+    rows, each chunk goes through :func:`calculate_12_1_momentum`, and the result is
+    appended to a single Parquet file at ``sink``. Only one chunk is materialised at
+    a time, so peak memory follows ``chunk_rows`` (or the largest fragment) rather
+    than the size of the universe.
+
+    The dataset must be partitioned so that every PERMNO's history lives in exactly
+    one fragment, e.g. ``permno=<id>/`` hive directories or PERMNO buckets.
+
+    Args:
+        source (str | Path): Root of the Parquet dataset.
+        sink (str | Path): Output Parquet file with `date_col`, `permno_col` and `momentum`.
+        chunk_rows (int): Target number of input rows per chunk.
+        date_col (str): Column name for dates.
+        permno_col (str): Column name for stock identifiers (PERMNOs).
+        ret_col (str): Column name for returns.
+        lookback (int): Number of months in the lookback window.
+        skip (int): Number of months to skip before the lookback window.
+        partitioning (str | None): Partitioning flavour passed to ``pyarrow.dataset``.
+
+    Returns:
+        int: Number of rows written to ``sink``.
+
+    Raises:
+        ValueError: If ``chunk_rows`` is not positive or a PERMNO spans several chunks.
+        ImportError: If ``pyarrow`` is not installed.
+    """
+    if chunk_rows <= 0:
+        raise ValueError("`chunk_rows` must be > 0.")
+    pa, ds, pq = _require_pyarrow()
+
+    dataset = ds.dataset(str(source), format="parquet", partitioning=partitioning)
+    columns = [date_col, permno_col, ret_col]
+    schema = pa.schema(
+        [
+            pa.field(date_col, pa.timestamp("ns")),
+            pa.field(permno_col, pa.int64()),
+            pa.field("momentum", pa.float64()),
+        ]
+    )
+
+    sink = Path(sink)
+    sink.parent.mkdir(parents=True, exist_ok=True)
+    seen = pd.Index([], dtype="int64")
+    written = 0
+
+    with pq.ParquetWriter(str(sink), schema) as writer:
+        for i, chunk in enumerate(_plan_chunks(list(dataset.get_fragments()), chunk_rows)):
+            table = pa.concat_tables(
+                fragment.to_table(schema=dataset.schema, columns=columns) for fragment in chunk
+            )
+            crsp_chunk = table.to_pandas()
+            del table
+
+            permnos = pd.Index(crsp_chunk[permno_col].dropna().unique()).astype("int64")
+            if permnos.isin(seen).any():
+                raise ValueError(
+                    "Dataset is not PERMNO-partitioned: a PERMNO appears in more than one chunk."
+                )
+            seen = seen.append(permnos)
+
+            result = calculate_12_1_momentum(
+                crsp_chunk,
+                date_col=date_col,
+                permno_col=permno_col,
+                ret_col=ret_col,
+                lookback=lookback,
+                skip=skip,
+            )
+            del crsp_chunk
+            writer.write_table(pa.Table.from_pandas(result, schema=schema, preserve_index=False))
+            written += len(result)
+            logger.debug(
+                "Momentum chunk {chunk} written: {rows} rows from {fragments} fragments",
+                chunk=i,
+                rows=len(result),
+                fragments=len(chunk),
+            )
+
+    logger.info("Streamed momentum for {rows} rows to {sink}", rows=written, sink=sink)
+    return written
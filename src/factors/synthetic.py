@@ -0,0 +1,65 @@
+"""Seeded synthetic CRSP-like panels for tests and benchmarks (no WRDS access needed)."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+
+def synthetic_crsp_panel(
+    n_permnos: int = 1_000,
+    n_months: int = 240,
+    gap_rate: float = 0.02,
+    nan_rate: float = 0.01,
+    min_listing: int = 1,
+    start: str = "1926-01-31",
+    seed: int = 0,
+) -> pd.DataFrame:
+    """
+    Generate a monthly ``date``/``permno``/``ret`` panel shaped like ``crsp.msf``.
+
+    Each PERMNO gets a random listing window inside ``n_months`` month-ends. A
+    ``gap_rate`` share of stock-months inside the window is removed (listing gaps)
+    and a ``nan_rate`` share of returns is set to NaN (missing returns). Returns are
+    Student-t distributed around 1% a month and floored at -100%. Rows come back
+    shuffled, as an unordered database extract would.
+
+    Args:
+        n_permnos (int): Number of distinct PERMNOs.
+        n_months (int): Length of the calendar in months.
+        gap_rate (float): Probability that a listed stock-month is missing.
+        nan_rate (float): Probability that a present stock-month has a NaN return.
+        min_listing (int): Minimum listing length in months.
+        start (str): First month-end of the calendar.
+        seed (int): Seed for ``numpy.random.default_rng``.
+
+    Returns:
+        pd.DataFrame: Panel with `date` (``datetime64``), `permno` (``int64``) and `ret`.
+    """
+    if n_permnos <= 0 or n_months <= 0:
+        raise ValueError("`n_permnos` and `n_months` must be > 0.")
+    if not (0.0 <= gap_rate < 1.0 and 0.0 <= nan_rate <= 1.0):
+        raise ValueError("`gap_rate` must be in [0, 1) and `nan_rate` in [0, 1].")
+    min_listing = min(max(min_listing, 1), n_months)
+
+    rng = np.random.default_rng(seed)
+    calendar = pd.date_range(start, periods=n_months, freq="ME")
+
+    permnos = 10_000 + rng.choice(90_000, size=n_permnos, replace=False)
+    first = rng.integers(0, n_months - min_listing + 1, size=n_permnos)
+    length = rng.integers(min_listing, n_months - first + 1)
+
+    rows = np.repeat(np.arange(n_permnos), length)
+    offsets = np.arange(len(rows)) - np.repeat(np.cumsum(length) - length, length)
+    month_idx = first[rows] + offsets
+
+    keep = rng.random(len(rows)) >= gap_rate
+    rows, month_idx = rows[keep], month_idx[keep]
+
+    ret = np.maximum(0.01 + 0.06 * rng.standard_t(df=4, size=len(rows)), -1.0)
+    ret[rng.random(len(rows)) < nan_rate] = np.nan
+
+    panel = pd.DataFrame(
+        {"date": calendar[month_idx], "permno": permnos[rows].astype(np.int64), "ret": ret}
+    )
+    return panel.iloc[rng.permutation(len(panel))].reset_index(drop=True)
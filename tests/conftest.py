@@ -1,8 +1,51 @@
+import sqlite3
 import sys
 from pathlib import Path
 
+import pandas as pd
+import pytest
+
 # Ensure the src package is importable during test runs
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 SRC_PATH = PROJECT_ROOT / "src"
 if str(SRC_PATH) not in sys.path:
     sys.path.insert(0, str(SRC_PATH))
+
+
+class SqliteWrds:
+    """Stand-in for ``wrds.Connection`` backed by SQLite with an attached ``crsp`` schema."""
+
+    def __init__(self, frame: pd.DataFrame, table: str = "msf") -> None:
+        self.conn = sqlite3.connect(":memory:", check_same_thread=False)
+        self.conn.execute("ATTACH DATABASE ':memory:' AS crsp")
+        frame.assign(date=pd.to_datetime(frame["date"]).dt.strftime("%Y-%m-%d")).to_sql(
+            table, self.conn, index=False
+        )
+        self.conn.execute(f"CREATE TABLE crsp.{table} AS SELECT * FROM main.{table}")
+        self.queries: list[tuple[str, tuple]] = []
+        self.closed = False
+
+    def raw_sql(self, sql: str, params: tuple = (), **_kwargs) -> pd.DataFrame:
+        """Expand psycopg2-style ``%s`` tuple parameters into SQLite ``?`` placeholders."""
+        self.queries.append((sql, params))
+        flat: list = []
+        pieces = sql.split("%s")
+        rendered = pieces[0]
+        for value, piece in zip(params, pieces[1:]):
+            if isinstance(value, tuple):
+                rendered += "(" + ", ".join("?" * len(value)) + ")"
+                flat.extend(value)
+            else:
+                rendered += "?"
+                flat.append(value)
+            rendered += piece
+        return pd.read_sql_query(rendered, self.conn, params=flat)
+
+    def close(self) -> None:
+        self.closed = True
+
+
+@pytest.fixture
+def sqlite_wrds():
+    """Factory building a WRDS stand-in over a ``crsp.msf``-shaped DataFrame."""
+    return SqliteWrds
@@ -3,12 +3,13 @@ import asyncio
 import pytest
 
 from assistant.composer.run_digest import main
+from assistant.config import settings
 from assistant.utils.dto import CpiRelease, PaperItem, PriceSnapshot, VixClose
 
 
-@pytest.mark.filterwarnings("ignore::RuntimeWarning")
-def test_main_does_not_raise(monkeypatch, capsys):
-    # Provide lightweight stubs so the pipeline does not hit real network services.
+def _stub_fetchers(monkeypatch):
+    """Provide lightweight stubs so the pipeline does not hit real network services."""
+
     async def fake_vix(_client):
         return VixClose(date="2025-10-15", close=15.0)
 
@@ -38,8 +39,23 @@ def test_main_does_not_raise(monkeypatch, capsys):
     monkeypatch.setattr("assistant.composer.run_digest.global_quote_async", fake_quote)
     monkeypatch.setattr("assistant.composer.run_digest.AsyncHttpClient", DummyClient)
 
+
+@pytest.mark.filterwarnings("ignore::RuntimeWarning")
+def test_main_does_not_raise(monkeypatch, capsys):
+    _stub_fetchers(monkeypatch)
+
     asyncio.run(main())
 
     out, err = capsys.readouterr()
     assert "Daily Quant Digest" in out
     assert err == ""
+
+
+def test_main_quotes_a_repeated_benchmark_once(monkeypatch, capsys):
+    _stub_fetchers(monkeypatch)
+    monkeypatch.setattr(settings.digest, "benchmarks", ["SPY", "QQQ", "SPY"])
+
+    asyncio.run(main())
+
+    out, _ = capsys.readouterr()
+    assert out.count("- SPY:") == 1 and out.count("- QQQ:") == 1
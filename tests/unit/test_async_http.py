@@ -0,0 +1,197 @@
+import asyncio
+import os
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from multidict import CIMultiDict, CIMultiDictProxy
+from yarl import URL
+
+import assistant.fetchers.news_fetcher as news
+from assistant.config import HttpSettings
+from assistant.utils.async_http import (
+    AsyncHttpClient,
+    HttpCache,
+    HttpResponse,
+    client_scope,
+    shared_ssl_context,
+)
+
+
+async def _serve(handler) -> TestServer:
+    app = web.Application()
+    app.router.add_get("/{tail:.*}", handler)
+    server = TestServer(app)
+    await server.start_server()
+    return server
+
+
+def test_client_reuses_keepalive_connections_through_tuned_connector() -> None:
+    peers = []
+
+    async def handler(request: web.Request) -> web.Response:
+        peers.append(request.transport.get_extra_info("peername"))
+        return web.json_response({"ok": True})
+
+    async def _run():
+        server = await _serve(handler)
+        try:
+            async with AsyncHttpClient(HttpSettings(limit_per_host=2, ttl_dns_cache=60)) as client:
+                for _ in range(3):
+                    response = await client.get(str(server.make_url("/quote")))
+                    assert await response.json() == {"ok": True}
+                return client.connector
+        finally:
+            await server.close()
+
+    connector = asyncio.run(_run())
+
+    assert connector.limit_per_host == 2
+    assert connector.use_dns_cache
+    assert connector._ssl is shared_ssl_context()
+    # All three requests rode the same kept-alive TCP connection.
+    assert len(set(peers)) == 1
+
+
+def test_client_scope_borrows_or_owns_client() -> None:
+    async def _run():
+        async with AsyncHttpClient() as shared:
+            async with client_scope(shared) as borrowed:
+                assert borrowed is shared
+            assert not shared._closed
+
+        async with client_scope() as owned:
+            pass
+        return owned
+
+    assert asyncio.run(_run())._closed
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 1_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_http_cache_revalidates_and_serves_304_from_disk(tmp_path) -> None:
+    seen = []
+
+    async def handler(request: web.Request) -> web.Response:
+        seen.append((request.path, request.headers.get("If-None-Match")))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return web.Response(status=304, headers={"ETag": '"v1"'})
+        return web.json_response({"observations": [1, 2]}, headers={"ETag": '"v1"'})
+
+    clock = Clock()
+    cache = HttpCache(tmp_path, ttls={"127.0.0.1/fresh": 60}, clock=clock)
+
+    async def _run():
+        server = await _serve(handler)
+        results = []
+        try:
+            async with AsyncHttpClient(HttpSettings(), cache=cache) as client:
+                for path in ("/fred", "/fred", "/fresh", "/fresh"):
+                    response = await client.get(str(server.make_url(path)), params={"id": "VIX"})
+                    results.append((await response.json(), response.from_cache))
+                clock.now += 120
+                response = await client.get(str(server.make_url("/fresh")), params={"id": "VIX"})
+                results.append((await response.json(), response.from_cache))
+        finally:
+            await server.close()
+        return results
+
+    results = asyncio.run(_run())
+
+    payload = {"observations": [1, 2]}
+    assert results == [
+        (payload, False),
+        (payload, True),  # 304 answered from disk
+        (payload, False),
+        (payload, True),  # within TTL: no request at all
+        (payload, True),  # TTL expired: revalidated
+    ]
+    assert seen == [
+        ("/fred", None),
+        ("/fred", '"v1"'),
+        ("/fresh", None),
+        ("/fresh", '"v1"'),
+    ]
+
+
+def test_http_cache_skips_unreusable_responses_and_evicts_by_size(tmp_path) -> None:
+    cache = HttpCache(tmp_path, max_bytes=2_500)
+    url = "https://example.com/quote"
+
+    def response(body: bytes, **headers) -> HttpResponse:
+        return HttpResponse(200, CIMultiDictProxy(CIMultiDict(headers)), body, URL(url))
+
+    # No validator and no TTL: could never be reused.
+    assert not cache.put(cache.key(url, {"s": "SPY"}), url, response(b"x"))
+    assert cache.key(url, {"a": 1, "b": 2}) == cache.key(url, {"b": 2, "a": 1})
+
+    keys = [cache.key(url, {"s": s}) for s in ("SPY", "QQQ", "IWM")]
+    for age, key in enumerate(keys):
+        assert cache.put(key, url, response(b"x" * 1_000, ETag='"e"'))
+        os.utime(tmp_path / f"{key}{HttpCache.SUFFIX}", (age, age))
+
+    assert cache.get(keys[0]) is None
+    assert cache.get(keys[2]) is not None
+
+
+def test_concurrent_identical_gets_share_one_request() -> None:
+    hits = []
+
+    async def handler(request: web.Request) -> web.Response:
+        hits.append(request.query.get("symbol"))
+        await asyncio.sleep(0.05)
+        return web.json_response({"symbol": request.query.get("symbol")})
+
+    async def _run():
+        server = await _serve(handler)
+        url = str(server.make_url("/query"))
+        try:
+            async with AsyncHttpClient(HttpSettings()) as client:
+                impatient = asyncio.ensure_future(client.get(url, params={"symbol": "SPY"}))
+                requests = [
+                    asyncio.ensure_future(client.get(url, params={"symbol": "SPY"}))
+                    for _ in range(4)
+                ]
+                requests.append(client.get(url, params={"symbol": "QQQ"}))
+                await asyncio.sleep(0.01)
+                impatient.cancel()
+                responses = await asyncio.gather(*requests)
+                return [await r.json() for r in responses], client.coalesced
+        finally:
+            await server.close()
+
+    payloads, coalesced = asyncio.run(_run())
+
+    assert payloads == [{"symbol": "SPY"}] * 4 + [{"symbol": "QQQ"}]
+    assert sorted(hits) == ["QQQ", "SPY"]
+    assert coalesced == 4
+
+
+def test_fetch_news_goes_through_the_client(monkeypatch) -> None:
+    async def handler(request: web.Request) -> web.Response:
+        if request.query["q"] == "throttled":
+            return web.json_response({"status": "error"}, status=429)
+        return web.json_response({"articles": [{"title": "Rates", "url": "http://n/1"}]})
+
+    async def _run():
+        server = await _serve(handler)
+        monkeypatch.setattr(news, "NEWS_API_EVERYTHING", str(server.make_url("/v2/everything")))
+        try:
+            async with AsyncHttpClient(HttpSettings()) as client:
+                articles = await news.fetch_news("key", "fed-minutes-test", client=client)
+                throttled = await news.fetch_news("key", "throttled", client=client)
+                return articles, throttled, client.metrics_report()
+        finally:
+            await server.close()
+
+    articles, throttled, report = asyncio.run(_run())
+
+    assert articles == [{"title": "Rates", "url": "http://n/1"}]
+    assert throttled == []
+    (stats,) = report["endpoints"].values()
+    assert stats["statuses"] == {"200": 1, "429": 1}
@@ -0,0 +1,73 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from factors.backtest import decile_backtest
+from factors.momentum import calculate_12_1_momentum
+from factors.synthetic import synthetic_crsp_panel
+
+
+def _loop_reference(signal, crsp, n_bins, weight_col=None):
+    """Per-date sort, the way the decile tables used to be built by hand."""
+    crsp = crsp.assign(month=crsp["date"].dt.to_period("M"))
+    signal = signal.dropna(subset=["momentum"]).assign(month=signal["date"].dt.to_period("M"))
+    out = {}
+    for month, group in signal.groupby("month"):
+        nxt = crsp[crsp["month"] == month + 1].dropna(subset=["ret"]).set_index("permno")["ret"]
+        group = group[group["permno"].isin(nxt.index)].copy()
+        if group.empty:
+            continue
+        ranks = group["momentum"].rank(method="first")
+        group["bin"] = np.ceil(ranks / len(group) * n_bins).clip(1, n_bins)
+        group["next"] = nxt.reindex(group["permno"]).to_numpy()
+        if weight_col:
+            size = crsp[crsp["month"] == month].set_index("permno")[weight_col]
+            group["w"] = size.reindex(group["permno"]).to_numpy()
+        else:
+            group["w"] = 1.0
+        group["w"] /= group.groupby("bin")["w"].transform("sum")
+        out[(month + 1).to_timestamp(how="end").normalize()] = (
+            (group["w"] * group["next"]).groupby(group["bin"]).sum()
+        )
+    return pd.DataFrame(out).T.sort_index()
+
+
+@pytest.mark.parametrize("weighting", ["equal", "value"])
+def test_decile_backtest_matches_per_date_loop(weighting) -> None:
+    crsp = synthetic_crsp_panel(n_permnos=120, n_months=48, seed=8)
+    crsp["me"] = np.random.default_rng(0).lognormal(5, 1, len(crsp))
+    signal = calculate_12_1_momentum(crsp)
+    weight_col = "me" if weighting == "value" else None
+
+    result = decile_backtest(signal, crsp, weighting=weighting, weight_col=weight_col)
+
+    expected = _loop_reference(signal, crsp, 10, weight_col)
+    np.testing.assert_allclose(result.portfolio_returns.to_numpy(), expected.to_numpy())
+    pd.testing.assert_series_equal(
+        result.long_short, (expected[10] - expected[1]).rename("long_short"), check_names=False
+    )
+
+
+def test_decile_backtest_turnover_and_costs() -> None:
+    dates = pd.to_datetime(["2020-01-31", "2020-02-29", "2020-03-31"])
+    crsp = pd.DataFrame(
+        {
+            "date": np.repeat(dates, 4),
+            "permno": np.tile([1, 2, 3, 4], 3),
+            "ret": 0.01,
+        }
+    )
+    # Winners and losers swap in February.
+    signal = pd.DataFrame(
+        {
+            "date": np.repeat(dates[:2], 4),
+            "permno": np.tile([1, 2, 3, 4], 2),
+            "momentum": [0.1, 0.2, 0.3, 0.4, 0.4, 0.3, 0.2, 0.1],
+        }
+    )
+
+    result = decile_backtest(signal, crsp, n_bins=2, cost_bps=10)
+
+    assert list(result.turnover[2]) == [1.0, 2.0]
+    assert list(result.long_short_turnover) == [2.0, 4.0]
+    np.testing.assert_allclose(result.net_long_short, [-0.002, -0.004])
@@ -0,0 +1,123 @@
+import asyncio
+
+import aiohttp
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from assistant.config import HttpSettings
+from assistant.utils.async_http import AsyncHttpClient
+from assistant.utils.circuit_breaker import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitBreaker,
+    CircuitOpenError,
+)
+
+BLS = "https://www.bls.gov/schedule/news_release/cpi.htm"
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 1_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_breaker_opens_probes_and_closes(tmp_path) -> None:
+    clock = Clock()
+    state_path = tmp_path / "breaker.json"
+    breaker = CircuitBreaker(
+        failure_threshold=2, reset_timeout=60, state_path=state_path, clock=clock
+    )
+
+    breaker.before_request(BLS)
+    breaker.record_failure(BLS)
+    assert breaker.state(BLS) == CLOSED
+    breaker.record_failure(BLS)
+    assert breaker.state(BLS) == OPEN
+
+    with pytest.raises(CircuitOpenError) as excinfo:
+        breaker.before_request(BLS)
+    assert isinstance(excinfo.value, aiohttp.ClientError)
+    assert excinfo.value.retry_in == 60
+    breaker.before_request("https://api.stlouisfed.org/fred/series/observations")
+
+    # The next run picks up the open circuit from disk.
+    clock.now += 61
+    reloaded = CircuitBreaker(
+        failure_threshold=2, reset_timeout=60, state_path=state_path, clock=clock
+    )
+    assert reloaded.state(BLS) == HALF_OPEN
+    reloaded.before_request(BLS)  # the single probe
+    with pytest.raises(CircuitOpenError):
+        reloaded.before_request(BLS)
+
+    # A failed probe reopens immediately; a successful one closes.
+    reloaded.record_failure(BLS)
+    assert reloaded.state(BLS) == OPEN
+    clock.now += 61
+    reloaded.before_request(BLS)
+    reloaded.record_success(BLS)
+    assert reloaded.state(BLS) == CLOSED
+    assert CircuitBreaker(state_path=state_path, clock=clock).state(BLS) == CLOSED
+
+
+def test_client_fails_fast_once_host_circuit_opens() -> None:
+    attempts = []
+
+    async def handler(request: web.Request) -> web.Response:
+        attempts.append(request.path)
+        return web.Response(status=503)
+
+    async def _run():
+        app = web.Application()
+        app.router.add_get("/{tail:.*}", handler)
+        server = TestServer(app)
+        await server.start_server()
+        url = str(server.make_url("/cpi"))
+        breaker = CircuitBreaker(failure_threshold=3, reset_timeout=60)
+        errors = []
+        try:
+            async with AsyncHttpClient(HttpSettings(), breaker=breaker) as client:
+                for _ in range(2):
+                    try:
+                        await client.get(url)
+                    except aiohttp.ClientError as exc:
+                        errors.append(type(exc))
+        finally:
+            await server.close()
+        return errors
+
+    errors = asyncio.run(_run())
+
+    # Each retried attempt counts, so one call's three 503s open the circuit.
+    assert errors == [aiohttp.ClientResponseError, CircuitOpenError]
+    assert len(attempts) == 3
+
+
+def test_open_circuit_stops_remaining_retries() -> None:
+    attempts = []
+
+    async def handler(request: web.Request) -> web.Response:
+        attempts.append(request.path)
+        return web.Response(status=503)
+
+    async def _run():
+        app = web.Application()
+        app.router.add_get("/{tail:.*}", handler)
+        server = TestServer(app)
+        await server.start_server()
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+        try:
+            async with AsyncHttpClient(HttpSettings(), breaker=breaker) as client:
+                with pytest.raises(CircuitOpenError):
+                    await client.get(str(server.make_url("/cpi")))
+        finally:
+            await server.close()
+
+    asyncio.run(_run())
+
+    assert len(attempts) == 2
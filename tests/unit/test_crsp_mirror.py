@@ -0,0 +1,56 @@
+import pandas as pd
+
+from assistant.fetchers.crsp_mirror import CrspMirror
+from assistant.fetchers.wrds_pool import WrdsConnectionPool
+from factors.synthetic import synthetic_crsp_panel
+
+
+def test_mirror_only_downloads_missing_months(tmp_path, sqlite_wrds) -> None:
+    msf = synthetic_crsp_panel(n_permnos=6, n_months=60, start="2015-01-31", seed=3)
+    wrds = sqlite_wrds(msf)
+    permnos = sorted(msf["permno"].unique())
+    mirror = CrspMirror(tmp_path, pool=WrdsConnectionPool(lambda: wrds))
+
+    first = mirror.fetch(permnos[:4], "2016-01-01", "2017-12-31")
+    assert len(wrds.queries) == 1
+
+    # Same request again is served entirely from disk.
+    again = CrspMirror(tmp_path, pool=WrdsConnectionPool(lambda: wrds)).fetch(
+        permnos[:4], "2016-01-01", "2017-12-31"
+    )
+    assert len(wrds.queries) == 1
+    pd.testing.assert_frame_equal(first, again)
+
+    # Extending the range and adding PERMNOs only asks for the gaps.
+    wider = mirror.fetch(permnos, "2015-06-01", "2018-06-30")
+    gaps = [params[1:] for _, params in wrds.queries[1:]]
+    assert ("2015-06-01", "2015-12-31") in gaps
+    assert ("2018-01-01", "2018-06-30") in gaps
+    assert ("2015-06-01", "2018-06-30") in gaps  # the two new PERMNOs
+
+    expected = msf[
+        msf["permno"].isin(permnos) & msf["date"].between("2015-06-01", "2018-06-30")
+    ].sort_values(["permno", "date"], ignore_index=True)
+    pd.testing.assert_frame_equal(wider, expected[["permno", "date", "ret"]], check_dtype=False)
+
+
+def test_mirror_records_empty_settled_months_as_covered(tmp_path, sqlite_wrds) -> None:
+    msf = synthetic_crsp_panel(n_permnos=3, n_months=48, start="2015-01-31", seed=4)
+    delisted, live = sorted(msf["permno"].unique())[:2]
+    msf = msf[(msf["permno"] != delisted) | (msf["date"] < "2016-01-01")]
+    wrds = sqlite_wrds(msf)
+    mirror = CrspMirror(tmp_path, pool=WrdsConnectionPool(lambda: wrds))
+
+    mirror.fetch([delisted], "2017-01-01", "2017-12-31")
+    mirror.fetch([delisted, live], "2018-06-01", "2020-12-31")
+    queried = len(wrds.queries)
+
+    # Empty months up to the table's newest month are not asked for again...
+    assert mirror.fetch([delisted], "2017-01-01", "2017-12-31").empty
+    mirror.fetch([delisted, live], "2018-06-01", "2018-12-31")
+    assert len(wrds.queries) == queried
+    # ...but months beyond it are, as they may still be published.
+    assert mirror.coverage(live)[-1][1] == "2018-12-31"
+    mirror.fetch([live], "2019-01-01", "2020-12-31")
+    assert len(wrds.queries) > queried
+    assert mirror.coverage(live)[-1][1] == "2018-12-31"
@@ -0,0 +1,107 @@
+import multiprocessing
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from assistant.fetchers.daily_store import DailyReturnStore, DailyStoreWriter
+from assistant.fetchers.wrds_crsp import fetch_crsp_daily_data
+from assistant.fetchers.wrds_pool import WrdsConnectionPool
+
+
+def _daily_frame(n_permnos: int = 7, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    days = pd.bdate_range("2020-01-01", "2020-06-30")
+    frame = pd.DataFrame(
+        {
+            "permno": np.repeat(10_000 + 7 * np.arange(n_permnos), len(days)),
+            "date": np.tile(days, n_permnos),
+            "ret": rng.normal(0, 0.02, n_permnos * len(days)),
+        }
+    )
+    frame.loc[frame.index[::50], "ret"] = np.nan
+    return frame.sample(frac=1.0, random_state=seed, ignore_index=True)
+
+
+def _sum_returns(directory: str) -> float:
+    return float(np.nansum(DailyReturnStore(directory).returns, dtype=np.float64))
+
+
+def test_daily_fetch_writes_memory_mapped_store(tmp_path, sqlite_wrds) -> None:
+    dsf = _daily_frame()
+    wrds = sqlite_wrds(dsf, table="dsf")
+    permnos = sorted(dsf["permno"].unique())
+
+    store = fetch_crsp_daily_data(
+        permnos,
+        tmp_path / "dsf",
+        "2020-02-01",
+        "2020-05-31",
+        batch_size=3,
+        dtype=np.float64,
+        pool=WrdsConnectionPool(lambda: wrds),
+    )
+
+    assert len(wrds.queries) == 3
+    assert all("crsp.dsf" in sql for sql, _ in wrds.queries)
+    assert isinstance(store.returns, np.memmap) and store.codes.dtype == np.int32
+
+    expected = dsf[dsf["date"].between("2020-02-01", "2020-05-31")].dropna(subset=["ret"])
+    expected = expected.sort_values(["permno", "date"], ignore_index=True)
+    pd.testing.assert_frame_equal(store.to_frame(), expected[["date", "permno", "ret"]])
+
+    days, returns = store.history(permnos[2])
+    assert days.dtype == np.int32 and len(returns) == (expected["permno"] == permnos[2]).sum()
+
+    # Another process maps the same files instead of receiving a copy.
+    with multiprocessing.get_context("spawn").Pool(1) as pool:
+        total = pool.apply(_sum_returns, (str(tmp_path / "dsf"),))
+    assert total == pytest.approx(expected["ret"].sum())
+
+
+def test_daily_fetch_failure_removes_partial_store(tmp_path) -> None:
+    class Broken:
+        def raw_sql(self, *_args, **_kwargs):
+            raise RuntimeError("canceling statement due to statement timeout")
+
+        def close(self):
+            pass
+
+    previous = DailyStoreWriter(tmp_path / "dsf", [1])
+    previous.append(pd.DataFrame({"permno": [1], "date": ["2020-01-02"], "ret": [0.01]}))
+    previous.close()
+
+    store = fetch_crsp_daily_data([1, 2], tmp_path / "dsf", pool=WrdsConnectionPool(Broken))
+
+    assert store is None
+    assert [p.name for p in tmp_path.iterdir()] == ["dsf"]
+    assert DailyReturnStore(tmp_path / "dsf").returns.tolist() == pytest.approx([0.01])
+
+
+def test_writer_replaces_store_only_on_close(tmp_path) -> None:
+    first = DailyStoreWriter(tmp_path / "dsf", [1])
+    first.append(pd.DataFrame({"permno": [1], "date": ["2020-01-02"], "ret": [0.01]}))
+    old = first.close()
+
+    second = DailyStoreWriter(tmp_path / "dsf", [1, 2])
+    second.append(pd.DataFrame({"permno": [2], "date": ["2020-01-03"], "ret": [0.02]}))
+    assert len(DailyReturnStore(tmp_path / "dsf")) == 1
+    new = second.close()
+
+    assert new.permno_ids.tolist() == [1, 2] and len(new) == 1
+    assert old.returns.tolist() == pytest.approx([0.01])  # open maps survive the swap
+    assert [p.name for p in tmp_path.iterdir()] == ["dsf"]
+
+    (tmp_path / "other").mkdir()
+    (tmp_path / "other" / "notes.txt").write_text("keep me")
+    with pytest.raises(FileExistsError):
+        DailyStoreWriter(tmp_path / "other", [1])
+
+
+def test_writer_rejects_out_of_order_batches(tmp_path) -> None:
+    writer = DailyStoreWriter(tmp_path / "dsf", [1, 2])
+    writer.append(pd.DataFrame({"permno": [2], "date": ["2020-01-02"], "ret": [0.01]}))
+
+    with pytest.raises(ValueError, match="PERMNO order"):
+        writer.append(pd.DataFrame({"permno": [1], "date": ["2020-01-02"], "ret": [0.01]}))
+    writer.abort()
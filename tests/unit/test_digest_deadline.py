@@ -0,0 +1,91 @@
+import asyncio
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from assistant.composer.builder import render_digest
+from assistant.composer.run_digest import _gather_with_deadline
+from assistant.config import HttpSettings
+from assistant.utils.async_http import AsyncHttpClient
+from assistant.utils.circuit_breaker import CLOSED, CircuitBreaker
+from assistant.utils.dto import DigestContext, VixClose
+
+
+def test_gather_with_deadline_cancels_stragglers() -> None:
+    cancelled = []
+
+    async def quick():
+        return [1]
+
+    async def failing():
+        raise ValueError("bad payload")
+
+    async def slow():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append("slow")
+            raise
+
+    async def _run():
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        results, missed = await _gather_with_deadline(
+            {"CPI Schedule": quick(), "VIX": failing(), "arXiv": slow()}, deadline=0.05
+        )
+        return results, missed, loop.time() - started
+
+    results, missed, elapsed = asyncio.run(_run())
+
+    assert elapsed < 1
+    assert missed == ["arXiv"] and cancelled == ["slow"]
+    assert results["CPI Schedule"] == [1]
+    assert isinstance(results["VIX"], ValueError)
+    assert isinstance(results["arXiv"], asyncio.TimeoutError)
+
+
+def test_digest_notes_sources_that_missed_the_deadline() -> None:
+    ctx = DigestContext(
+        date="2025-10-16",
+        quotes=[],
+        vix=VixClose(date="2025-10-16", close=0.0),
+        cpi=[],
+        arxiv=[],
+        s2=[],
+        missed_sources=["arXiv", "Quote SPY"],
+    )
+
+    md = render_digest(context=ctx)
+
+    assert "_Not ready in time (shown as unavailable above): arXiv, Quote SPY._" in md
+
+
+def test_deadline_cancels_the_http_request_without_tripping_the_breaker() -> None:
+    async def handler(request: web.Request) -> web.Response:
+        await asyncio.sleep(2)
+        return web.json_response({})
+
+    async def _run():
+        app = web.Application()
+        app.router.add_get("/slow", handler)
+        server = TestServer(app)
+        await server.start_server()
+        url = str(server.make_url("/slow"))
+        breaker = CircuitBreaker(failure_threshold=1)
+        try:
+            client = AsyncHttpClient(HttpSettings(), breaker=breaker)
+            _, missed = await _gather_with_deadline(
+                {"Slow": client.get(url), "Also slow": client.get(url)}, deadline=0.2
+            )
+            await asyncio.sleep(0)
+            inflight = dict(client._inflight)
+            await client.close()
+        finally:
+            await server.close()
+        return missed, inflight, breaker.state(url)
+
+    missed, inflight, state = asyncio.run(_run())
+
+    assert missed == ["Slow", "Also slow"]
+    assert inflight == {}  # the shared request died with its last waiter
+    assert state == CLOSED
@@ -0,0 +1,60 @@
+import os
+
+import pandas as pd
+import pytest
+
+from factors.cache import FactorCache
+from factors.momentum import calculate_12_1_momentum
+from factors.synthetic import synthetic_crsp_panel
+
+
+def test_factor_cache_hits_on_identical_inputs_and_misses_on_changes(tmp_path) -> None:
+    cache = FactorCache(tmp_path)
+    panel = synthetic_crsp_panel(n_permnos=20, n_months=36, seed=1)
+    params = {"factor": "momentum", "lookback": 12, "skip": 1}
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return calculate_12_1_momentum(panel)
+
+    first = cache.get_or_compute(panel, params, compute)
+    second = cache.get_or_compute(panel.copy(), params, compute)
+
+    assert len(calls) == 1
+    pd.testing.assert_frame_equal(first, second)
+    assert cache.key(panel, {**params, "skip": 0}) != cache.key(panel, params)
+    changed = panel.copy()
+    changed.loc[0, "ret"] += 0.01
+    assert cache.key(changed, params) != cache.key(panel, params)
+
+
+def test_factor_cache_reuses_precomputed_key(tmp_path, monkeypatch) -> None:
+    cache = FactorCache(tmp_path)
+    panel = synthetic_crsp_panel(n_permnos=5, n_months=24, seed=3)
+    params = {"factor": "momentum"}
+    key = cache.key(panel, params)
+    cache.put(key, calculate_12_1_momentum(panel))
+
+    def no_rehash(*_args, **_kwargs):
+        raise AssertionError("panel hashed again")
+
+    monkeypatch.setattr(cache, "key", no_rehash)
+    result = cache.get_or_compute(panel, params, lambda: pytest.fail("recomputed"), key=key)
+
+    assert not result.empty
+
+
+def test_factor_cache_evicts_least_recently_used(tmp_path) -> None:
+    frame = synthetic_crsp_panel(n_permnos=50, n_months=60, seed=2)
+    cache = FactorCache(tmp_path)
+    paths = [cache.put(key, frame) for key in ("a", "b", "c")]
+    for age, path in enumerate(reversed(paths)):
+        os.utime(path, (1_000 + age, 1_000 + age))  # "a" newest, "c" oldest
+    cache.get("c")  # refreshes "c"
+
+    cache.max_bytes = sum(p.stat().st_size for p in paths) - 1
+    removed = cache.evict()
+
+    assert removed == [paths[1]]
+    assert "a" in cache and "c" in cache and "b" not in cache
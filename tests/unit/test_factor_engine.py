@@ -0,0 +1,51 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from factors.engine import FACTOR_REGISTRY, compute_factors
+from factors.momentum import calculate_12_1_momentum
+from factors.synthetic import synthetic_crsp_panel
+
+
+def _reference(panel: pd.DataFrame, market: pd.Series) -> pd.DataFrame:
+    """Per-PERMNO loops over trailing windows ending at t-1."""
+    rows = []
+    for permno, group in panel.dropna(subset=["ret"]).sort_values("date").groupby("permno"):
+        ret = group["ret"].to_numpy()
+        mkt = market.reindex(group["date"]).to_numpy()
+        for i, date in enumerate(group["date"]):
+            vol = np.std(ret[i - 12 : i], ddof=1) if i >= 12 else np.nan
+            lo = max(0, i - 60)
+            beta = idio = np.nan
+            if i - lo >= 24:
+                x, y = mkt[lo:i], ret[lo:i]
+                beta, alpha = np.polyfit(x, y, 1)
+                idio = np.sqrt(np.sum((y - alpha - beta * x) ** 2) / (len(x) - 2))
+            rows.append((date, permno, vol, beta, idio))
+    return pd.DataFrame(rows, columns=["date", "permno", "volatility_12", "beta_60", "idio_vol_60"])
+
+
+def test_engine_matches_per_permno_reference() -> None:
+    panel = synthetic_crsp_panel(n_permnos=25, n_months=120, min_listing=30, seed=2)
+    market = panel.groupby("date")["ret"].mean() + 0.001
+
+    result = compute_factors(panel, market=market)
+
+    assert list(result.columns) == ["date", "permno", *FACTOR_REGISTRY]
+    momentum = calculate_12_1_momentum(panel)
+    np.testing.assert_allclose(result["momentum_12_1"], momentum["momentum"], rtol=1e-12)
+    reversal = calculate_12_1_momentum(panel, lookback=1, skip=0)
+    np.testing.assert_allclose(result["reversal_1_0"], reversal["momentum"], rtol=1e-12)
+
+    expected = _reference(panel, market)
+    merged = result.merge(expected, on=["date", "permno"], suffixes=("", "_ref"))
+    assert len(merged) == len(result)
+    for column in ["volatility_12", "beta_60", "idio_vol_60"]:
+        np.testing.assert_allclose(merged[column], merged[f"{column}_ref"], rtol=1e-8, atol=1e-12)
+
+
+def test_engine_rejects_unknown_factor() -> None:
+    panel = synthetic_crsp_panel(n_permnos=5, n_months=24, seed=1)
+
+    with pytest.raises(ValueError, match="Unknown factors"):
+        compute_factors(panel, factors=["momentum_12_1", "size"])
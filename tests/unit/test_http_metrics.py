@@ -0,0 +1,67 @@
+import asyncio
+import json
+
+import aiohttp
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from assistant.config import HttpSettings
+from assistant.utils.async_http import AsyncHttpClient, HttpCache
+from assistant.utils.http_metrics import Histogram
+
+
+def test_histogram_buckets_values_by_upper_bound() -> None:
+    histogram = Histogram((10, 100))
+    for value in (5, 10, 50, 500):
+        histogram.observe(value)
+
+    assert histogram.counts == [2, 1, 1]
+    assert histogram.to_dict()["max"] == 500
+
+
+def test_client_records_per_endpoint_metrics_and_dumps_json(tmp_path) -> None:
+    async def observations(request: web.Request) -> web.Response:
+        if request.headers.get("If-None-Match") == '"v1"':
+            return web.Response(status=304)
+        return web.json_response({"observations": list(range(100))}, headers={"ETag": '"v1"'})
+
+    async def unavailable(request: web.Request) -> web.Response:
+        return web.Response(status=503)
+
+    metrics_path = tmp_path / "metrics.json"
+
+    async def _run():
+        app = web.Application()
+        app.router.add_get("/fred", observations)
+        app.router.add_get("/bls", unavailable)
+        server = TestServer(app)
+        await server.start_server()
+        try:
+            async with AsyncHttpClient(
+                HttpSettings(metrics_path=str(metrics_path)), cache=HttpCache(tmp_path / "cache")
+            ) as client:
+                for _ in range(2):
+                    await client.get(str(server.make_url("/fred")), params={"api_key": "secret"})
+                try:
+                    await client.get(str(server.make_url("/bls")))
+                except aiohttp.ClientResponseError:
+                    pass
+        finally:
+            await server.close()
+
+    asyncio.run(_run())
+
+    report = json.loads(metrics_path.read_text())
+    fred = report["endpoints"]["127.0.0.1/fred"]
+    assert fred["requests"] == 2 and fred["retries"] == 0
+    assert fred["statuses"] == {"200": 1, "304": 1}
+    assert fred["cache"] == {"hit": 0, "revalidated": 1, "miss": 1}
+    assert fred["bytes"] > 100
+    assert fred["timings_ms"]["connect"]["count"] == 1  # second request reused the connection
+    assert fred["timings_ms"]["ttfb"]["count"] == 2
+    assert fred["timings_ms"]["total"]["count"] == 2
+
+    bls = report["endpoints"]["127.0.0.1/bls"]
+    assert bls["requests"] == 1 and bls["retries"] == 2
+    assert bls["statuses"] == {"503": 1}
+    assert "secret" not in metrics_path.read_text()
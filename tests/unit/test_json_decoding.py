@@ -0,0 +1,117 @@
+import asyncio
+import sys
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+import assistant.fetchers.fred_vix as fred_vix
+import assistant.fetchers.semantic_scholar as s2
+from assistant.config import HttpSettings, settings
+from assistant.utils.async_http import (
+    AsyncHttpClient,
+    decode_json_as,
+    select_json_backend,
+)
+from assistant.utils.dto import FredObservations, PaperItem, S2SearchPage, VixClose
+
+
+def test_backend_selection_falls_back_to_stdlib(monkeypatch) -> None:
+    monkeypatch.setitem(sys.modules, "orjson", None)
+    monkeypatch.setitem(sys.modules, "msgspec", None)
+
+    name, loads = select_json_backend()
+
+    assert name == "json"
+    assert loads(b'{"a": [1, 2.5]}') == {"a": [1, 2.5]}
+
+
+def test_typed_decode_into_schemas() -> None:
+    fred = decode_json_as(
+        b'{"realtime_start": "2025-10-15", "observations": '
+        b'[{"date": "2025-10-14", "value": "20.81", "realtime_end": "x"}]}',
+        FredObservations,
+    )
+    assert fred.observations[-1].date == "2025-10-14"
+    assert fred.observations[-1].value == "20.81"
+
+    page = decode_json_as(
+        b'{"total": 2, "data": [{"title": "Meta", "year": "n/a", "url": null, '
+        b'"authors": [{"name": "C"}, {"name": null}]}, {"title": "Other", "year": 2016}]}',
+        S2SearchPage,
+    )
+    first, second = page.data
+    assert first.year == "n/a" and second.year == 2016 and second.authors is None
+    assert [a.name for a in first.authors] == ["C", None]
+
+    with pytest.raises(ValueError):
+        decode_json_as(b'{"observations": [{"date": 20251014}]}', FredObservations)
+
+
+@pytest.mark.parametrize("typed", [True, False])
+def test_semantic_scholar_async_decodes_into_paper_items(monkeypatch, typed) -> None:
+    async def handler(request: web.Request) -> web.Response:
+        return web.json_response(
+            {
+                "total": 1,
+                "data": [
+                    {"paperId": "bad", "title": "Broken", "year": "n/a", "authors": None},
+                    {"paperId": "null-authors", "title": "Solo", "authors": None},
+                    {
+                        "paperId": "abc",
+                        "title": "Momentum Crashes",
+                        "url": "http://s2/abc",
+                        "year": 2016,
+                        "authors": [{"authorId": "1", "name": "Kent Daniel"}],
+                    },
+                ],
+            }
+        )
+
+    async def _run():
+        app = web.Application()
+        app.router.add_get("/search", handler)
+        server = TestServer(app)
+        await server.start_server()
+        monkeypatch.setattr(s2, "SEMANTIC_SCHOLAR_SEARCH", str(server.make_url("/search")))
+        monkeypatch.setattr(s2, "TYPED_DECODING", typed)
+        try:
+            async with AsyncHttpClient(HttpSettings()) as client:
+                return await s2.search_papers_async(client, "momentum")
+        finally:
+            await server.close()
+
+    items = asyncio.run(_run())
+
+    # The odd year is dropped on its own; the rest of the page survives.
+    assert items == [
+        PaperItem(title="Broken", authors=[], year=None, url=""),
+        PaperItem(title="Solo", authors=[], year=None, url=""),
+        PaperItem(
+            title="Momentum Crashes", authors=["Kent Daniel"], year=2016, url="http://s2/abc"
+        ),
+    ]
+
+
+@pytest.mark.parametrize("typed", [True, False])
+def test_fred_vix_reads_the_last_observation(monkeypatch, typed) -> None:
+    async def handler(request: web.Request) -> web.Response:
+        observations = [{"date": f"2025-10-{day:02d}", "value": "."} for day in range(1, 14)]
+        observations.append({"date": "2025-10-14", "value": "20.81", "realtime_end": "x"})
+        return web.json_response({"count": 14, "observations": observations})
+
+    async def _run():
+        app = web.Application()
+        app.router.add_get("/fred", handler)
+        server = TestServer(app)
+        await server.start_server()
+        monkeypatch.setattr(settings, "FRED_API_KEY", "key")
+        monkeypatch.setattr(settings.api_endpoints, "fred", str(server.make_url("/fred")))
+        monkeypatch.setattr(fred_vix, "TYPED_DECODING", typed)
+        try:
+            async with AsyncHttpClient(HttpSettings()) as client:
+                return await fred_vix.latest_vix_close(client)
+        finally:
+            await server.close()
+
+    assert asyncio.run(_run()) == VixClose(date="2025-10-14", close=20.81)
@@ -0,0 +1,157 @@
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from factors.momentum import (
+    DEFAULT_HORIZONS,
+    IncrementalMomentum,
+    calculate_12_1_momentum,
+    calculate_momentum_grid,
+)
+from factors.streaming import stream_momentum_parquet
+
+
+def _reference_momentum(crsp_df, lookback=12, skip=1):
+    """The original per-PERMNO ``groupby.apply`` implementation, kept as a parity oracle."""
+    df = crsp_df[["date", "permno", "ret"]].copy()
+    df["date"] = pd.to_datetime(df["date"], errors="coerce")
+    df["ret"] = pd.to_numeric(df["ret"], errors="coerce")
+    df = df.dropna(subset=["date", "ret"])
+    df = df.sort_values(by=["permno", "date"])
+
+    def _group_momentum(group):
+        group["log_ret"] = np.log1p(group["ret"])
+        group["rolling_sum"] = (
+            group["log_ret"].shift(skip + 1).rolling(window=lookback, min_periods=lookback).sum()
+        )
+        group["momentum"] = np.expm1(group["rolling_sum"])
+        return group[["date", "permno", "momentum"]]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        result = df.groupby("permno", group_keys=False).apply(_group_momentum)
+    result["permno"] = result["permno"].astype(int)
+    return result
+
+
+def _synthetic_panel(seed: int = 7, n_permnos: int = 40, n_months: int = 60) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    months = pd.date_range("2015-01-31", periods=n_months, freq="ME")
+    frames = []
+    for permno in rng.choice(np.arange(10000, 90000), size=n_permnos, replace=False):
+        start = rng.integers(0, n_months // 2)
+        length = rng.integers(1, n_months - start + 1)
+        dates = months[start : start + length]
+        keep = rng.random(len(dates)) > 0.05  # listing gaps
+        frames.append(
+            pd.DataFrame(
+                {
+                    "date": dates[keep].strftime("%Y-%m-%d"),
+                    "permno": permno,
+                    "ret": rng.normal(0.01, 0.08, keep.sum()),
+                }
+            )
+        )
+    panel = pd.concat(frames, ignore_index=True)
+    panel.loc[panel.sample(frac=0.03, random_state=seed).index, "ret"] = np.nan
+    panel.loc[panel.sample(frac=0.005, random_state=seed + 1).index, "ret"] = -1.0
+    return panel.sample(frac=1.0, random_state=seed)
+
+
+@pytest.mark.filterwarnings("ignore::DeprecationWarning")
+@pytest.mark.parametrize("lookback,skip", [(12, 1), (6, 1), (1, 0), (36, 13)])
+def test_vectorized_momentum_matches_groupby_apply(lookback, skip) -> None:
+    panel = _synthetic_panel()
+
+    expected = _reference_momentum(panel, lookback=lookback, skip=skip)
+    result = calculate_12_1_momentum(panel, lookback=lookback, skip=skip)
+
+    pd.testing.assert_frame_equal(result, expected, rtol=1e-12)
+
+
+def test_momentum_grid_matches_single_horizon_runs() -> None:
+    panel = _synthetic_panel(seed=3)
+
+    grid = calculate_momentum_grid(panel)
+
+    assert list(grid.columns) == ["date", "permno"] + [
+        f"momentum_{lookback}_{skip}" for lookback, skip in DEFAULT_HORIZONS
+    ]
+    for lookback, skip in DEFAULT_HORIZONS:
+        single = calculate_12_1_momentum(panel, lookback=lookback, skip=skip)
+        pd.testing.assert_series_equal(
+            grid[f"momentum_{lookback}_{skip}"], single["momentum"], check_names=False
+        )
+
+
+def test_stream_momentum_parquet_matches_in_memory(tmp_path) -> None:
+    panel = _synthetic_panel(seed=5)
+    panel["date"] = pd.to_datetime(panel["date"])
+    pq.write_to_dataset(
+        pa.Table.from_pandas(panel, preserve_index=False),
+        tmp_path / "crsp",
+        partition_cols=["permno"],
+    )
+
+    written = stream_momentum_parquet(tmp_path / "crsp", tmp_path / "mom.parquet", chunk_rows=200)
+
+    streamed = pd.read_parquet(tmp_path / "mom.parquet")
+    expected = calculate_12_1_momentum(panel)
+    assert written == len(expected)
+    pd.testing.assert_frame_equal(
+        streamed.sort_values(["permno", "date"]).reset_index(drop=True),
+        expected.reset_index(drop=True),
+        check_dtype=False,
+    )
+
+
+def test_momentum_validates_inputs() -> None:
+    with pytest.raises(ValueError):
+        calculate_12_1_momentum(pd.DataFrame({"date": [], "permno": []}))
+    with pytest.raises(ValueError):
+        calculate_12_1_momentum(pd.DataFrame({"date": [], "permno": [], "ret": []}), lookback=0)
+
+
+def test_incremental_momentum_matches_batch_and_round_trips(tmp_path) -> None:
+    panel = _synthetic_panel(seed=11)
+    panel["date"] = pd.to_datetime(panel["date"])
+    months = np.sort(panel["date"].unique())
+    history = panel[panel["date"] < months[30]]
+
+    state = IncrementalMomentum.from_history(history)
+    updates = []
+    for i, month in enumerate(months[30:]):
+        if i == 10:
+            state = IncrementalMomentum.load(state.save(tmp_path / "state.npz"))
+        updates.append(state.update(panel[panel["date"] == month]))
+    incremental = pd.concat(updates, ignore_index=True)
+
+    batch = calculate_12_1_momentum(panel)
+    batch = batch[batch["date"] >= months[30]]
+    merged = batch.merge(incremental, on=["date", "permno"], suffixes=("_batch", "_inc"))
+
+    assert len(merged) == len(batch) == len(incremental)
+    np.testing.assert_allclose(merged["momentum_inc"], merged["momentum_batch"], rtol=1e-12)
+
+    with pytest.raises(ValueError):
+        state.update(panel[panel["date"] == months[-1]])
+
+
+@pytest.mark.parametrize("n_workers", [1, 3])
+def test_parallel_momentum_is_bit_identical(n_workers) -> None:
+    from factors.parallel import parallel_momentum
+
+    panel = _synthetic_panel(seed=9)
+
+    expected = calculate_12_1_momentum(panel)
+    result = parallel_momentum(panel, n_workers=n_workers)
+
+    pd.testing.assert_frame_equal(result, expected, check_exact=True)
+
+
+def test_parallel_momentum_rejects_zero_workers() -> None:
+    from factors.parallel import parallel_momentum
+
+    with pytest.raises(ValueError, match="n_workers"):
+        parallel_momentum(_synthetic_panel(seed=9), n_workers=0)
@@ -0,0 +1,54 @@
+import pandas as pd
+import pytest
+
+from assistant.fetchers.wrds_pool import WrdsConnectionPool
+from factors.momentum import calculate_12_1_momentum
+from factors.pushdown import fetch_momentum_pushdown, momentum_query
+from factors.synthetic import synthetic_crsp_panel
+
+
+@pytest.mark.parametrize(("lookback", "skip"), [(12, 1), (6, 1), (1, 0)])
+def test_pushdown_matches_in_memory_momentum(sqlite_wrds, lookback, skip) -> None:
+    msf = synthetic_crsp_panel(n_permnos=30, n_months=60, start="2015-01-31", seed=14)
+    msf.loc[msf.index[::97], "ret"] = -1.0
+    wrds = sqlite_wrds(msf)
+    permnos = sorted(msf["permno"].unique())[:20]
+
+    result = fetch_momentum_pushdown(
+        permnos,
+        "2016-06-01",
+        "2019-06-30",
+        lookback=lookback,
+        skip=skip,
+        pool=WrdsConnectionPool(lambda: wrds),
+    )
+
+    expected = calculate_12_1_momentum(
+        msf[msf["permno"].isin(permnos)], lookback=lookback, skip=skip
+    )
+    expected = expected[expected["date"].between("2016-06-01", "2019-06-30")]
+    expected = expected.reset_index(drop=True)
+    pd.testing.assert_frame_equal(
+        result[["date", "permno", "momentum"]], expected, check_exact=False, rtol=1e-9
+    )
+    assert result["momentum"].notna().any() and result["momentum"].isna().any()
+
+
+def test_momentum_query_uses_skip_offset_window() -> None:
+    sql, params = momentum_query(12, 1, permnos=[1, 2], start_date="2020-01-01")
+
+    assert "ROWS BETWEEN 13 PRECEDING AND 2 PRECEDING" in sql
+    assert params == ((1, 2), "2020-01-01")
+    with pytest.raises(ValueError):
+        momentum_query(0, 1)
+
+
+def test_pushdown_returns_empty_frame_on_failure() -> None:
+    class Broken:
+        def raw_sql(self, *_args, **_kwargs):
+            raise RuntimeError("permission denied for schema crsp")
+
+        def close(self):
+            pass
+
+    assert fetch_momentum_pushdown([1], pool=WrdsConnectionPool(Broken)).empty
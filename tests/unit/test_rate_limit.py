@@ -0,0 +1,121 @@
+import asyncio
+import time
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from assistant.config import HttpSettings, RateLimitSettings
+from assistant.utils.async_http import AsyncHttpClient
+from assistant.utils.rate_limit import RateLimiter, TokenBucket, parse_retry_after
+
+
+class FakeTime:
+    """Clock plus sleep that advances it, so waits are exact and instant."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        await asyncio.sleep(0)  # let queued callers run, as a real sleep would
+        self.now += seconds
+
+
+def test_token_bucket_queues_requests_beyond_burst() -> None:
+    fake = FakeTime()
+    bucket = TokenBucket(calls=5, period=60, clock=fake, sleep=fake.sleep)
+
+    async def _run():
+        return await asyncio.gather(*(bucket.acquire() for _ in range(7)))
+
+    waits = asyncio.run(_run())
+
+    # Five go out at once, then one every 12 seconds.
+    assert waits[:5] == [0.0] * 5
+    assert waits[5:] == [12.0, 24.0]
+
+
+def test_penalty_holds_back_the_host_and_is_reported() -> None:
+    fake = FakeTime()
+    limiter = RateLimiter(
+        {"api.semanticscholar.org": RateLimitSettings(calls=10, period=1)},
+        clock=fake,
+        sleep=fake.sleep,
+    )
+    url = "https://api.semanticscholar.org/graph/v1/paper/search"
+
+    async def _run():
+        first = await limiter.acquire(url)
+        limiter.penalize(url, retry_after=30)
+        second = await limiter.acquire(url)
+        other = await limiter.acquire("https://export.arxiv.org/api/query")
+        return first, second, other
+
+    assert asyncio.run(_run()) == (0.0, 30.0, 0.0)
+    metrics = limiter.metrics()["api.semanticscholar.org"]
+    assert metrics["requests"] == 2 and metrics["throttled"] == 1
+    assert metrics["max_wait_s"] == 30.0
+    assert parse_retry_after("7") == 7.0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after("soon") is None
+
+
+def test_client_backs_off_after_429_retry_after() -> None:
+    calls = []
+
+    async def handler(request: web.Request) -> web.Response:
+        calls.append(time.monotonic())
+        if len(calls) == 1:
+            return web.Response(status=429, headers={"Retry-After": "0.2"})
+        return web.json_response({"data": []})
+
+    async def _run():
+        app = web.Application()
+        app.router.add_get("/search", handler)
+        server = TestServer(app)
+        await server.start_server()
+        limits = {"127.0.0.1": RateLimitSettings(calls=100, period=1)}
+        try:
+            async with AsyncHttpClient(HttpSettings(rate_limits=limits)) as client:
+                url = str(server.make_url("/search"))
+                first = await client._fetch(url)
+                second = await client.get(url)
+                return first.status, second.status, client.rate_limiter.metrics()
+        finally:
+            await server.close()
+
+    first, second, metrics = asyncio.run(_run())
+
+    assert (first, second) == (429, 200)
+    assert calls[1] - calls[0] >= 0.19
+    assert metrics["127.0.0.1"]["throttled"] == 1
+
+
+def test_every_retry_attempt_takes_a_token() -> None:
+    calls = []
+
+    async def handler(request: web.Request) -> web.Response:
+        calls.append(1)
+        if len(calls) < 3:
+            return web.Response(status=503)
+        return web.json_response({"data": []})
+
+    async def _run():
+        app = web.Application()
+        app.router.add_get("/search", handler)
+        server = TestServer(app)
+        await server.start_server()
+        limits = {"127.0.0.1": RateLimitSettings(calls=100, period=1)}
+        try:
+            async with AsyncHttpClient(HttpSettings(rate_limits=limits)) as client:
+                response = await client.get(str(server.make_url("/search")))
+                return response.status, client.rate_limiter.metrics()
+        finally:
+            await server.close()
+
+    status, metrics = asyncio.run(_run())
+
+    assert status == 200 and len(calls) == 3
+    assert metrics["127.0.0.1"]["requests"] == 3
@@ -0,0 +1,65 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from factors.momentum import calculate_12_1_momentum
+from factors.panel import ReturnPanel
+
+
+def _crsp_frame() -> pd.DataFrame:
+    rng = np.random.default_rng(21)
+    months = pd.date_range("2000-01-31", periods=48, freq="ME")
+    frames = [
+        pd.DataFrame(
+            {
+                "permno": float(permno),  # WRDS raw_sql returns PERMNOs as floats
+                "date": months[offset:].strftime("%Y-%m-%d"),
+                "ret": rng.normal(0.01, 0.08, len(months) - offset),
+            }
+        )
+        for permno, offset in [(14593, 0), (10107, 5), (93436, 30)]
+    ]
+    frame = pd.concat(frames, ignore_index=True).sample(frac=1.0, random_state=1)
+    frame["ret"] = frame["ret"].astype(object)
+    frame.loc[frame.index[:3], "ret"] = "C"  # CRSP missing-return codes
+    return frame
+
+
+def test_panel_layout_and_o1_history_slices() -> None:
+    frame = _crsp_frame()
+
+    panel = ReturnPanel.from_frame(frame)
+
+    assert panel.codes.dtype == np.int32
+    assert panel.months.dtype == np.int16
+    assert panel.returns.dtype == np.float32
+    assert len(panel) == frame["ret"].apply(lambda r: r != "C").sum()
+    assert list(panel.permno_ids) == [10107, 14593, 93436]
+
+    months, returns = panel.history(93436)
+    assert np.all(np.diff(months) > 0)
+    assert np.shares_memory(returns, panel.returns)
+    with pytest.raises(KeyError):
+        panel.rows(1)
+
+
+def test_momentum_accepts_panel() -> None:
+    frame = _crsp_frame()
+    expected = calculate_12_1_momentum(frame)
+
+    for dtype, atol in [(np.float64, 1e-12), (np.float32, 1e-6)]:
+        result = calculate_12_1_momentum(ReturnPanel.from_frame(frame, dtype=dtype))
+
+        assert list(result.columns) == ["date", "permno", "momentum"]
+        np.testing.assert_array_equal(result["permno"], expected["permno"])
+        assert (result["date"].dt.to_period("M") == expected["date"].dt.to_period("M").values).all()
+        np.testing.assert_allclose(result["momentum"], expected["momentum"], atol=atol)
+
+
+def test_panel_is_over_three_times_smaller_than_frame() -> None:
+    frame = _crsp_frame()
+    frame = frame[frame["ret"] != "C"].astype({"ret": float})
+
+    panel = ReturnPanel.from_frame(frame)
+
+    assert frame.memory_usage(deep=True).sum() > 3 * panel.nbytes
@@ -0,0 +1,23 @@
+import numpy as np
+import pandas as pd
+
+from factors.momentum import calculate_12_1_momentum
+from factors.synthetic import synthetic_crsp_panel
+
+
+def test_synthetic_panel_is_seeded_and_crsp_shaped() -> None:
+    panel = synthetic_crsp_panel(n_permnos=200, n_months=120, gap_rate=0.1, nan_rate=0.05, seed=4)
+
+    pd.testing.assert_frame_equal(
+        panel,
+        synthetic_crsp_panel(n_permnos=200, n_months=120, gap_rate=0.1, nan_rate=0.05, seed=4),
+    )
+    assert list(panel.columns) == ["date", "permno", "ret"]
+    assert panel["permno"].nunique() <= 200
+    assert not panel.duplicated(["permno", "date"]).any()
+    assert (panel["ret"].dropna() >= -1.0).all()
+    assert 0.02 < panel["ret"].isna().mean() < 0.08
+    assert panel["date"].min() == pd.Timestamp("1926-01-31")
+
+    momentum = calculate_12_1_momentum(panel)
+    assert np.isfinite(momentum["momentum"]).any()
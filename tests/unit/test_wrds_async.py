@@ -0,0 +1,72 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from assistant.fetchers.wrds_async import momentum_signal_async, run_wrds_call
+from assistant.fetchers.wrds_pool import WrdsConnectionPool
+from factors.momentum import calculate_12_1_momentum
+from factors.synthetic import synthetic_crsp_panel
+
+
+def test_wrds_call_overlaps_with_event_loop_work() -> None:
+    release = threading.Event()
+
+    def blocking_query() -> str:
+        release.wait(timeout=5)
+        return "rows"
+
+    async def other_fetcher() -> str:
+        await asyncio.sleep(0.01)
+        release.set()
+        return "quotes"
+
+    async def _run():
+        return await asyncio.gather(
+            run_wrds_call(blocking_query, lambda: "fallback", "CRSP"), other_fetcher()
+        )
+
+    # Would deadlock (and time out) if the query blocked the loop.
+    assert asyncio.run(_run()) == ["rows", "quotes"]
+
+
+def test_wrds_call_returns_fallback_on_timeout_and_error() -> None:
+    async def _run():
+        started = time.perf_counter()
+        slow = await run_wrds_call(lambda: time.sleep(0.5), lambda: "fallback", "CRSP", 0.05)
+        elapsed = time.perf_counter() - started
+        failed = await run_wrds_call(lambda: 1 / 0, lambda: "fallback", "CRSP")
+        return slow, elapsed, failed
+
+    slow, elapsed, failed = asyncio.run(_run())
+    assert slow == "fallback" and elapsed < 0.4
+    assert failed == "fallback"
+
+
+def test_wrds_call_propagates_cancellation() -> None:
+    async def _run():
+        task = asyncio.create_task(
+            run_wrds_call(lambda: time.sleep(0.2), lambda: "fallback", "CRSP")
+        )
+        await asyncio.sleep(0.01)
+        task.cancel()
+        await task
+
+    with pytest.raises(asyncio.CancelledError):
+        asyncio.run(_run())
+
+
+def test_momentum_signal_async_matches_sync_computation(sqlite_wrds) -> None:
+    msf = synthetic_crsp_panel(n_permnos=8, n_months=30, start="2018-01-31", seed=16)
+    wrds = sqlite_wrds(msf)
+    permnos = sorted(msf["permno"].unique())
+
+    result = asyncio.run(
+        momentum_signal_async(permnos, pool=WrdsConnectionPool(lambda: wrds), timeout=10)
+    )
+
+    expected = calculate_12_1_momentum(msf)
+    assert result["momentum"].to_numpy() == pytest.approx(
+        expected["momentum"].to_numpy(), nan_ok=True
+    )
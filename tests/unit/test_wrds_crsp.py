@@ -0,0 +1,45 @@
+import pandas as pd
+
+from assistant.fetchers.wrds_crsp import fetch_crsp_data_batched
+from assistant.fetchers.wrds_pool import WrdsConnectionPool
+from factors.synthetic import synthetic_crsp_panel
+
+
+def test_batched_fetch_matches_full_slice_with_bounded_connections(sqlite_wrds) -> None:
+    msf = synthetic_crsp_panel(n_permnos=45, n_months=36, start="2018-01-31", seed=6)
+    opened = []
+
+    def connect():
+        opened.append(sqlite_wrds(msf))
+        return opened[-1]
+
+    permnos = list(msf["permno"].unique())
+    pool = WrdsConnectionPool(connect, max_size=4)
+    result = fetch_crsp_data_batched(
+        permnos, "2018-06-01", "2020-06-30", batch_size=10, max_connections=2, pool=pool
+    )
+    pool.close()
+
+    assert 1 <= len(opened) <= 2
+    assert all(conn.closed for conn in opened)
+    assert sum(len(conn.queries) for conn in opened) == 5
+    assert max(len(params[0]) for conn in opened for _, params in conn.queries) == 10
+
+    expected = msf[msf["date"].between("2018-06-01", "2020-06-30")]
+    expected = expected.sort_values(["permno", "date"], ignore_index=True)[
+        ["permno", "date", "ret"]
+    ]
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_batched_fetch_returns_empty_frame_on_failure() -> None:
+    class Broken:
+        def raw_sql(self, *_args, **_kwargs):
+            raise RuntimeError("server went away")
+
+        def close(self):
+            pass
+
+    result = fetch_crsp_data_batched([1, 2, 3], batch_size=1, pool=WrdsConnectionPool(Broken))
+
+    assert result.empty
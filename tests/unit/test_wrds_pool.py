@@ -0,0 +1,127 @@
+import threading
+import time
+
+import pytest
+
+from assistant.fetchers.wrds_pool import WrdsConnectionPool
+
+
+class FakeConnection:
+    def __init__(self, healthy: bool = True) -> None:
+        self.healthy = healthy
+        self.queries = []
+        self.closed = False
+
+    def raw_sql(self, sql, params=None):
+        if not self.healthy:
+            raise ConnectionError("server closed the connection unexpectedly")
+        self.queries.append(sql)
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_pool_reuses_connections_and_creates_lazily() -> None:
+    pool = WrdsConnectionPool(FakeConnection, max_size=2)
+    assert pool.created == 0
+
+    with pool.connection() as first:
+        pass
+    with pool.connection() as second:
+        pass
+
+    assert first is second
+    assert pool.created == 1
+    assert pool.idle_count == 1
+
+
+def test_pool_bounds_concurrent_connections() -> None:
+    pool = WrdsConnectionPool(FakeConnection, max_size=2)
+    with pool.connection(), pool.connection():
+        with pytest.raises(TimeoutError):
+            with pool.connection(timeout=0.01):
+                pass
+    assert pool.created == 2
+
+    def borrow() -> None:
+        with pool.connection(timeout=1):
+            pass
+
+    threads = [threading.Thread(target=borrow) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert pool.created == 2
+
+
+def test_pool_health_checks_and_expires_idle_connections() -> None:
+    clock = Clock()
+    pool = WrdsConnectionPool(
+        FakeConnection, max_size=1, idle_timeout=300, health_check_after=30, clock=clock
+    )
+    with pool.connection() as conn:
+        pass
+
+    # Short idle: handed out again without a probe.
+    clock.now = 10
+    with pool.connection() as again:
+        assert again is conn and conn.queries == []
+
+    # Long idle: probed with SELECT 1, replaced when the probe fails.
+    conn.healthy = False
+    clock.now = 100
+    with pool.connection() as replacement:
+        pass
+    assert replacement is not conn and conn.closed
+
+    # Past the idle timeout: closed without a probe.
+    clock.now = 1000
+    assert pool.prune() == 1
+    assert replacement.closed and replacement.queries == []
+
+
+def test_pool_discards_connection_when_block_raises() -> None:
+    pool = WrdsConnectionPool(FakeConnection)
+    with pytest.raises(RuntimeError):
+        with pool.connection() as conn:
+            raise RuntimeError("query failed")
+
+    assert conn.closed
+    assert pool.idle_count == 0
+
+    pool.close()
+    with pytest.raises(RuntimeError, match="closed"):
+        with pool.connection():
+            pass
+
+
+def test_pool_closes_idle_connections_without_prune_calls() -> None:
+    clock = Clock()
+    pool = WrdsConnectionPool(FakeConnection, max_size=2, idle_timeout=300, clock=clock)
+    with pool.connection() as busy:
+        with pool.connection() as stale:
+            pass
+        # Returning another connection closes ones that sat idle past the timeout.
+        clock.now = 1000
+    assert stale.closed and not busy.closed
+    assert pool.idle_count == 1
+    pool.close()
+
+    # With no further use, the background timer closes them.
+    timed = WrdsConnectionPool(FakeConnection, idle_timeout=0.05)
+    with timed.connection() as conn:
+        pass
+    deadline = time.monotonic() + 2
+    while not conn.closed and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert conn.closed and timed.idle_count == 0
+    timed.close()